@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import csv
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Sequence
+from dataclasses import fields
+from operator import attrgetter
 from pathlib import Path
 
 from forex.application.broker.protocols import AppAuthServiceLike, TrendbarHistoryServiceLike
 from forex.application.broker.use_cases import BrokerUseCases
 from forex.config.data_governance import normalize_timeframe, write_metadata_for_csv
 from forex.config.paths import RAW_HISTORY_DIR
+from forex.domain.market_data import Trendbar
+
+_TRENDBAR_COLUMNS = [field.name for field in fields(Trendbar)]
+_trendbar_values = attrgetter(*_TRENDBAR_COLUMNS)
+_trendbar_timestamp = attrgetter("timestamp")
 
 
 class HistoryDownloadPipeline:
@@ -41,23 +48,52 @@ class HistoryDownloadPipeline:
         if self._history_service is None:
             self._history_service = self._use_cases.create_trendbar_history(self._app_auth_service)
 
-        def handle_history(rows: list[dict]) -> None:
+        history_service = self._history_service
+        sink = _RawHistoryCsvSink(self._raw_dir, symbol_id, timeframe, output_path)
+        failed = False
+
+        def handle_chunk(rows: list[Trendbar]) -> None:
+            nonlocal failed
+            if failed:
+                return
+            try:
+                sink.write(rows)
+            except Exception as exc:
+                # The write runs inside the service's reply handling, which would swallow it.
+                failed = True
+                sink.discard()
+                history_service.cancel()
+                if on_error:
+                    on_error(str(exc))
+
+        def handle_history(rows: list[Trendbar] | None) -> None:
+            if failed:
+                return
             try:
-                path = self._write_csv(rows, symbol_id, timeframe, output_path=output_path)
+                if rows is not None:
+                    sink.write(rows)
+                path = sink.finish()
             except Exception as exc:  # pragma: no cover - safety net for callback flow
+                sink.discard()
                 if on_error:
                     on_error(str(exc))
                 return
             if on_saved:
                 on_saved(path)
 
-        self._history_service.clear_log_history()
-        self._history_service.set_callbacks(
+        def handle_error(error: str) -> None:
+            sink.discard()
+            if on_error:
+                on_error(error)
+
+        history_service.clear_log_history()
+        history_service.set_callbacks(
             on_history_received=handle_history,
-            on_error=on_error,
+            on_error=handle_error,
             on_log=on_log,
+            on_history_chunk=handle_chunk,
         )
-        self._history_service.fetch(
+        history_service.fetch(
             account_id=account_id,
             symbol_id=symbol_id,
             count=count,
@@ -67,62 +103,91 @@ class HistoryDownloadPipeline:
         )
         return True
 
-    def _write_csv(
+
+class _RawHistoryCsvSink:
+    """Append streamed history chunks to a partial CSV and move it into place when complete."""
+
+    def __init__(
         self,
-        rows: Iterable[dict],
+        raw_dir: Path,
         symbol_id: int,
         timeframe: str,
-        *,
-        output_path: str | Path | None = None,
-    ) -> str:
-        rows_list = list(rows)
-        if not rows_list:
-            raise ValueError("No history data received")
-
-        start, end = self._infer_range(rows_list)
-        filename = f"{symbol_id}_{timeframe}_{start}-{end}.csv"
-        if output_path is None:
-            self._raw_dir.mkdir(parents=True, exist_ok=True)
-            path = self._raw_dir / filename
+        output_path: str | Path | None,
+    ) -> None:
+        self._symbol_id = symbol_id
+        self._timeframe = timeframe
+        out_path = Path(output_path) if output_path is not None else None
+        if out_path is not None and out_path.suffix.lower() == ".csv":
+            self._target_dir = out_path.parent
+            self._target_path: Path | None = out_path
         else:
-            out_path = Path(output_path)
-            if out_path.suffix.lower() == ".csv":
-                path = out_path
-                path.parent.mkdir(parents=True, exist_ok=True)
-            else:
-                out_path.mkdir(parents=True, exist_ok=True)
-                path = out_path / filename
-
-        fieldnames = list(rows_list[0].keys())
-        with path.open("w", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows_list)
+            self._target_dir = out_path if out_path is not None else raw_dir
+            self._target_path = None
+        self._partial_path: Path | None = None
+        self._handle = None
+        self._writer = None
+        self._row_count = 0
+        self._first_ts = ""
+        self._last_ts = ""
+
+    def write(self, rows: Sequence[Trendbar]) -> None:
+        if not rows:
+            return
+        if self._writer is None:
+            self._target_dir.mkdir(parents=True, exist_ok=True)
+            base_path = self._target_path or (
+                self._target_dir / f"{self._symbol_id}_{self._timeframe}.csv"
+            )
+            self._partial_path = base_path.with_suffix(".csv.part")
+            self._handle = self._partial_path.open("w", newline="")
+            self._writer = csv.writer(self._handle)
+            self._writer.writerow(_TRENDBAR_COLUMNS)
+        self._writer.writerows(map(_trendbar_values, rows))
+        self._row_count += len(rows)
+        # Chunks are not guaranteed to arrive in time order, so the file name uses the
+        # extremes seen so far rather than the first and last row written.
+        stamps = [stamp for stamp in map(_trendbar_timestamp, rows) if stamp]
+        if stamps:
+            chunk_first, chunk_last = min(stamps), max(stamps)
+            if not self._first_ts or chunk_first < self._first_ts:
+                self._first_ts = chunk_first
+            if chunk_last > self._last_ts:
+                self._last_ts = chunk_last
+
+    def finish(self) -> str:
+        if self._handle is None or self._partial_path is None:
+            raise ValueError("No history data received")
+        self._handle.close()
+        self._handle = None
+        start = self._format_ts(self._first_ts) if self._first_ts else "unknown"
+        end = self._format_ts(self._last_ts) if self._last_ts else "unknown"
+        path = self._target_path or (
+            self._target_dir / f"{self._symbol_id}_{self._timeframe}_{start}-{end}.csv"
+        )
+        self._partial_path.replace(path)
+        self._partial_path = None
 
         write_metadata_for_csv(
             path,
             artifact_type="raw_history_csv",
             details={
-                "symbol_id": int(symbol_id),
-                "timeframe": normalize_timeframe(timeframe),
-                "row_count": len(rows_list),
-                "columns": fieldnames,
+                "symbol_id": int(self._symbol_id),
+                "timeframe": normalize_timeframe(self._timeframe),
+                "row_count": self._row_count,
+                "columns": _TRENDBAR_COLUMNS,
                 "range_start": start,
                 "range_end": end,
             },
         )
-
         return str(path)
 
-    @staticmethod
-    def _infer_range(rows: Iterable[dict]) -> tuple[str, str]:
-        timestamps = [row.get("timestamp") for row in rows if row.get("timestamp")]
-        if not timestamps:
-            return ("unknown", "unknown")
-        return (
-            HistoryDownloadPipeline._format_ts(timestamps[0]),
-            HistoryDownloadPipeline._format_ts(timestamps[-1]),
-        )
+    def discard(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self._partial_path is not None:
+            self._partial_path.unlink(missing_ok=True)
+            self._partial_path = None
 
     @staticmethod
     def _format_ts(value: str) -> str:
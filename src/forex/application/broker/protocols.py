@@ -61,6 +61,9 @@ class OAuthLoginServiceLike(Protocol):
     def exchange_code(self, code: str):
         ...
 
+    def close(self) -> None:
+        ...
+
 
 class AccountListUseCaseLike(Protocol):
     in_progress: bool
@@ -156,7 +159,13 @@ class TrendbarServiceLike(Protocol):
 
 
 class TrendbarHistoryServiceLike(Protocol):
-    def set_callbacks(self, on_history_received=None, on_error=None, on_log=None) -> None:
+    def set_callbacks(
+        self,
+        on_history_received=None,
+        on_error=None,
+        on_log=None,
+        on_history_chunk=None,
+    ) -> None:
         ...
 
     def clear_log_history(self) -> None:
@@ -173,6 +182,9 @@ class TrendbarHistoryServiceLike(Protocol):
     ) -> None:
         ...
 
+    def cancel(self) -> None:
+        ...
+
 
 class OrderServiceLike(Protocol):
     in_progress: bool
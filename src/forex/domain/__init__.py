@@ -2,6 +2,7 @@
 
 from forex.domain.accounts import Account, AccountFundsSnapshot, AccountProfile
 from forex.domain.auth import Credentials, Tokens
+from forex.domain.market_data import LiveTrendbar, Trendbar
 from forex.domain.symbols import Symbol
 
 __all__ = [
@@ -9,6 +10,8 @@ __all__ = [
     "AccountFundsSnapshot",
     "AccountProfile",
     "Credentials",
+    "LiveTrendbar",
     "Symbol",
     "Tokens",
+    "Trendbar",
 ]
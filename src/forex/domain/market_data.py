@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Trendbar:
+    """Decoded OHLC bar; prices are in quote units, timestamps in UTC."""
+
+    utc_timestamp_minutes: int
+    timestamp: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+    period: int
+
+
+@dataclass(slots=True)
+class LiveTrendbar:
+    """Snapshot of the forming live bar; a new instance is published per update."""
+
+    symbol_id: int
+    period: str
+    timestamp: str
+    utc_timestamp_minutes: int
+    open: float
+    high: float
+    low: float
+    close: float
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Generic, TypeVar, cast
@@ -20,6 +21,9 @@ TCallbacks = TypeVar("TCallbacks", bound="BaseCallbacks")
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for buffered log lines kept for replay; every service shares this bound.
+LOG_HISTORY_MAXLEN = 256
+
 
 # --- Callback dataclass ---
 @dataclass
@@ -30,6 +34,7 @@ class BaseCallbacks:
 
 
 def build_callbacks(callback_cls: type[TCallbacks], **kwargs) -> TCallbacks:
+    """Construct ``callback_cls`` directly; the dataclass ``__init__`` does no field reflection."""
     return callback_cls(**kwargs)
 
 
@@ -59,7 +64,7 @@ class LoggingMixin(Generic[TCb]):
 class LogHistoryMixin(LoggingMixin[TCb], Generic[TCb]):
     """Provide log history storage and replay."""
 
-    _log_history: list[str]
+    _log_history: deque[str]
 
     def _log(self, message: str) -> None:
         self._log_history.append(message)
@@ -122,7 +127,7 @@ class BaseService(LogHistoryMixin[TCb], StatusMixin[TCb], OperationStateMixin, A
     def __init__(self, callbacks: TCb | None = None):
         if callbacks is None:
             callbacks = cast(TCb, BaseCallbacks())
-        self._log_history = []
+        self._log_history = deque(maxlen=LOG_HISTORY_MAXLEN)
         self._callbacks = callbacks
         self._in_progress = False
         self._status = ConnectionStatus.DISCONNECTED
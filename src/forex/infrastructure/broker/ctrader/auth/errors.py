@@ -13,6 +13,7 @@ class CTraderErrorCode(IntEnum):
     CH_CLIENT_NOT_AUTHENTICATED = 102
     CH_CLIENT_ALREADY_AUTHENTICATED = 103
     CH_ACCESS_TOKEN_INVALID = 104
+    ALREADY_SUBSCRIBED = 113
 
 
 _ERROR_CODE_NAMES = {
@@ -22,6 +23,7 @@ _ERROR_CODE_NAMES = {
     int(CTraderErrorCode.CH_CLIENT_NOT_AUTHENTICATED): "CH_CLIENT_NOT_AUTHENTICATED",
     int(CTraderErrorCode.CH_CLIENT_ALREADY_AUTHENTICATED): "CH_CLIENT_ALREADY_AUTHENTICATED",
     int(CTraderErrorCode.CH_ACCESS_TOKEN_INVALID): "CH_ACCESS_TOKEN_INVALID",
+    int(CTraderErrorCode.ALREADY_SUBSCRIBED): "ALREADY_SUBSCRIBED",
 }
 
 
@@ -1,5 +1,6 @@
 """Account funds state service."""
 import time
+from collections import deque
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Protocol
@@ -15,6 +16,7 @@ from ctrader_open_api.messages.OpenApiModelMessages_pb2 import ProtoOAPayloadTyp
 
 from forex.config.constants import ConnectionStatus
 from forex.infrastructure.broker.base import (
+    LOG_HISTORY_MAXLEN,
     BaseCallbacks,
     LogHistoryMixin,
     OperationStateMixin,
@@ -108,7 +110,7 @@ class AccountFundsService(
         self._callbacks = AccountFundsServiceCallbacks()
         self._in_progress = False
         self._timeout_tracker = TimeoutTracker(self._on_timeout)
-        self._log_history = []
+        self._log_history = deque(maxlen=LOG_HISTORY_MAXLEN)
         self._last_pnl_request_ts: float = 0.0
         self._min_pnl_interval: float = 2.0
         self._reset_state()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol
@@ -11,6 +12,7 @@ from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOAGetCtidProfileB
 from ctrader_open_api.messages.OpenApiModelMessages_pb2 import ProtoOAPayloadType
 
 from forex.infrastructure.broker.base import (
+    LOG_HISTORY_MAXLEN,
     BaseCallbacks,
     LogHistoryMixin,
     OperationStateMixin,
@@ -66,7 +68,7 @@ class CtidProfileService(
         self._callbacks = CtidProfileServiceCallbacks()
         self._in_progress = False
         self._timeout_tracker = TimeoutTracker(self._on_timeout)
-        self._log_history = []
+        self._log_history = deque(maxlen=LOG_HISTORY_MAXLEN)
 
     def set_access_token(self, access_token: str) -> None:
         self._access_token = access_token
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Protocol
@@ -11,6 +12,7 @@ from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOADealListReq
 from ctrader_open_api.messages.OpenApiModelMessages_pb2 import ProtoOAPayloadType, ProtoOATradeSide
 
 from forex.infrastructure.broker.base import (
+    LOG_HISTORY_MAXLEN,
     BaseCallbacks,
     LogHistoryMixin,
     OperationStateMixin,
@@ -78,7 +80,7 @@ class DealListService(
         self._callbacks = DealListServiceCallbacks()
         self._in_progress = False
         self._timeout_tracker = TimeoutTracker(self._on_timeout)
-        self._log_history = []
+        self._log_history = deque(maxlen=LOG_HISTORY_MAXLEN)
         self._account_id: int | None = None
         self._max_rows: int = 15
         self._from_timestamp: int | None = None
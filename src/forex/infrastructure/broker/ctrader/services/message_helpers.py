@@ -4,11 +4,19 @@ Shared message helpers for cTrader services.
 from collections.abc import Callable, Mapping
 from typing import Any
 
-from forex.infrastructure.broker.ctrader.auth.errors import describe_error_code
+from forex.infrastructure.broker.ctrader.auth.errors import CTraderErrorCode, describe_error_code
+
+_ALREADY_SUBSCRIBED = "ALREADY_SUBSCRIBED"
+# ProtoOAErrorRes carries the code name as a string; numeric codes come from other payloads.
+_ALREADY_SUBSCRIBED_CODES = frozenset(
+    {_ALREADY_SUBSCRIBED, int(CTraderErrorCode.ALREADY_SUBSCRIBED)}
+)
 
 
 def is_already_subscribed(error_code: Any, description: str) -> bool:
-    return "ALREADY_SUBSCRIBED" in f"{error_code}" or "ALREADY_SUBSCRIBED" in description
+    if error_code in _ALREADY_SUBSCRIBED_CODES:
+        return True
+    return _ALREADY_SUBSCRIBED in description
 
 
 def is_non_subscribed_trendbar_unsubscribe(error_code: Any, description: str) -> bool:
@@ -21,6 +29,13 @@ def is_non_subscribed_trendbar_unsubscribe(error_code: Any, description: str) ->
     )
 
 
+_SUCCESS_PREFIX = "✅ "
+_WARNING_PREFIX = "⚠️ "
+_REQUEST_PREFIX = "📥 "
+_SUBSCRIBE_PREFIX = "📡 "
+_UNSUBSCRIBE_PREFIX = "🔕 "
+
+
 def format_confirm(message: str, payload_type: int) -> str:
     return f"✅ {message}({int(payload_type)})"
 
@@ -33,23 +48,23 @@ def format_error(error_code: Any, description: str) -> str:
 
 
 def format_success(message: str) -> str:
-    return f"✅ {message}"
+    return _SUCCESS_PREFIX + message
 
 
 def format_warning(message: str) -> str:
-    return f"⚠️ {message}"
+    return _WARNING_PREFIX + message
 
 
 def format_request(message: str) -> str:
-    return f"📥 {message}"
+    return _REQUEST_PREFIX + message
 
 
 def format_sent_subscribe(message: str) -> str:
-    return f"📡 {message}"
+    return _SUBSCRIBE_PREFIX + message
 
 
 def format_sent_unsubscribe(message: str) -> str:
-    return f"🔕 {message}"
+    return _UNSUBSCRIBE_PREFIX + message
 
 
 def format_unhandled(payload_type: int) -> str:
@@ -1,5 +1,6 @@
 """OAuth login service (browser flow)."""
 import threading
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 
@@ -7,6 +8,7 @@ from forex.config.paths import TOKEN_FILE
 from forex.config.runtime import load_config
 from forex.config.settings import AppCredentials, OAuthTokens
 from forex.infrastructure.broker.base import (
+    LOG_HISTORY_MAXLEN,
     BaseCallbacks,
     LogHistoryMixin,
     OperationStateMixin,
@@ -45,7 +47,7 @@ class OAuthLoginService(LogHistoryMixin[OAuthLoginServiceCallbacks], OperationSt
         self._callback_server = CallbackServer(redirect_uri)
         self._callbacks = OAuthLoginServiceCallbacks()
         self._in_progress = False
-        self._log_history = []
+        self._log_history = deque(maxlen=LOG_HISTORY_MAXLEN)
 
     @classmethod
     def create(
@@ -87,6 +89,10 @@ class OAuthLoginService(LogHistoryMixin[OAuthLoginServiceCallbacks], OperationSt
         tokens.save(self._token_file)
         return tokens
 
+    def close(self) -> None:
+        """Release the callback port kept open between authorization attempts."""
+        self._callback_server.close()
+
     def _run_flow(self) -> None:
         """Run the complete OAuth flow."""
         try:
@@ -104,6 +110,8 @@ class OAuthLoginService(LogHistoryMixin[OAuthLoginServiceCallbacks], OperationSt
                 return
 
             tokens = self.exchange_code(code)
+            # The port stays bound across retries only; a successful login releases it.
+            self._callback_server.close()
             self._log(format_success("OAuth token saved"))
 
             if self._callbacks.on_oauth_login_success:
@@ -64,7 +64,6 @@ class OrderService(CTraderServiceBase[OrderServiceCallbacks]):
         self._last_requested_volume: int | None = None
         self._order_timeout_seconds: int = 20
         self._order_timeout_timer: threading.Timer | None = None
-        self._log(f"OrderService loaded from {__file__}")
 
     def set_callbacks(
         self,
@@ -103,21 +102,21 @@ class OrderService(CTraderServiceBase[OrderServiceCallbacks]):
             return None
         if not self._start_operation():
             return None
-        self._account_id = int(account_id)
+        self._account_id = account_id if type(account_id) is int else int(account_id)
         self._position_id = None
         self._client_order_id = client_order_id or self._generate_client_order_id()
 
         request = ProtoOANewOrderReq()
         request.ctidTraderAccountId = self._account_id
-        request.symbolId = int(symbol_id)
+        request.symbolId = symbol_id if type(symbol_id) is int else int(symbol_id)
         request.orderType = ProtoOAOrderType.MARKET
         request.tradeSide = (
             ProtoOATradeSide.BUY if trade_side.lower() == "buy" else ProtoOATradeSide.SELL
         )
         self._log(format_request(f"Order raw volume: {volume} ({type(volume).__name__})"))
-        normalized_volume = self._normalize_volume(volume)
+        requested_volume, normalized_volume = self._normalize_volume(volume)
         self._last_requested_volume = normalized_volume
-        if normalized_volume != int(volume):
+        if normalized_volume != requested_volume:
             self._log(format_request(f"Order volume adjusted: {volume} -> {normalized_volume}"))
         self._log(format_request(f"Order volume final: {normalized_volume}"))
         request.volume = normalized_volume
@@ -157,17 +156,17 @@ class OrderService(CTraderServiceBase[OrderServiceCallbacks]):
             return False
         if not self._start_operation():
             return False
-        self._account_id = int(account_id)
-        self._position_id = int(position_id)
+        self._account_id = account_id if type(account_id) is int else int(account_id)
+        self._position_id = position_id if type(position_id) is int else int(position_id)
         self._client_order_id = None
 
         request = ProtoOAClosePositionReq()
         request.ctidTraderAccountId = self._account_id
         request.positionId = self._position_id
         self._log(format_request(f"Close raw volume: {volume} ({type(volume).__name__})"))
-        normalized_volume = self._normalize_volume(volume)
+        requested_volume, normalized_volume = self._normalize_volume(volume)
         self._last_requested_volume = normalized_volume
-        if normalized_volume != int(volume):
+        if normalized_volume != requested_volume:
             self._log(format_request(f"Close volume adjusted: {volume} -> {normalized_volume}"))
         self._log(format_request(f"Close volume final: {normalized_volume}"))
         request.volume = normalized_volume
@@ -230,11 +229,14 @@ class OrderService(CTraderServiceBase[OrderServiceCallbacks]):
                 }
             )
 
-    def _normalize_volume(self, volume: int) -> int:
-        try:
-            vol = int(volume)
-        except (TypeError, ValueError):
-            vol = 0
+    def _normalize_volume(self, volume: int) -> tuple[int, int]:
+        vol = volume
+        if type(vol) is not int:
+            try:
+                vol = int(vol)
+            except (TypeError, ValueError):
+                vol = 0
+        requested = vol
         min_volume = 100000
         step = 100000
         self._log(format_request(f"Normalize volume: input={vol}, min={min_volume}, step={step}"))
@@ -243,7 +245,7 @@ class OrderService(CTraderServiceBase[OrderServiceCallbacks]):
             vol = (vol // step) * step
             if vol < min_volume:
                 vol = min_volume
-        return vol
+        return requested, vol
 
     def _on_order_error(self, msg: ExecutionMessage) -> None:
         self._cancel_order_timeout()
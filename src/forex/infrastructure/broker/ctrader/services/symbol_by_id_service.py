@@ -3,8 +3,10 @@ Symbol-by-id service for cTrader.
 """
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Protocol
 
 from ctrader_open_api import Client
@@ -12,6 +14,7 @@ from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOASymbolByIdReq
 from ctrader_open_api.messages.OpenApiModelMessages_pb2 import ProtoOAPayloadType
 
 from forex.infrastructure.broker.base import (
+    LOG_HISTORY_MAXLEN,
     BaseCallbacks,
     LogHistoryMixin,
     OperationStateMixin,
@@ -41,6 +44,9 @@ class SymbolByIdMessage(Protocol):
     symbol: Sequence[FullSymbolMessage]
 
 
+_SYMBOL_READERS: dict[type, tuple[tuple[str, ...], Callable]] = {}
+
+
 @dataclass
 class SymbolByIdServiceCallbacks(BaseCallbacks):
     on_symbols_received: Callable[[list], None] | None = None
@@ -55,12 +61,39 @@ class SymbolByIdService(
     Fetch full symbol details by id.
     """
 
+    _SYMBOL_FIELDS: tuple[tuple[str, str], ...] = (
+        ("min_volume", "minVolume"),
+        ("max_volume", "maxVolume"),
+        ("volume_step", "volumeStep"),
+        ("lot_size", "lotSize"),
+        ("digits", "digits"),
+        ("commission", "commission"),
+        ("commission_type", "commissionType"),
+        ("min_commission", "minCommission"),
+        ("min_commission_type", "minCommissionType"),
+        ("min_commission_asset", "minCommissionAsset"),
+        ("rollover_commission", "rolloverCommission"),
+        ("rollover_commission_3days", "rolloverCommission3Days"),
+        ("precise_trading_commission_rate", "preciseTradingCommissionRate"),
+        ("precise_min_commission", "preciseMinCommission"),
+        ("pnl_conversion_fee_rate", "pnlConversionFeeRate"),
+        ("swap_long", "swapLong"),
+        ("swap_short", "swapShort"),
+        ("swap_calculation_type", "swapCalculationType"),
+        ("swap_period", "swapPeriod"),
+        ("swap_time", "swapTime"),
+        ("charge_swap_at_weekends", "chargeSwapAtWeekends"),
+        ("skip_swap_periods", "skipSWAPPeriods"),
+        ("swap_rollover_3days", "swapRollover3Days"),
+    )
+
     def __init__(self, app_auth_service: AppAuthService):
         self._app_auth_service = app_auth_service
         self._callbacks = SymbolByIdServiceCallbacks()
         self._in_progress = False
-        self._log_history = []
+        self._log_history = deque(maxlen=LOG_HISTORY_MAXLEN)
         self._account_id: int | None = None
+        self._symbol_cache: dict[int, tuple[tuple, dict]] = {}
 
     def set_callbacks(
         self,
@@ -133,41 +166,39 @@ class SymbolByIdService(
         self._cleanup_request_lifecycle(timeout_tracker=None, handler=self._handle_message)
         self._emit_error(format_error(msg.errorCode, msg.description))
 
-    @staticmethod
-    def _parse_symbols(raw_symbols: Sequence[FullSymbolMessage]) -> list:
-        symbols: list[dict] = []
-        for symbol in raw_symbols:
-            payload = {
-                "symbol_id": int(getattr(symbol, "symbolId", 0)),
-                "symbol_name": str(getattr(symbol, "symbolName", "")),
-            }
-            for key, attr in (
-                ("min_volume", "minVolume"),
-                ("max_volume", "maxVolume"),
-                ("volume_step", "volumeStep"),
-                ("lot_size", "lotSize"),
-                ("digits", "digits"),
-                ("commission", "commission"),
-                ("commission_type", "commissionType"),
-                ("min_commission", "minCommission"),
-                ("min_commission_type", "minCommissionType"),
-                ("min_commission_asset", "minCommissionAsset"),
-                ("rollover_commission", "rolloverCommission"),
-                ("rollover_commission_3days", "rolloverCommission3Days"),
-                ("precise_trading_commission_rate", "preciseTradingCommissionRate"),
-                ("precise_min_commission", "preciseMinCommission"),
-                ("pnl_conversion_fee_rate", "pnlConversionFeeRate"),
-                ("swap_long", "swapLong"),
-                ("swap_short", "swapShort"),
-                ("swap_calculation_type", "swapCalculationType"),
-                ("swap_period", "swapPeriod"),
-                ("swap_time", "swapTime"),
-                ("charge_swap_at_weekends", "chargeSwapAtWeekends"),
-                ("skip_swap_periods", "skipSWAPPeriods"),
-                ("swap_rollover_3days", "swapRollover3Days"),
-            ):
-                value = getattr(symbol, attr, None)
-                if value is not None:
-                    payload[key] = value
-            symbols.append(payload)
-        return symbols
+    def _parse_symbols(self, raw_symbols: Sequence[FullSymbolMessage]) -> list:
+        return [self._build_symbol_payload(symbol) for symbol in raw_symbols]
+
+    def _build_symbol_payload(self, symbol: FullSymbolMessage) -> dict:
+        keys, read_fields = self._symbol_reader(symbol)
+        values = read_fields(symbol)
+        symbol_id = int(values[0])
+        cached = self._symbol_cache.get(symbol_id)
+        if cached is not None and cached[0] == values:
+            return cached[1]
+        payload = {"symbol_id": symbol_id, "symbol_name": ""}
+        payload.update(zip(keys[1:], values[1:], strict=True))
+        self._symbol_cache[symbol_id] = (values, payload)
+        return payload
+
+    @classmethod
+    def _symbol_reader(cls, symbol: FullSymbolMessage) -> tuple[tuple[str, ...], Callable]:
+        symbol_type = type(symbol)
+        reader = _SYMBOL_READERS.get(symbol_type)
+        if reader is None:
+            fields = [("symbol_id", "symbolId")] + [
+                (key, attr)
+                for key, attr in (("symbol_name", "symbolName"),) + cls._SYMBOL_FIELDS
+                if hasattr(symbol, attr)
+            ]
+            attrs = [attr for _, attr in fields]
+            read_fields = attrgetter(*attrs)
+            if len(attrs) == 1:
+                read_one = read_fields
+
+                def read_fields(item: FullSymbolMessage) -> tuple:
+                    return (read_one(item),)
+
+            reader = (tuple(key for key, _ in fields), read_fields)
+            _SYMBOL_READERS[symbol_type] = reader
+        return reader
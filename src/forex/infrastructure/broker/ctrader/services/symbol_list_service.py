@@ -4,8 +4,10 @@ Symbol list service
 from __future__ import annotations
 
 import time
+from collections import deque
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Protocol
 
 from ctrader_open_api import Client
@@ -13,6 +15,7 @@ from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOASymbolsListReq
 from ctrader_open_api.messages.OpenApiModelMessages_pb2 import ProtoOAPayloadType
 
 from forex.infrastructure.broker.base import (
+    LOG_HISTORY_MAXLEN,
     BaseCallbacks,
     LogHistoryMixin,
     OperationStateMixin,
@@ -31,6 +34,8 @@ from forex.infrastructure.broker.ctrader.services.timeout_tracker import Timeout
 from forex.infrastructure.broker.errors import ErrorCode, error_message
 from forex.utils.metrics import metrics
 
+_LIGHT_SYMBOL_FIELDS = attrgetter("symbolId", "symbolName")
+
 
 class LightSymbolMessage(Protocol):
     symbolId: int
@@ -63,7 +68,7 @@ class SymbolListService(
         self._callbacks = SymbolListServiceCallbacks()
         self._in_progress = False
         self._timeout_tracker = TimeoutTracker(self._on_timeout)
-        self._log_history = []
+        self._log_history = deque(maxlen=LOG_HISTORY_MAXLEN)
         self._account_id: int | None = None
         self._include_archived = False
 
@@ -171,12 +176,8 @@ class SymbolListService(
 
     @staticmethod
     def _parse_symbols(raw_symbols: Sequence[LightSymbolMessage]) -> list:
-        symbols: list[dict] = []
-        for symbol in raw_symbols:
-            symbols.append(
-                {
-                    "symbol_id": int(getattr(symbol, "symbolId", 0)),
-                    "symbol_name": str(getattr(symbol, "symbolName", "")),
-                }
-            )
-        return symbols
+        # Protobuf scalars always exist and are already int/str, so no defaults or coercion.
+        return [
+            {"symbol_id": symbol_id, "symbol_name": symbol_name}
+            for symbol_id, symbol_name in map(_LIGHT_SYMBOL_FIELDS, raw_symbols)
+        ]
@@ -3,16 +3,16 @@ Shared timeout helper for cTrader services.
 """
 from __future__ import annotations
 
-import threading
 from collections.abc import Callable
 
 from forex.config.runtime import RetryPolicy
+from forex.utils.reactor_manager import ReactorCall, reactor_manager
 
 
 class TimeoutTracker:
     def __init__(self, on_timeout: Callable[[], None]):
         self._on_timeout = on_timeout
-        self._timer: threading.Timer | None = None
+        self._timer: ReactorCall | None = None
         self._policy: RetryPolicy | None = None
         self._on_retry: Callable[[int], None] | None = None
         self._attempt = 0
@@ -37,9 +37,7 @@ class TimeoutTracker:
         self._schedule(self._timeout_seconds, self._generation)
 
     def _schedule(self, delay: float, generation: int) -> None:
-        self._timer = threading.Timer(delay, self._handle_timeout, args=(generation,))
-        self._timer.daemon = True
-        self._timer.start()
+        self._timer = reactor_manager.call_later(delay, self._handle_timeout, generation)
 
     def _handle_timeout(self, generation: int) -> None:
         if generation != self._generation:
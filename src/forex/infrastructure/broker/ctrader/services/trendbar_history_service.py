@@ -1,12 +1,15 @@
 """Trendbar history retrieval service."""
-import threading
+import itertools
 import time
+from collections import deque
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
 from typing import Protocol
 
-from ctrader_open_api import Client
+from ctrader_open_api import Client, Protobuf
 from ctrader_open_api.messages.OpenApiMessages_pb2 import (
     ProtoOAGetTrendbarsReq,
 )
@@ -15,7 +18,9 @@ from ctrader_open_api.messages.OpenApiModelMessages_pb2 import (
     ProtoOATrendbarPeriod,
 )
 
+from forex.domain.market_data import Trendbar
 from forex.infrastructure.broker.base import (
+    LOG_HISTORY_MAXLEN,
     BaseCallbacks,
     LogHistoryMixin,
     OperationStateMixin,
@@ -29,6 +34,45 @@ from forex.infrastructure.broker.ctrader.services.message_helpers import (
     is_already_subscribed,
     is_non_subscribed_trendbar_unsubscribe,
 )
+from forex.utils.reactor_manager import ReactorCall, reactor_manager
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+_BAR_FIELDS = attrgetter(
+    "low",
+    "deltaOpen",
+    "deltaHigh",
+    "deltaClose",
+    "utcTimestampInMinutes",
+    "volume",
+    "period",
+)
+_BAR_TIMESTAMP = attrgetter("utcTimestampInMinutes")
+_ROW_TIMESTAMP = attrgetter("utc_timestamp_minutes")
+# Division rather than a 1e-5 multiply: the reciprocal is inexact and would change stored prices.
+_PRICE_DIVISOR = 100000.0
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# clientMsgIds share the Client's response table with every other service, so the
+# sequence is process-wide rather than per instance.
+_RANGE_REQUEST_IDS = itertools.count(1)
+
+
+@lru_cache(maxsize=4096)
+def _utc_day_text(days: int) -> str:
+    return date.fromordinal(_EPOCH_ORDINAL + days).isoformat()
+
+
+def _format_utc_minutes(ts_minutes: int) -> str:
+    days, minute_of_day = divmod(ts_minutes, 1440)
+    hour, minute = divmod(minute_of_day, 60)
+    return f"{_utc_day_text(days)} {hour:02d}:{minute:02d}"
+
+
+def _ignore_message(_msg: object) -> None:
+    return None
 
 
 class TrendbarMessage(Protocol):
@@ -57,7 +101,8 @@ class ErrorMessage(Protocol):
 @dataclass
 class TrendbarHistoryCallbacks(BaseCallbacks):
     """Callbacks for TrendbarHistoryService."""
-    on_history_received: Callable[[list], None] | None = None
+    on_history_received: Callable[[list[Trendbar] | None], None] | None = None
+    on_history_chunk: Callable[[list[Trendbar]], None] | None = None
 
 
 class TrendbarHistoryService(
@@ -72,6 +117,13 @@ class TrendbarHistoryService(
     _MIN_TIMESTAMP_MS = 0
     _MAX_TIMESTAMP_MS = 2147483646000
     _WIDE_WINDOW_MINUTES = 60 * 24 * 14
+    # Below this size the per-bar path is cheaper than building numpy columns.
+    _VECTORIZE_MIN_BARS = 256
+    # Range backfills keep this many requests outstanding instead of waiting on each reply.
+    _MAX_INFLIGHT_RANGES = 4
+    # A range request that gets no reply in time is sent again, up to this many times.
+    _RANGE_RESPONSE_TIMEOUT_SECONDS = 30
+    _MAX_RANGE_RETRIES = 3
     _PERIOD_LABELS = {
         ProtoOATrendbarPeriod.M1: "M1",
         ProtoOATrendbarPeriod.M2: "M2",
@@ -88,41 +140,80 @@ class TrendbarHistoryService(
         ProtoOATrendbarPeriod.W1: "W1",
         ProtoOATrendbarPeriod.MN1: "MN1",
     }
+    _PERIODS_BY_LABEL = {label: period for period, label in _PERIOD_LABELS.items()}
+    _PERIOD_MINUTES = {
+        ProtoOATrendbarPeriod.M1: 1,
+        ProtoOATrendbarPeriod.M2: 2,
+        ProtoOATrendbarPeriod.M3: 3,
+        ProtoOATrendbarPeriod.M4: 4,
+        ProtoOATrendbarPeriod.M5: 5,
+        ProtoOATrendbarPeriod.M10: 10,
+        ProtoOATrendbarPeriod.M15: 15,
+        ProtoOATrendbarPeriod.M30: 30,
+        ProtoOATrendbarPeriod.H1: 60,
+        ProtoOATrendbarPeriod.H4: 240,
+        ProtoOATrendbarPeriod.H12: 720,
+        ProtoOATrendbarPeriod.D1: 1440,
+        ProtoOATrendbarPeriod.W1: 10080,
+        ProtoOATrendbarPeriod.MN1: 43200,
+    }
 
     def __init__(self, app_auth_service: AppAuthService):
         self._app_auth_service = app_auth_service
         self._callbacks = TrendbarHistoryCallbacks()
         self._in_progress = False
-        self._log_history = []
+        self._log_history = deque(maxlen=LOG_HISTORY_MAXLEN)
         self._client: Client | None = None
+        self._pending_request: ProtoOAGetTrendbarsReq | None = None
+        # Every field is rewritten per page and only one request is outstanding at a time,
+        # so serial downloads reuse one message; pipelined ranges each get their own.
+        self._request = ProtoOAGetTrendbarsReq()
         self._retried_wide = False
         self._retried_m1 = False
         self._last_request_count = 0
         self._last_request_mode = "milliseconds"
         self._last_request_window = 0
-        self._history_buffer: list[dict] = []
-        self._request_ranges: list[tuple[int, int]] = []
+        self._history_buffer: list[Trendbar] = []
+        # Range entries are (range index, from_ts, to_ts); the index fixes the emit order.
+        self._request_ranges: deque[tuple[int, int, int]] = deque()
+        self._range_starts: list[int] = []
+        # Keyed by the clientMsgId each range request was sent with.
+        self._inflight_ranges: dict[str, tuple[int, int, int]] = {}
+        # Unanswered sends per range index.
+        self._range_retries: dict[int, int] = {}
+        self._range_rows: dict[int, list[Trendbar]] = {}
+        self._finished_ranges: set[int] = set()
+        self._next_emit_range = 0
         self._current_range: tuple[int, int] | None = None
+        self._current_range_index: int | None = None
         self._total_ranges = 0
         self._completed_ranges = 0
-        self._period = ProtoOATrendbarPeriod.M5
+        self._set_period(ProtoOATrendbarPeriod.M5)
         self._last_request_ts: float = 0.0
         self._min_request_interval: float = 0.2
-        self._send_timer: threading.Timer | None = None
-        self._last_pagination_to_ts: int | None = None
+        self._send_timer: ReactorCall | None = None
+        # Last pagination bound per range index; None keys the serial download.
+        self._last_pagination_to_ts: dict[int | None, int] = {}
 
     def set_callbacks(
         self,
-        on_history_received: Callable[[list], None] | None = None,
+        on_history_received: Callable[[list[Trendbar] | None], None] | None = None,
         on_error: Callable[[str], None] | None = None,
         on_log: Callable[[str], None] | None = None,
+        on_history_chunk: Callable[[list[Trendbar]], None] | None = None,
     ) -> None:
-        """Set callbacks."""
+        """
+        Set callbacks.
+
+        When ``on_history_chunk`` is set, decoded bars are pushed per response instead of
+        being buffered, and ``on_history_received(None)`` signals the end of the stream.
+        """
         self._callbacks = build_callbacks(
             TrendbarHistoryCallbacks,
             on_history_received=on_history_received,
             on_error=on_error,
             on_log=on_log,
+            on_history_chunk=on_history_chunk,
         )
         self._replay_log_history()
 
@@ -149,31 +240,33 @@ class TrendbarHistoryService(
             return
         self._retried_wide = False
         self._retried_m1 = False
-        self._period = self._resolve_period(timeframe)
+        self._set_period(self._resolve_period(timeframe))
         self._history_buffer = []
-        self._request_ranges = []
+        self._request_ranges = deque()
+        self._range_starts = []
+        self._inflight_ranges = {}
+        self._range_retries = {}
+        self._range_rows = {}
+        self._finished_ranges = set()
+        self._next_emit_range = 0
         self._current_range = None
+        self._current_range_index = None
         self._total_ranges = 0
         self._completed_ranges = 0
+        self._last_pagination_to_ts = {}
         self._build_ranges(count, from_ts, to_ts)
         if self._request_ranges:
             self._total_ranges = len(self._request_ranges)
-            first_range = self._request_ranges.pop(0)
-            self._prepare_request(
-                count,
-                use_seconds=False,
-                window_minutes=max(1, int((first_range[1] - first_range[0]) / 60000)),
-                from_ts=first_range[0],
-                to_ts=first_range[1],
-            )
-        else:
-            self._prepare_request(
-                count,
-                use_seconds=from_ts is None,
-                window_minutes=count * self._period_minutes(),
-                from_ts=from_ts,
-                to_ts=to_ts,
-            )
+            self._last_request_count = int(count)
+            self._fill_range_pipeline()
+            return
+        self._prepare_request(
+            count,
+            use_seconds=from_ts is None,
+            window_minutes=count * self._period_minutes(),
+            from_ts=from_ts,
+            to_ts=to_ts,
+        )
         self._maybe_send_request()
 
     def _prepare_request(
@@ -185,13 +278,13 @@ class TrendbarHistoryService(
         from_ts: int | None = None,
         to_ts: int | None = None,
     ) -> None:
-        request = ProtoOAGetTrendbarsReq()
+        request = self._request
         request.ctidTraderAccountId = self._account_id
         request.symbolId = self._symbol_id
         request.period = self._period
         if to_ts is None:
-            now_ms = int(time.time() * 1000)
-            period_ms = max(1, self._period_minutes()) * 60 * 1000
+            now_ms = time.time_ns() // 1_000_000
+            period_ms = self._period_ms
             aligned_to = (now_ms // period_ms) * period_ms
             request.toTimestamp = min(aligned_to, self._MAX_TIMESTAMP_MS)
         else:
@@ -224,26 +317,9 @@ class TrendbarHistoryService(
         self._pending_request = request
         self._current_range = (request.fromTimestamp, request.toTimestamp)
 
-    @staticmethod
-    def _resolve_period(timeframe: str) -> int:
-        mapping = {
-            "M1": "M1",
-            "M2": "M2",
-            "M3": "M3",
-            "M4": "M4",
-            "M5": "M5",
-            "M10": "M10",
-            "M15": "M15",
-            "M30": "M30",
-            "H1": "H1",
-            "H4": "H4",
-            "H12": "H12",
-            "D1": "D1",
-            "W1": "W1",
-            "MN1": "MN1",
-        }
-        name = mapping.get(timeframe.upper(), "M5")
-        return getattr(ProtoOATrendbarPeriod, name, ProtoOATrendbarPeriod.M5)
+    @classmethod
+    def _resolve_period(cls, timeframe: str) -> int:
+        return cls._PERIODS_BY_LABEL.get(timeframe.upper(), ProtoOATrendbarPeriod.M5)
 
     def _build_ranges(self, count: int, from_ts: int | None, to_ts: int | None) -> None:
         if from_ts is None or to_ts is None or count <= 0:
@@ -258,35 +334,17 @@ class TrendbarHistoryService(
         end = int(to_ts)
         if end <= start:
             return
-        ranges: list[tuple[int, int]] = []
-        current = start
-        while current < end:
-            chunk_end = min(end, current + step_ms)
-            ranges.append((current, chunk_end))
-            current = chunk_end
-        self._request_ranges = ranges
+        self._range_starts = list(range(start, end, step_ms))
+        self._request_ranges = deque(
+            (index, chunk_start, min(end, chunk_start + step_ms))
+            for index, chunk_start in enumerate(self._range_starts)
+        )
 
     def _period_minutes(self) -> int:
-        period_map = {
-            ProtoOATrendbarPeriod.M1: 1,
-            ProtoOATrendbarPeriod.M2: 2,
-            ProtoOATrendbarPeriod.M3: 3,
-            ProtoOATrendbarPeriod.M4: 4,
-            ProtoOATrendbarPeriod.M5: 5,
-            ProtoOATrendbarPeriod.M10: 10,
-            ProtoOATrendbarPeriod.M15: 15,
-            ProtoOATrendbarPeriod.M30: 30,
-            ProtoOATrendbarPeriod.H1: 60,
-            ProtoOATrendbarPeriod.H4: 240,
-            ProtoOATrendbarPeriod.H12: 720,
-            ProtoOATrendbarPeriod.D1: 1440,
-            ProtoOATrendbarPeriod.W1: 10080,
-            ProtoOATrendbarPeriod.MN1: 43200,
-        }
-        return period_map.get(self._period, 5)
+        return self._PERIOD_MINUTES.get(self._period, 5)
 
     def _maybe_send_request(self) -> None:
-        if not hasattr(self, "_pending_request"):
+        if self._pending_request is None:
             return
         now = time.monotonic()
         elapsed = now - self._last_request_ts
@@ -294,37 +352,119 @@ class TrendbarHistoryService(
             if self._send_timer is not None:
                 return
             delay = max(0.0, self._min_request_interval - elapsed)
-            self._send_timer = threading.Timer(delay, self._send_pending_request)
-            self._send_timer.daemon = True
-            self._send_timer.start()
+            self._send_timer = reactor_manager.call_later(delay, self._send_pending_request)
             return
         self._send_pending_request()
 
-    def _send_pending_request(self) -> None:
-        if not hasattr(self, "_pending_request"):
+    def _fill_range_pipeline(self) -> None:
+        if (
+            self._send_timer is not None
+            or not self._request_ranges
+            or len(self._inflight_ranges) >= self._MAX_INFLIGHT_RANGES
+        ):
+            return
+        delay = self._min_request_interval - (time.monotonic() - self._last_request_ts)
+        if delay > 0:
+            self._send_timer = reactor_manager.call_later(delay, self._send_next_range)
+            return
+        self._send_next_range()
+
+    def _send_next_range(self) -> None:
+        self._send_timer = None
+        if not self._in_progress or not self._request_ranges:
             return
+        index, from_ts, to_ts = self._request_ranges.popleft()
+        self._prepare_request(
+            self._last_request_count,
+            use_seconds=False,
+            window_minutes=max(1, int((to_ts - from_ts) / 60000)),
+            from_ts=from_ts,
+            to_ts=to_ts,
+        )
+        client_msg_id = f"trendbars-{next(_RANGE_REQUEST_IDS)}"
+        self._inflight_ranges[client_msg_id] = (index, *self._current_range)
+        response = self._send_pending_request(client_msg_id)
+        # A send queued behind a pending connection is serialized later, so the sent
+        # message is left alone and the next range or retry is written to a fresh one.
+        self._request = ProtoOAGetTrendbarsReq()
+        if response is not None:
+            response.addBoth(self._on_range_response, client_msg_id)
+        if self._in_progress:
+            self._fill_range_pipeline()
+
+    def _on_range_response(self, response: object, client_msg_id: str) -> None:
+        """Handle the reply (or timeout) of the range request sent as ``client_msg_id``."""
+        entry = self._inflight_ranges.pop(client_msg_id, None)
+        if entry is None or not self._in_progress:
+            return None
+        index, from_ts, to_ts = entry
+        payload_type = getattr(response, "payloadType", None)
+        if payload_type != ProtoOAPayloadType.PROTO_OA_GET_TRENDBARS_RES:
+            # Error replies end the download through _on_error before this runs, so this
+            # is a timeout or failed send; the range goes out again until the cap.
+            range_label = self._format_range((from_ts, to_ts))
+            retries = self._range_retries.get(index, 0) + 1
+            if retries > self._MAX_RANGE_RETRIES:
+                self._emit_error(
+                    f"No history reply for {range_label} after {self._MAX_RANGE_RETRIES} retries"
+                )
+                self._cleanup()
+                return None
+            self._range_retries[index] = retries
+            self._log(f"⚠️ No history reply for {range_label}; retrying")
+            self._request_ranges.appendleft(entry)
+            self._fill_range_pipeline()
+            return None
+        self._current_range_index = index
+        self._current_range = (from_ts, to_ts)
+        self._on_history(Protobuf.extract(response))
+        return None
+
+    def _send_follow_up(self) -> None:
+        if self._total_ranges:
+            # Requeue the adjusted range ahead of the backlog; the pipeline re-sends it next.
+            self._request_ranges.appendleft((self._current_range_index, *self._current_range))
+            self._fill_range_pipeline()
+            return
+        self._maybe_send_request()
+
+    def _send_pending_request(self, client_msg_id: str | None = None):
+        if self._pending_request is None:
+            return None
         self._send_timer = None
         self._last_request_ts = time.monotonic()
         try:
-            self._client.send(self._pending_request)
+            if client_msg_id is None:
+                response = self._client.send(self._pending_request)
+            else:
+                response = self._client.send(
+                    self._pending_request,
+                    clientMsgId=client_msg_id,
+                    responseTimeoutInSeconds=self._RANGE_RESPONSE_TIMEOUT_SECONDS,
+                )
         except Exception as exc:
             self._emit_error(str(exc))
             self._cleanup()
-            return
-        period_label = self._period_label()
+            return None
+        # _prepare_request mirrors the request bounds in _current_range; reading the tuple
+        # avoids two protobuf descriptor lookups on every page.
+        from_ts, to_ts = self._current_range
         self._log(
-            f"📥 Fetching {period_label} history: {self._last_request_count} rows "
+            f"📥 Fetching {self._period_label_text} history: {self._last_request_count} rows "
             f"({self._last_request_mode}, window={self._last_request_window}, "
-            f"from={self._pending_request.fromTimestamp}, to={self._pending_request.toTimestamp})"
+            f"from={from_ts}, to={to_ts})"
         )
+        return response
 
     def _handle_message(self, client: Client, msg: object) -> bool:
         if not self._in_progress:
             return False
+        # Range replies are taken from their response Deferreds, which know the request.
+        on_history = _ignore_message if self._total_ranges else self._on_history
         return dispatch_payload(
             msg,
             {
-                ProtoOAPayloadType.PROTO_OA_GET_TRENDBARS_RES: self._on_history,
+                ProtoOAPayloadType.PROTO_OA_GET_TRENDBARS_RES: on_history,
                 ProtoOAPayloadType.PROTO_OA_ERROR_RES: self._on_error,
             },
         )
@@ -342,7 +482,7 @@ class TrendbarHistoryService(
                 from_ts=self._current_range[0] if self._current_range else None,
                 to_ts=self._current_range[1] if self._current_range else None,
             )
-            self._maybe_send_request()
+            self._send_follow_up()
             return
         if (
             bars
@@ -362,12 +502,12 @@ class TrendbarHistoryService(
                 from_ts=None,
                 to_ts=self._current_range[1] if self._current_range else None,
             )
-            self._maybe_send_request()
+            self._send_follow_up()
             return
         if not bars and not self._retried_m1:
             self._retried_m1 = True
             prev_period_label = self._period_label()
-            self._period = ProtoOATrendbarPeriod.M1
+            self._set_period(ProtoOATrendbarPeriod.M1)
             self._log(f"⚠️ {prev_period_label} was empty; retrying with M1")
             self._prepare_request(
                 self._last_request_count,
@@ -376,34 +516,45 @@ class TrendbarHistoryService(
                 from_ts=self._current_range[0] if self._current_range else None,
                 to_ts=self._current_range[1] if self._current_range else None,
             )
-            self._maybe_send_request()
+            self._send_follow_up()
             return
         if not bars:
             self._log(
                 f"⚠️ History response was empty (symbol={msg.symbolId}, period={msg.period}, "
                 f"timestamp={msg.timestamp})"
             )
+        elif self._total_ranges:
+            self._range_rows.setdefault(self._current_range_index, []).extend(
+                self._bars_to_rows(bars)
+            )
         else:
-            self._history_buffer.extend(self._to_dict(bar) for bar in bars)
+            self._emit_rows(self._bars_to_rows(bars))
+            if not self._in_progress:
+                # The chunk consumer failed and cancelled the download.
+                return
 
-        if has_more and not self._request_ranges and bars:
-            oldest_minutes = min(int(bar.utcTimestampInMinutes) for bar in bars)
+        range_index = self._current_range_index if self._total_ranges else None
+        if has_more and bars:
+            oldest_minutes = _BAR_TIMESTAMP(min(bars, key=_BAR_TIMESTAMP))
             oldest_ts = oldest_minutes * 60 * 1000
-            if self._last_pagination_to_ts == oldest_ts:
-                has_more = False
+            if range_index is None:
+                page_from = max(
+                    self._MIN_TIMESTAMP_MS,
+                    oldest_ts - (self._last_request_window * 60 * 1000),
+                )
             else:
-                self._last_pagination_to_ts = oldest_ts
+                # A range pages back to its own start, never into the previous range.
+                page_from = self._range_starts[range_index]
+            if oldest_ts > page_from and self._last_pagination_to_ts.get(range_index) != oldest_ts:
+                self._last_pagination_to_ts[range_index] = oldest_ts
                 self._prepare_request(
                     self._last_request_count,
                     use_seconds=False,
                     window_minutes=self._last_request_window,
-                    from_ts=max(
-                        self._MIN_TIMESTAMP_MS,
-                        oldest_ts - (self._last_request_window * 60 * 1000),
-                    ),
+                    from_ts=page_from,
                     to_ts=oldest_ts,
                 )
-                self._maybe_send_request()
+                self._send_follow_up()
                 return
 
         if self._total_ranges:
@@ -411,47 +562,83 @@ class TrendbarHistoryService(
             range_text = self._format_range(self._current_range)
             suffix = f" ({range_text})" if range_text else ""
             self._log(f"📦 Completed {self._completed_ranges}/{self._total_ranges}{suffix}")
+            self._finish_range(range_index)
+            if not self._in_progress:
+                return
 
-        if self._request_ranges:
-            next_range = self._request_ranges.pop(0)
-            self._prepare_request(
-                self._last_request_count,
-                use_seconds=False,
-                window_minutes=max(1, int((next_range[1] - next_range[0]) / 60000)),
-                from_ts=next_range[0],
-                to_ts=next_range[1],
-            )
-            self._maybe_send_request()
+        if self._request_ranges or self._inflight_ranges:
+            self._fill_range_pipeline()
             return
 
         if self._callbacks.on_history_received:
-            self._callbacks.on_history_received(self._history_buffer)
+            self._callbacks.on_history_received(
+                None if self._callbacks.on_history_chunk else self._history_buffer
+            )
         self._cleanup()
 
+    def _finish_range(self, index: int) -> None:
+        """Emit every completed range that no earlier range is still holding back."""
+        self._finished_ranges.add(index)
+        while self._in_progress and self._next_emit_range in self._finished_ranges:
+            rows = self._range_rows.pop(self._next_emit_range, None)
+            self._finished_ranges.discard(self._next_emit_range)
+            self._next_emit_range += 1
+            if rows:
+                # Pages within a range arrive newest first; timsort is linear on sorted runs.
+                rows.sort(key=_ROW_TIMESTAMP)
+                self._emit_rows(rows)
+
+    def _emit_rows(self, rows: list[Trendbar]) -> None:
+        if self._callbacks.on_history_chunk:
+            self._callbacks.on_history_chunk(rows)
+        elif self._history_buffer:
+            self._history_buffer.extend(rows)
+        else:
+            # First chunk: adopt the decoded list instead of copying it into an empty buffer.
+            self._history_buffer = rows
+
     def _minimum_useful_bar_count(self) -> int:
         # Live feature pipelines need at least 64 bars to satisfy the largest
         # rolling min_periods used by the residual/alpha profiles.
         return max(64, min(self._last_request_count, 128) // 3)
 
-    def _to_dict(self, bar: TrendbarMessage) -> dict:
-        low = int(bar.low)
-        open_price = low + int(bar.deltaOpen)
-        close_price = low + int(bar.deltaClose)
-        high = low + int(bar.deltaHigh)
-        divisor = 100000.0
-        ts_minutes = int(bar.utcTimestampInMinutes)
-        ts = ts_minutes * 60
-        ts_text = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
-        return {
-            "utc_timestamp_minutes": ts_minutes,
-            "timestamp": ts_text,
-            "open": open_price / divisor,
-            "high": high / divisor,
-            "low": low / divisor,
-            "close": close_price / divisor,
-            "volume": int(getattr(bar, "volume", 0)),
-            "period": int(getattr(bar, "period", 0)),
-        }
+    def _bars_to_rows(self, bars: Sequence[TrendbarMessage]) -> list[Trendbar]:
+        if np is None or len(bars) < self._VECTORIZE_MIN_BARS:
+            return [self._to_row(bar) for bar in bars]
+        columns = np.array(list(map(_BAR_FIELDS, bars)), dtype=np.int64)
+        # Rebase the open/high/close deltas on low in place, then scale all four at once.
+        columns[:, 1:4] += columns[:, :1]
+        lows, opens, highs, closes = (columns[:, :4] / _PRICE_DIVISOR).T.tolist()
+        ts_minutes = columns[:, 4]
+        ts_texts = np.char.replace(
+            np.datetime_as_string(ts_minutes.astype("datetime64[m]"), unit="m"), "T", " "
+        ).tolist()
+        return list(
+            map(
+                Trendbar,
+                ts_minutes.tolist(),
+                ts_texts,
+                opens,
+                highs,
+                lows,
+                closes,
+                columns[:, 5].tolist(),
+                columns[:, 6].tolist(),
+            )
+        )
+
+    def _to_row(self, bar: TrendbarMessage) -> Trendbar:
+        low, delta_open, delta_high, delta_close, ts_minutes, volume, period = _BAR_FIELDS(bar)
+        return Trendbar(
+            utc_timestamp_minutes=ts_minutes,
+            timestamp=_format_utc_minutes(ts_minutes),
+            open=(low + delta_open) / _PRICE_DIVISOR,
+            high=(low + delta_high) / _PRICE_DIVISOR,
+            low=low / _PRICE_DIVISOR,
+            close=(low + delta_close) / _PRICE_DIVISOR,
+            volume=volume,
+            period=period,
+        )
 
     @staticmethod
     def _format_range(range_pair: tuple[int, int] | None) -> str:
@@ -496,5 +683,10 @@ class TrendbarHistoryService(
         except Exception:
             pass
 
+    def _set_period(self, period: int) -> None:
+        self._period = period
+        self._period_label_text = self._PERIOD_LABELS.get(period, f"period={period}")
+        self._period_ms = max(1, self._period_minutes()) * 60_000
+
     def _period_label(self) -> str:
-        return self._PERIOD_LABELS.get(self._period, f"period={self._period}")
+        return self._period_label_text
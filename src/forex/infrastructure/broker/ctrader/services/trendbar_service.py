@@ -1,9 +1,9 @@
 """Live trendbar streaming service."""
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Protocol
+from typing import Any, Protocol
 
 from ctrader_open_api import Client
 from ctrader_open_api.messages.OpenApiMessages_pb2 import (
@@ -15,7 +15,9 @@ from ctrader_open_api.messages.OpenApiModelMessages_pb2 import (
     ProtoOATrendbarPeriod,
 )
 
+from forex.domain.market_data import LiveTrendbar
 from forex.infrastructure.broker.base import (
+    LOG_HISTORY_MAXLEN,
     BaseCallbacks,
     LogHistoryMixin,
     OperationStateMixin,
@@ -35,6 +37,29 @@ from forex.infrastructure.broker.ctrader.services.message_helpers import (
 from forex.infrastructure.broker.ctrader.services.spot_subscription import (
     send_spot_subscribe,
 )
+from forex.utils.reactor_manager import ReactorCall, reactor_manager
+
+# Broker prices are integers in 1e-5 units. Divide rather than multiply by 1e-5 so
+# results stay bit-identical to the history service's decoding.
+_PRICE_DIVISOR = 100000.0
+_SPOT_EVENT_PAYLOAD = ProtoOAPayloadType.PROTO_OA_SPOT_EVENT
+# Timeframe name -> (trendbar period enum, bucket length in minutes).
+_PERIOD_TABLE: dict[str, tuple[int, int]] = {
+    "M1": (ProtoOATrendbarPeriod.M1, 1),
+    "M2": (ProtoOATrendbarPeriod.M2, 2),
+    "M3": (ProtoOATrendbarPeriod.M3, 3),
+    "M4": (ProtoOATrendbarPeriod.M4, 4),
+    "M5": (ProtoOATrendbarPeriod.M5, 5),
+    "M10": (ProtoOATrendbarPeriod.M10, 10),
+    "M15": (ProtoOATrendbarPeriod.M15, 15),
+    "M30": (ProtoOATrendbarPeriod.M30, 30),
+    "H1": (ProtoOATrendbarPeriod.H1, 60),
+    "H4": (ProtoOATrendbarPeriod.H4, 240),
+    "H12": (ProtoOATrendbarPeriod.H12, 720),
+    "D1": (ProtoOATrendbarPeriod.D1, 1440),
+    "W1": (ProtoOATrendbarPeriod.W1, 10080),
+    "MN1": (ProtoOATrendbarPeriod.MN1, 43200),
+}
 
 
 class TrendbarMessage(Protocol):
@@ -62,7 +87,7 @@ class ErrorMessage(Protocol):
 @dataclass
 class TrendbarServiceCallbacks(BaseCallbacks):
     """Callbacks for TrendbarService."""
-    on_trendbar: Callable[[dict], None] | None = None
+    on_trendbar: Callable[[LiveTrendbar], None] | None = None
 
 
 class TrendbarService(
@@ -78,23 +103,43 @@ class TrendbarService(
         self._app_auth_service = app_auth_service
         self._callbacks = TrendbarServiceCallbacks()
         self._in_progress = False
-        self._log_history = []
+        self._log_history = deque(maxlen=LOG_HISTORY_MAXLEN)
         self._account_id: int | None = None
         self._symbol_id: int | None = None
         self._period: int = ProtoOATrendbarPeriod.M1
         self._period_name: str = "M1"
         self._period_minutes: int = 1
-        self._last_bar: dict | None = None
+        self._last_bar: LiveTrendbar | None = None
         self._spot_subscribed = False
         self._trendbar_subscribed = False
         self._await_spot_subscribe = False
         self._pending_trendbar_request: ProtoOASubscribeLiveTrendbarReq | None = None
         self._last_bar_ts: int | None = None
+        self._last_bucket_minutes: int = -1
+        self._last_bucket_text: str = ""
+        # Close-only updates inside this window are coalesced into one trailing emit.
+        self._emit_coalesce_s: float = 0.1
+        self._last_emit_ts: float = 0.0
+        self._coalesced_bar: LiveTrendbar | None = None
+        self._flush_timer: ReactorCall | None = None
         self._client: Client | None = None
+        # Built once: spot events stream at many Hz and would otherwise rebuild it per tick.
+        self._dispatch_table: dict[int, Callable[[Any], None]] = {
+            ProtoOAPayloadType.PROTO_OA_SPOT_EVENT: self._on_spot_event,
+            ProtoOAPayloadType.PROTO_OA_SUBSCRIBE_SPOTS_RES: self._on_spot_subscribe_confirmed,
+            ProtoOAPayloadType.PROTO_OA_UNSUBSCRIBE_SPOTS_RES: self._on_spot_unsubscribe_confirmed,
+            ProtoOAPayloadType.PROTO_OA_SUBSCRIBE_LIVE_TRENDBAR_RES: (
+                self._on_trendbar_subscribe_confirmed
+            ),
+            ProtoOAPayloadType.PROTO_OA_UNSUBSCRIBE_LIVE_TRENDBAR_RES: (
+                self._on_trendbar_unsubscribe_confirmed
+            ),
+            ProtoOAPayloadType.PROTO_OA_ERROR_RES: self._on_error,
+        }
 
     def set_callbacks(
         self,
-        on_trendbar: Callable[[dict], None] | None = None,
+        on_trendbar: Callable[[LiveTrendbar], None] | None = None,
         on_error: Callable[[str], None] | None = None,
         on_log: Callable[[str], None] | None = None,
     ) -> None:
@@ -121,8 +166,7 @@ class TrendbarService(
         self._trendbar_subscribed = False
         # Reset cached bar state on every (re)subscribe so a timeframe switch
         # does not keep emitting stale buckets from the previous period.
-        self._last_bar = None
-        self._last_bar_ts = None
+        self._reset_bar_state()
         self._app_auth_service.add_message_handler(self._handle_message)
 
         try:
@@ -166,8 +210,7 @@ class TrendbarService(
             return
         client.send(request)
         self._trendbar_subscribed = False
-        self._last_bar = None
-        self._last_bar_ts = None
+        self._reset_bar_state()
         self._cleanup_request_lifecycle(timeout_tracker=None, handler=self._handle_message)
         self._log(
             format_sent_unsubscribe(
@@ -186,8 +229,7 @@ class TrendbarService(
         self._pending_trendbar_request = None
         self._spot_subscribed = False
         self._trendbar_subscribed = False
-        self._last_bar = None
-        self._last_bar_ts = None
+        self._reset_bar_state()
         if self._in_progress:
             self._cleanup_request_lifecycle(timeout_tracker=None, handler=self._handle_message)
             return
@@ -200,25 +242,11 @@ class TrendbarService(
         if not self._in_progress:
             return False
 
-        return dispatch_payload(
-            msg,
-            {
-                ProtoOAPayloadType.PROTO_OA_SPOT_EVENT: self._on_spot_event,
-                ProtoOAPayloadType.PROTO_OA_SUBSCRIBE_SPOTS_RES: (
-                    self._on_spot_subscribe_confirmed
-                ),
-                ProtoOAPayloadType.PROTO_OA_UNSUBSCRIBE_SPOTS_RES: (
-                    self._on_spot_unsubscribe_confirmed
-                ),
-                ProtoOAPayloadType.PROTO_OA_SUBSCRIBE_LIVE_TRENDBAR_RES: (
-                    self._on_trendbar_subscribe_confirmed
-                ),
-                ProtoOAPayloadType.PROTO_OA_UNSUBSCRIBE_LIVE_TRENDBAR_RES: (
-                    self._on_trendbar_unsubscribe_confirmed
-                ),
-                ProtoOAPayloadType.PROTO_OA_ERROR_RES: self._on_error,
-            },
-        )
+        # Spot events are nearly all of the traffic once subscribed; route them directly.
+        if getattr(msg, "payloadType", None) == _SPOT_EVENT_PAYLOAD:
+            self._on_spot_event(msg)
+            return True
+        return dispatch_payload(msg, self._dispatch_table)
 
     def _on_spot_subscribe_confirmed(self, _msg: object) -> None:
         self._log(
@@ -258,110 +286,187 @@ class TrendbarService(
         )
 
     def _on_spot_event(self, msg: SpotEventMessage) -> None:
-        if self._account_id and msg.ctidTraderAccountId != self._account_id:
+        account_id = self._account_id
+        if account_id is not None and msg.ctidTraderAccountId != account_id:
             return
-        if self._symbol_id and msg.symbolId != self._symbol_id:
+        msg_symbol_id = msg.symbolId
+        symbol_id = self._symbol_id
+        if symbol_id is not None and msg_symbol_id != symbol_id:
             return
-        trendbars = list(getattr(msg, "trendbar", []))
+        # Index the repeated field directly; only the newest bar is needed.
+        trendbars = getattr(msg, "trendbar", None)
         latest = trendbars[-1] if trendbars else None
         if latest is not None and latest.period == self._period:
-            self._seed_from_trendbar(latest, msg.symbolId)
-            if self._last_bar is not None and self._callbacks.on_trendbar:
-                self._callbacks.on_trendbar(self._last_bar)
+            self._seed_from_trendbar(latest, msg_symbol_id)
+            seeded = self._last_bar
+            if seeded is not None:
+                self._emit_trendbar(seeded)
             return
 
+        previous = self._last_bar
         updated = self._update_from_spot(msg)
-        if updated is None and self._last_bar is None:
-            price = self._extract_price(msg)
-            bucket = self._extract_bucket_minutes(msg)
-            if price is not None and bucket is not None:
-                ts = bucket * 60
-                ts_text = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%H:%M")
-                self._last_bar = {
-                    "symbol_id": msg.symbolId,
-                    "period": self._period_name,
-                    "timestamp": ts_text,
-                    "utc_timestamp_minutes": bucket,
-                    "open": price,
-                    "high": price,
-                    "low": price,
-                    "close": price,
-                }
-                self._last_bar_ts = bucket
-                updated = dict(self._last_bar)
-
-        if updated is not None and self._callbacks.on_trendbar:
-            self._callbacks.on_trendbar(updated)
-        return
+        if updated is not None:
+            if (
+                previous is not None
+                and updated.high == previous.high
+                and updated.low == previous.low
+            ):
+                self._emit_close_update(updated)
+            else:
+                self._emit_trendbar(updated)
+            return
+        if previous is not None:
+            return
+        # _update_from_spot leaves _last_bar untouched when it declines, so no bar exists yet.
+        price = self._extract_price(msg)
+        bucket = self._extract_bucket_minutes(msg)
+        if price is None or bucket is None:
+            return
+        updated = LiveTrendbar(
+            symbol_id=msg_symbol_id,
+            period=self._period_name,
+            timestamp=self._format_bucket_text(bucket),
+            utc_timestamp_minutes=bucket,
+            open=price,
+            high=price,
+            low=price,
+            close=price,
+        )
+        self._last_bar = updated
+        self._last_bar_ts = bucket
+        self._emit_trendbar(updated)
+
+    def _emit_close_update(self, bar: LiveTrendbar) -> None:
+        elapsed = time.monotonic() - self._last_emit_ts
+        if elapsed >= self._emit_coalesce_s:
+            self._emit_trendbar(bar)
+            return
+        # Only the close moved: keep the newest snapshot and flush it once the window ends.
+        self._coalesced_bar = bar
+        if self._flush_timer is None:
+            self._flush_timer = reactor_manager.call_later(
+                self._emit_coalesce_s - elapsed, self._flush_coalesced_bar
+            )
+
+    def _flush_coalesced_bar(self) -> None:
+        self._flush_timer = None
+        bar = self._coalesced_bar
+        if bar is not None and self._in_progress:
+            self._emit_trendbar(bar)
+
+    def _reset_bar_state(self) -> None:
+        self._last_bar = None
+        self._last_bar_ts = None
+        self._coalesced_bar = None
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _emit_trendbar(self, bar: LiveTrendbar) -> None:
+        self._coalesced_bar = None
+        self._last_emit_ts = time.monotonic()
+        callback = self._callbacks.on_trendbar
+        if callback is None:
+            return
+        callback(bar)
 
     def _seed_from_trendbar(self, bar: TrendbarMessage, symbol_id: int) -> None:
-        ts_minutes = int(bar.utcTimestampInMinutes)
+        # Protobuf integer fields already come back as Python ints.
+        ts_minutes = bar.utcTimestampInMinutes
         if self._last_bar_ts is not None and ts_minutes < self._last_bar_ts:
             return
         self._last_bar_ts = ts_minutes
-        low = int(bar.low)
-        open_price = low + int(bar.deltaOpen)
-        close_price = low + int(bar.deltaClose)
-        high = low + int(bar.deltaHigh)
-        divisor = 100000.0
-        ts = ts_minutes * 60
-        ts_text = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%H:%M")
-        self._last_bar = {
-            "symbol_id": symbol_id,
-            "period": self._period_name,
-            "timestamp": ts_text,
-            "utc_timestamp_minutes": ts_minutes,
-            "open": open_price / divisor,
-            "high": high / divisor,
-            "low": low / divisor,
-            "close": close_price / divisor,
-        }
+        low = bar.low
+        open_price = (low + bar.deltaOpen) / _PRICE_DIVISOR
+        high = (low + bar.deltaHigh) / _PRICE_DIVISOR
+        low_price = low / _PRICE_DIVISOR
+        close = (low + bar.deltaClose) / _PRICE_DIVISOR
+        current = self._last_bar
+        if (
+            current is not None
+            and current.utc_timestamp_minutes == ts_minutes
+            and current.symbol_id == symbol_id
+            and current.open == open_price
+            and current.high == high
+            and current.low == low_price
+            and current.close == close
+        ):
+            # The broker resends the forming bar with every spot event; an unchanged bar
+            # keeps the published snapshot instead of allocating an identical one.
+            return
+        self._last_bar = LiveTrendbar(
+            symbol_id=symbol_id,
+            period=self._period_name,
+            timestamp=self._format_bucket_text(ts_minutes),
+            utc_timestamp_minutes=ts_minutes,
+            open=open_price,
+            high=high,
+            low=low_price,
+            close=close,
+        )
 
-    def _update_from_spot(self, msg: SpotEventMessage) -> dict | None:
+    def _format_bucket_text(self, ts_minutes: int) -> str:
+        # Ticks arrive many times per bucket; only reformat when the bucket changes.
+        if ts_minutes == self._last_bucket_minutes:
+            return self._last_bucket_text
+        # UTC has no offset, so HH:MM falls straight out of the minute count.
+        ts_text = f"{ts_minutes // 60 % 24:02d}:{ts_minutes % 60:02d}"
+        self._last_bucket_minutes = ts_minutes
+        self._last_bucket_text = ts_text
+        return ts_text
+
+    def _update_from_spot(self, msg: SpotEventMessage) -> LiveTrendbar | None:
         price = self._extract_price(msg)
         if price is None:
             return None
         ts_minutes = self._extract_bucket_minutes(msg)
         if ts_minutes is None:
             return None
-        if self._last_bar is None:
+        bar = self._last_bar
+        if bar is None:
             return None
-        if self._last_bar.get("utc_timestamp_minutes") != ts_minutes:
+        if bar.utc_timestamp_minutes != ts_minutes:
             return None
-        self._last_bar["high"] = max(self._last_bar["high"], price)
-        self._last_bar["low"] = min(self._last_bar["low"], price)
-        self._last_bar["close"] = price
+        high = bar.high
+        low = bar.low
+        # Published snapshots cross to the UI thread, so never mutate one in place:
+        # build the next snapshot and swap it in.
+        updated = LiveTrendbar(
+            bar.symbol_id,
+            bar.period,
+            bar.timestamp,
+            ts_minutes,
+            bar.open,
+            price if price > high else high,
+            price if price < low else low,
+            price,
+        )
+        self._last_bar = updated
         self._last_bar_ts = ts_minutes
-        return dict(self._last_bar)
+        return updated
 
     @staticmethod
     def _extract_price(msg: SpotEventMessage) -> float | None:
-        bid = getattr(msg, "bid", None)
-        ask = getattr(msg, "ask", None)
-        has_bid = getattr(msg, "hasBid", None)
-        has_ask = getattr(msg, "hasAsk", None)
-        if has_bid is False:
-            bid = None
-        if has_ask is False:
-            ask = None
-        bid_val = float(bid) if bid is not None and bid != 0 else None
-        ask_val = float(ask) if ask is not None and ask != 0 else None
-        if bid_val is not None and ask_val is not None:
-            return (bid_val + ask_val) / 2.0
-        if bid_val is not None:
-            return bid_val
-        if ask_val is not None:
-            return ask_val
+        bid = getattr(msg, "bid", None) if getattr(msg, "hasBid", None) is not False else None
+        ask = getattr(msg, "ask", None) if getattr(msg, "hasAsk", None) is not False else None
+        # A missing or zero side means no quote on that side.
+        if bid:
+            if ask:
+                return (float(bid) + float(ask)) * 0.5
+            return float(bid)
+        if ask:
+            return float(ask)
         return None
 
     def _extract_bucket_minutes(self, msg: SpotEventMessage) -> int | None:
         ts = getattr(msg, "spotTimestamp", None)
         if ts is None:
             ts = getattr(msg, "timestamp", None)
-        if ts is None or int(ts) == 0:
-            ts_seconds = int(time.time())
+        ts = int(ts) if ts is not None else 0
+        if ts == 0:
+            ts_seconds = time.time_ns() // 1_000_000_000
         else:
-            ts_seconds = self._normalize_timestamp_seconds(int(ts))
+            ts_seconds = self._normalize_timestamp_seconds(ts)
         if ts_seconds <= 0:
             return None
         minutes = ts_seconds // 60
@@ -370,36 +475,21 @@ class TrendbarService(
 
     @staticmethod
     def _normalize_timestamp_seconds(ts: int) -> int:
+        # Spot timestamps are epoch milliseconds, so test that band first.
+        if 10**11 < ts <= 10**14:
+            return ts // 10**3
         if ts > 10**17:
             return ts // 10**9
         if ts > 10**14:
             return ts // 10**6
-        if ts > 10**11:
-            return ts // 10**3
         return ts
 
     @staticmethod
     def _resolve_period(timeframe: str) -> tuple[str, int, int]:
-        mapping = {
-            "M1": (ProtoOATrendbarPeriod.M1, 1),
-            "M2": (ProtoOATrendbarPeriod.M2, 2),
-            "M3": (ProtoOATrendbarPeriod.M3, 3),
-            "M4": (ProtoOATrendbarPeriod.M4, 4),
-            "M5": (ProtoOATrendbarPeriod.M5, 5),
-            "M10": (ProtoOATrendbarPeriod.M10, 10),
-            "M15": (ProtoOATrendbarPeriod.M15, 15),
-            "M30": (ProtoOATrendbarPeriod.M30, 30),
-            "H1": (ProtoOATrendbarPeriod.H1, 60),
-            "H4": (ProtoOATrendbarPeriod.H4, 240),
-            "H12": (ProtoOATrendbarPeriod.H12, 720),
-            "D1": (ProtoOATrendbarPeriod.D1, 1440),
-            "W1": (ProtoOATrendbarPeriod.W1, 10080),
-            "MN1": (ProtoOATrendbarPeriod.MN1, 43200),
-        }
         name = timeframe.upper()
-        if name not in mapping:
+        if name not in _PERIOD_TABLE:
             name = "M1"
-        period, minutes = mapping[name]
+        period, minutes = _PERIOD_TABLE[name]
         return name, period, minutes
 
     def _on_error(self, msg: ErrorMessage) -> None:
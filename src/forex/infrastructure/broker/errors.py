@@ -24,4 +24,7 @@ class BrokerError:
 
 
 def error_message(code: ErrorCode, message: str, detail: str | None = None) -> str:
-    return str(BrokerError(code=code, message=message, detail=detail))
+    # Same text as str(BrokerError(...)) without building a throwaway instance.
+    if detail:
+        return f"[{code.value}] {message} ({detail})"
+    return f"[{code.value}] {message}"
@@ -9,63 +9,64 @@ from forex.infrastructure.broker.base import BaseCallbacks, build_callbacks
 Callback = Callable[..., None]
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeAppAuthCallbacks(BaseCallbacks):
     on_app_auth_success: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeOAuthCallbacks(BaseCallbacks):
     on_oauth_success: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeOAuthLoginCallbacks(BaseCallbacks):
     on_oauth_login_success: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeAccountListCallbacks(BaseCallbacks):
     on_accounts_received: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeCtidProfileCallbacks(BaseCallbacks):
     on_profile_received: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeAccountFundsCallbacks(BaseCallbacks):
     on_funds_received: Callback | None = None
     on_position_pnl: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeTrendbarCallbacks(BaseCallbacks):
     on_trendbar: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeTrendbarHistoryCallbacks(BaseCallbacks):
     on_history_received: Callback | None = None
+    on_history_chunk: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeSymbolsCallbacks(BaseCallbacks):
     on_symbols_received: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeOrderCallbacks(BaseCallbacks):
     on_execution: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeDealHistoryCallbacks(BaseCallbacks):
     on_deals_received: Callback | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeAppAuthService:
     host_type: str
     token_file: str
@@ -107,7 +108,7 @@ class FakeAppAuthService:
         _ = handler
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeOAuthService:
     app_auth_service: FakeAppAuthService
     token_file: str
@@ -142,7 +143,7 @@ class FakeOAuthService:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeOAuthLoginService:
     token_file: str
     redirect_uri: str | None
@@ -165,8 +166,11 @@ class FakeOAuthLoginService:
         _ = code
         return self
 
+    def close(self) -> None:
+        return None
 
-@dataclass
+
+@dataclass(slots=True)
 class FakeAccountListService:
     app_auth_service: FakeAppAuthService
     access_token: str
@@ -197,7 +201,7 @@ class FakeAccountListService:
             cb([])
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeCtidProfileService:
     app_auth_service: FakeAppAuthService
     access_token: str
@@ -229,7 +233,7 @@ class FakeCtidProfileService:
             cb(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeAccountFundsService:
     app_auth_service: FakeAppAuthService
     in_progress: bool = False
@@ -290,7 +294,7 @@ class FakeAccountFundsService:
             cb(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeTrendbarService:
     app_auth_service: FakeAppAuthService
     in_progress: bool = False
@@ -314,7 +318,7 @@ class FakeTrendbarService:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeTrendbarHistoryService:
     app_auth_service: FakeAppAuthService
     _callbacks: FakeTrendbarHistoryCallbacks = field(
@@ -322,12 +326,19 @@ class FakeTrendbarHistoryService:
         repr=False,
     )
 
-    def set_callbacks(self, on_history_received=None, on_error=None, on_log=None) -> None:
+    def set_callbacks(
+        self,
+        on_history_received=None,
+        on_error=None,
+        on_log=None,
+        on_history_chunk=None,
+    ) -> None:
         self._callbacks = build_callbacks(
             FakeTrendbarHistoryCallbacks,
             on_history_received=on_history_received,
             on_error=on_error,
             on_log=on_log,
+            on_history_chunk=on_history_chunk,
         )
 
     def clear_log_history(self) -> None:
@@ -347,8 +358,11 @@ class FakeTrendbarHistoryService:
         if cb:
             cb([])
 
+    def cancel(self) -> None:
+        pass
+
 
-@dataclass
+@dataclass(slots=True)
 class FakeSymbolListService:
     app_auth_service: FakeAppAuthService
     in_progress: bool = False
@@ -377,7 +391,7 @@ class FakeSymbolListService:
             cb([])
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeSymbolByIdService:
     app_auth_service: FakeAppAuthService
     in_progress: bool = False
@@ -407,7 +421,7 @@ class FakeSymbolByIdService:
             cb([])
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeOrderService:
     app_auth_service: FakeAppAuthService
     in_progress: bool = False
@@ -479,7 +493,7 @@ class FakeOrderService:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeDealHistoryService:
     app_auth_service: FakeAppAuthService
     in_progress: bool = False
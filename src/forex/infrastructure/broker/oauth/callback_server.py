@@ -1,5 +1,6 @@
 """OAuth callback server."""
 
+import select
 import time
 import webbrowser
 from collections.abc import Callable
@@ -41,6 +42,7 @@ class CallbackServer:
 
     def __init__(self, redirect_uri: str):
         self._host, self._port, self._path = self._parse_uri(redirect_uri)
+        self._server: HTTPServer | None = None
 
     @staticmethod
     def _parse_uri(redirect_uri: str) -> tuple[str, int, str]:
@@ -83,7 +85,7 @@ class CallbackServer:
             Authorization code, or None on timeout.
         """
         try:
-            server = self._create_server()
+            server = self._get_server()
         except OSError as exc:
             if on_log:
                 on_log(f"⚠️ Unable to start callback server; the port may already be in use: {exc}")
@@ -96,6 +98,22 @@ class CallbackServer:
 
         return self._wait_for_callback(server, timeout_seconds)
 
+    def close(self) -> None:
+        """Release the listening socket."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+
+    def _get_server(self) -> HTTPServer:
+        """Return the bound server, creating it on first use or after close()."""
+        server = self._server
+        if server is None or server.socket.fileno() == -1:
+            server = self._server = self._create_server()
+        # Retries keep the same socket; only the captured callback is reset.
+        server.code = None
+        server.request_path = None
+        return server
+
     def _create_server(self) -> HTTPServer:
         """Create and configure the HTTP server."""
         server = HTTPServer((self._host, self._port), OAuthCallbackHandler)
@@ -106,9 +124,14 @@ class CallbackServer:
     
     def _wait_for_callback(self, server: HTTPServer, timeout_seconds: int) -> str | None:
         """Wait for the callback and return the authorization code."""
-        start_time = time.time()
-
-        while time.time() - start_time < timeout_seconds:
+        deadline = time.monotonic() + timeout_seconds
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            # Block until a connection arrives (or the deadline passes) instead of waking
+            # every server.timeout seconds.
+            readable, _, _ = select.select([server.socket], [], [], remaining)
+            if not readable:
+                break
             server.handle_request()
             if server.code:
                 # Verify that the callback path matches.
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
+from collections.abc import Callable
+from dataclasses import asdict, fields
 from pathlib import Path
 from typing import Any
 
 from forex.ml.rl.envs.trading_env import TradingConfig
+from forex.utils.json_io import read_json, write_json
 
 
 def save_trading_config(
@@ -18,35 +19,46 @@ def save_trading_config(
     payload["discrete_positions"] = list(config.discrete_positions)
     if extra:
         payload.update(extra)
-    Path(path).write_text(json.dumps(payload, ensure_ascii=True, indent=2), encoding="utf-8")
+    write_json(path, payload)
+
+
+def _parse_discrete_positions(value: Any) -> tuple[float, ...] | None:
+    if isinstance(value, (list, tuple)):
+        return tuple(float(item) for item in value)
+    if isinstance(value, str):
+        return tuple(
+            float(item) for item in (part.strip() for part in value.split(",")) if item
+        )
+    return None
+
+
+def _coercer_for(default_value: Any) -> Callable[[Any], Any] | None:
+    # bool first: it is a subclass of int.
+    for kind in (bool, int, float):
+        if isinstance(default_value, kind):
+            return kind
+    return None
+
+
+# Field name -> coercion derived once from the TradingConfig defaults.
+_FIELD_COERCERS: dict[str, Callable[[Any], Any] | None] = {
+    field.name: _coercer_for(field.default) for field in fields(TradingConfig)
+}
 
 
 def load_trading_config(path: str | Path) -> TradingConfig:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    data = read_json(path)
     if not isinstance(data, dict):
         raise ValueError("Trading config must be a JSON object.")
     kwargs: dict[str, Any] = {}
-    defaults = TradingConfig()
-    for key, default_value in asdict(defaults).items():
-        if key not in data:
+    for key, value in data.items():
+        if key not in _FIELD_COERCERS:
             continue
-        value = data[key]
         if key == "discrete_positions":
-            if isinstance(value, (list, tuple)):
-                kwargs[key] = tuple(float(item) for item in value)
-            elif isinstance(value, str):
-                kwargs[key] = tuple(
-                    float(item)
-                    for item in (part.strip() for part in value.split(","))
-                    if item
-                )
+            positions = _parse_discrete_positions(value)
+            if positions is not None:
+                kwargs[key] = positions
             continue
-        if isinstance(default_value, bool):
-            kwargs[key] = bool(value)
-        elif isinstance(default_value, int):
-            kwargs[key] = int(value)
-        elif isinstance(default_value, float):
-            kwargs[key] = float(value)
-        else:
-            kwargs[key] = value
+        coerce = _FIELD_COERCERS[key]
+        kwargs[key] = value if coerce is None else coerce(value)
     return TradingConfig(**kwargs)
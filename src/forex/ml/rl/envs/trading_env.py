@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -20,6 +21,7 @@ def build_window_observation(
     position: float,
     max_position: float,
     window_size: int,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     window_size = max(1, int(window_size))
     width = features.shape[1]
@@ -35,10 +37,13 @@ def build_window_observation(
     denom = float(max_position) if max_position else 1.0
     if denom <= 0.0:
         denom = 1.0
-    position_norm = position / denom
-    return np.concatenate([window.reshape(-1), np.array([position_norm], dtype=np.float32)]).astype(
-        np.float32
-    )
+    # Write the flattened window and position straight into one float32 buffer; callers on a
+    # hot loop can pass ``out`` to reuse it.
+    if out is None:
+        out = np.empty(width * window_size + 1, dtype=np.float32)
+    out[:-1] = window.reshape(-1)
+    out[-1] = position / denom
+    return out
 
 
 def compute_drawdown(equity: float, peak_equity: float) -> float:
@@ -118,6 +123,17 @@ def compute_one_bar_return(closes: np.ndarray, idx: int) -> float:
     return (float(closes[next_idx]) - base_price) / base_price
 
 
+def compute_one_bar_returns(closes: np.ndarray) -> np.ndarray:
+    """``compute_one_bar_return`` for every index at once (float64, 0.0 on the last bar)."""
+    prices = np.asarray(closes, dtype=np.float64)
+    returns = np.zeros(len(prices), dtype=np.float64)
+    if len(prices) > 1:
+        base = prices[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns[:-1] = np.where(base <= 0.0, 0.0, (prices[1:] - base) / base)
+    return returns
+
+
 def compute_vol_target_scale(
     closes: np.ndarray,
     idx: int,
@@ -272,6 +288,18 @@ def simulate_step_transition(
     }
 
 
+def _snap_to_position(value: float, positions: Sequence[float]) -> float:
+    # Nearest grid entry, earliest on ties (same result as ``min`` with a distance key).
+    best = float(positions[0])
+    best_distance = abs(best - value)
+    for candidate in positions[1:]:
+        distance = abs(float(candidate) - value)
+        if distance < best_distance:
+            best = float(candidate)
+            best_distance = distance
+    return best
+
+
 def apply_risk_engine(
     target: float,
     *,
@@ -302,7 +330,7 @@ def apply_risk_engine(
     combined_scale = vol_scale * dd_scale
     value *= combined_scale
     if config.discretize_actions and config.discrete_positions:
-        value = min(config.discrete_positions, key=lambda candidate: abs(float(candidate) - value))
+        value = _snap_to_position(value, config.discrete_positions)
     if config.position_step > 0.0:
         value = round(value / config.position_step) * config.position_step
     effective_max_position = max_position * dd_scale
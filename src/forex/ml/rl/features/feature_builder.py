@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import warnings
 from collections.abc import Sequence
 from dataclasses import dataclass
@@ -9,6 +8,9 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from forex.ml.rl.features import kernels
+from forex.utils.json_io import read_json, write_json
+
 ALPHA4_FEATURE_COLUMNS: tuple[str, ...] = (
     "trend_score",
     "range_score",
@@ -213,11 +215,23 @@ class FeatureScaler:
     names: list[str]
 
 
+# Raw history columns build_feature_frame reads; anything else in the CSV is skipped on load.
+_CSV_DTYPES: dict[str, type] = {
+    "timestamp": str,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+}
+_CSV_COLUMNS = frozenset((*_CSV_DTYPES, "utc_timestamp_minutes"))
+
+
 def load_csv(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = pd.read_csv(path, usecols=_CSV_COLUMNS.__contains__, dtype=_CSV_DTYPES)
     if "utc_timestamp_minutes" in df.columns:
-        df = df.sort_values("utc_timestamp_minutes")
-    return df.reset_index(drop=True)
+        return df.sort_values("utc_timestamp_minutes", kind="stable", ignore_index=True)
+    return df
 
 
 def select_feature_columns(features: pd.DataFrame, selected_names: Sequence[str]) -> pd.DataFrame:
@@ -404,6 +418,14 @@ def build_feature_frame(
     datetimes = _parse_datetimes(df)
     timestamp_text = _timestamp_strings(df, datetimes)
     features_dict: dict[str, pd.Series] = {}
+    # Several features share the same rolling mean of close; compute each window once.
+    close_means: dict[int, pd.Series] = {}
+
+    def close_mean(window: int) -> pd.Series:
+        mean = close_means.get(window)
+        if mean is None:
+            mean = close_means[window] = close.rolling(window).mean()
+        return mean
 
     if wants("vol_z") and "volume" in df.columns:
         volume = df["volume"].astype(float)
@@ -437,7 +459,7 @@ def build_feature_frame(
         features_dict["returns_60"] = returns_60
 
     sma_10_price = (
-        close.rolling(10).mean()
+        close_mean(10)
         if wants("sma_10", "range_strength_10_50_atr14")
         else None
     )
@@ -445,7 +467,7 @@ def build_feature_frame(
     if "sma_10" in requested:
         features_dict["sma_10"] = sma_10
     sma_20_price = (
-        close.rolling(20).mean()
+        close_mean(20)
         if wants(
             "sma_20",
             "trend_strength_20_100_atr14",
@@ -457,7 +479,7 @@ def build_feature_frame(
     if "sma_20" in requested:
         features_dict["sma_20"] = sma_20
     sma_50_price = (
-        close.rolling(50).mean()
+        close_mean(50)
         if wants(
             "sma_50",
             "range_strength_10_50_atr14",
@@ -469,21 +491,21 @@ def build_feature_frame(
     if "sma_50" in requested:
         features_dict["sma_50"] = sma_50
     sma_100 = (
-        close.rolling(100).mean()
+        close_mean(100)
         if wants("trend_strength_20_100_atr14")
         else None
     )
     if "momentum_10_20" in requested:
         features_dict["momentum_10_20"] = (
-            close.rolling(10).mean() / close.rolling(20).mean() - 1.0
+            close_mean(10) / close_mean(20) - 1.0
         )
     if "momentum_20_50" in requested:
         features_dict["momentum_20_50"] = (
-            close.rolling(20).mean() / close.rolling(50).mean() - 1.0
+            close_mean(20) / close_mean(50) - 1.0
         )
     if "momentum_50_100" in requested:
         features_dict["momentum_50_100"] = (
-            close.rolling(50).mean() / close.rolling(100).mean() - 1.0
+            close_mean(50) / close_mean(100) - 1.0
         )
     if "price_z_20" in requested:
         features_dict["price_z_20"] = _rolling_zscore(close, 20)
@@ -529,11 +551,12 @@ def build_feature_frame(
         rolling_std_10 = returns_1.rolling(10).std()
         rolling_std_50 = returns_1.rolling(50).std()
         features_dict["vol_ratio_10_50"] = rolling_std_10 / rolling_std_50.replace(0, np.nan)
+    rolling_std_72 = (
+        returns_1.rolling(72).std() if wants("vol_pct_72_252", "volatility_regime_z") else None
+    )
     if "vol_pct_72_252" in requested:
-        rolling_std_72 = returns_1.rolling(72).std()
         features_dict["vol_pct_72_252"] = _rolling_percentile_rank(rolling_std_72, 252)
     if "volatility_regime_z" in requested:
-        rolling_std_72 = returns_1.rolling(72).std()
         rolling_mean_252 = rolling_std_72.rolling(252, min_periods=min(252, 64)).mean()
         rolling_std_252 = (
             rolling_std_72.rolling(252, min_periods=min(252, 64))
@@ -572,7 +595,6 @@ def build_feature_frame(
     if "trend_flag_25" in requested:
         features_dict["trend_flag_25"] = (adx_14 > 25.0).astype(float)
     if "trend_strength_20_100_atr14" in requested:
-        sma_20_price = close.rolling(20).mean()
         trend_strength = (sma_20_price - sma_100).abs() / (
             (atr_14 * close).replace(0, np.nan) + 1e-8
         )
@@ -682,48 +704,89 @@ def build_feature_frame(
 
     features = pd.DataFrame({name: features_dict[name] for name in selected_order})
 
-    valid = features.dropna().index
-    features = features.loc[valid]
-    closes = close.loc[valid]
-    timestamps = timestamp_text.loc[valid].astype(str).tolist()
+    # One positional NaN mask instead of dropna() plus three label-based gathers.
+    valid = ~np.isnan(features.to_numpy(dtype=float)).any(axis=1)
+    features = features.iloc[valid]
+    closes = close.iloc[valid]
+    timestamps = timestamp_text.iloc[valid].astype(str).tolist()
 
     return features, closes, timestamps
 
 
 def fit_scaler(features: pd.DataFrame) -> FeatureScaler:
-    means = features.mean()
-    stds = features.std().replace(0, np.nan)
+    # Column-major float64 so each column reduces as one contiguous run, as DataFrame.mean
+    # and DataFrame.std do; NaNs are skipped and std uses ddof=1 like pandas.
+    values = np.asfortranarray(features.to_numpy(dtype=np.float64))
+    with warnings.catch_warnings():
+        # All-NaN or single-row columns yield NaN statistics, as in pandas.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        means = values.mean(axis=0)
+        stds = values.std(axis=0, ddof=1)
+        # Only columns holding NaNs need the slower NaN-skipping reductions.
+        gaps = np.isnan(means)
+        if gaps.any():
+            means[gaps] = np.nanmean(values[:, gaps], axis=0)
+            stds[gaps] = np.nanstd(values[:, gaps], axis=0, ddof=1)
+    stds[stds == 0] = np.nan
     return FeatureScaler(
-        means=means.to_numpy(dtype=np.float32),
-        stds=stds.to_numpy(dtype=np.float32),
+        means=means.astype(np.float32),
+        stds=stds.astype(np.float32),
         names=list(features.columns),
     )
 
 
+def scale_features(features: pd.DataFrame, scaler: FeatureScaler) -> np.ndarray:
+    # One row-major float32 copy (frames hand back column-major blocks), then normalize it in
+    # place; callers that need a frame use apply_scaler.
+    values = np.array(features[scaler.names].to_numpy(copy=False), dtype=np.float32, order="C")
+    np.subtract(values, scaler.means, out=values)
+    np.divide(values, scaler.stds, out=values)
+    return np.nan_to_num(values, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+
 def apply_scaler(features: pd.DataFrame, scaler: FeatureScaler) -> pd.DataFrame:
-    aligned = features[scaler.names]
-    values = (aligned.to_numpy(dtype=np.float32) - scaler.means) / scaler.stds
-    values = np.nan_to_num(values, nan=0.0, posinf=0.0, neginf=0.0)
-    return pd.DataFrame(values, columns=scaler.names, index=aligned.index)
+    values = scale_features(features, scaler)
+    return pd.DataFrame(values, columns=scaler.names, index=features.index, copy=False)
 
 
 def save_scaler(scaler: FeatureScaler, path: str | Path) -> None:
-    payload = {
-        "names": list(scaler.names),
-        "means": scaler.means.tolist(),
-        "stds": scaler.stds.tolist(),
-    }
-    Path(path).write_text(json.dumps(payload, ensure_ascii=True, indent=2), encoding="utf-8")
+    if Path(path).suffix == ".npz":
+        save_scaler_npz(scaler, path)
+        return
+    payload = {"names": scaler.names, "means": scaler.means, "stds": scaler.stds}
+    write_json(path, payload)
 
 
 def load_scaler(path: str | Path) -> FeatureScaler:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if Path(path).suffix == ".npz":
+        return load_scaler_npz(path)
+    data = read_json(path)
     names = list(data.get("names", []))
     means = np.array(data.get("means", []), dtype=np.float32)
     stds = np.array(data.get("stds", []), dtype=np.float32)
     return FeatureScaler(means=means, stds=stds, names=names)
 
 
+def save_scaler_npz(scaler: FeatureScaler, path: str | Path) -> None:
+    # Write through a handle so numpy does not append a second ".npz" suffix.
+    with Path(path).open("wb") as handle:
+        np.savez_compressed(
+            handle,
+            names=np.array(scaler.names, dtype=str),
+            means=np.asarray(scaler.means, dtype=np.float32),
+            stds=np.asarray(scaler.stds, dtype=np.float32),
+        )
+
+
+def load_scaler_npz(path: str | Path) -> FeatureScaler:
+    with np.load(path, allow_pickle=False) as data:
+        return FeatureScaler(
+            means=data["means"].astype(np.float32, copy=False),
+            stds=data["stds"].astype(np.float32, copy=False),
+            names=data["names"].tolist(),
+        )
+
+
 def build_features(
     df: pd.DataFrame,
     *,
@@ -734,15 +797,21 @@ def build_features(
     if scaler is not None:
         inferred_profile = infer_feature_profile_from_names(scaler.names)
         features = apply_feature_profile(features, inferred_profile)
-        features = apply_scaler(features, scaler)
     elif normalize:
-        features = apply_scaler(features, fit_scaler(features))
+        scaler = fit_scaler(features)
+
+    if scaler is not None:
+        values = scale_features(features, scaler)
+        names = list(scaler.names)
+    else:
+        values = np.ascontiguousarray(features.to_numpy(dtype=np.float32))
+        names = list(features.columns)
 
     return FeatureSet(
-        features=features.to_numpy(dtype=np.float32),
-        closes=closes.to_numpy(dtype=np.float32),
+        features=values,
+        closes=closes.to_numpy(dtype=np.float64),
         timestamps=timestamps,
-        names=list(features.columns),
+        names=names,
     )
 
 
@@ -975,32 +1044,45 @@ def _build_core20_alpha_layer(features: pd.DataFrame) -> pd.DataFrame:
 
 
 def _rsi(close: pd.Series, period: int) -> pd.Series:
+    if kernels.NUMBA_AVAILABLE:
+        return pd.Series(
+            kernels.rsi_wilder(close.to_numpy(dtype=np.float64), period), index=close.index
+        )
+    # Wilder smoothing (alpha = 1/period); min_periods keeps the rolling warmup length.
     delta = close.diff()
-    gain = delta.clip(lower=0).rolling(period).mean()
-    loss = (-delta.clip(upper=0)).rolling(period).mean()
-    rs = gain / loss.replace(0, np.nan)
-    rsi = 100 - (100 / (1 + rs))
+    alpha = 1.0 / period
+    gain = (
+        delta.clip(lower=0).ewm(alpha=alpha, adjust=False, min_periods=period).mean().to_numpy()
+    )
+    loss = (
+        (-delta.clip(upper=0)).ewm(alpha=alpha, adjust=False, min_periods=period).mean().to_numpy()
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - (100.0 / (1.0 + gain / np.where(loss == 0, np.nan, loss)))
     zero_gain = gain <= 1e-12
     zero_loss = loss <= 1e-12
-    both_zero = zero_gain & zero_loss
-    rsi = rsi.mask(zero_loss & ~zero_gain, 100.0)
-    rsi = rsi.mask(zero_gain & ~zero_loss, 0.0)
-    rsi = rsi.mask(both_zero, 50.0)
-    return rsi
+    rsi = np.where(zero_loss & ~zero_gain, 100.0, rsi)
+    rsi = np.where(zero_gain & ~zero_loss, 0.0, rsi)
+    rsi = np.where(zero_gain & zero_loss, 50.0, rsi)
+    return pd.Series(rsi, index=close.index)
 
 
 def _atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int) -> pd.Series:
-    prev_close = close.shift(1)
-    ranges = pd.concat(
-        [
-            high - low,
-            (high - prev_close).abs(),
-            (low - prev_close).abs(),
-        ],
-        axis=1,
+    high_np = high.to_numpy(dtype=float)
+    low_np = low.to_numpy(dtype=float)
+    if kernels.NUMBA_AVAILABLE:
+        close_np = close.to_numpy(dtype=float)
+        return pd.Series(kernels.atr_wilder(high_np, low_np, close_np, period), index=close.index)
+    prev_close = close.shift(1).to_numpy(dtype=float)
+    # fmax skips NaN like DataFrame.max(axis=1), so the first bar still gets high - low.
+    true_range = np.fmax.reduce(
+        [high_np - low_np, np.abs(high_np - prev_close), np.abs(low_np - prev_close)]
+    )
+    return (
+        pd.Series(true_range, index=close.index)
+        .ewm(alpha=1.0 / period, adjust=False, min_periods=period)
+        .mean()
     )
-    true_range = ranges.max(axis=1)
-    return true_range.rolling(period).mean()
 
 
 def _rolling_zscore(series: pd.Series, period: int) -> pd.Series:
@@ -0,0 +1,103 @@
+"""Single-pass loops for the recursive indicators, compiled with numba when it is installed.
+
+Without numba the functions stay plain Python; feature_builder only routes through them
+when ``NUMBA_AVAILABLE`` is true and otherwise keeps its vectorized pandas path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _jit(func):
+    # No fastmath: the loops rely on NaN comparisons to track warm-up and gaps.
+    return func if njit is None else njit(cache=True)(func)
+
+
+@_jit
+def wilder_ewm(values: np.ndarray, period: int) -> np.ndarray:
+    """Match ``Series.ewm(alpha=1/period, adjust=False, min_periods=period).mean()``."""
+    n = values.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    alpha = 1.0 / period
+    decay = 1.0 - alpha
+    weighted = values[0]
+    nobs = 1 if weighted == weighted else 0
+    out[0] = weighted if nobs >= period else np.nan
+    old_wt = 1.0
+    for i in range(1, n):
+        cur = values[i]
+        is_observation = cur == cur
+        if is_observation:
+            nobs += 1
+        if weighted == weighted:
+            # Gaps keep decaying the old weight, as pandas does with ignore_na=False.
+            old_wt *= decay
+            if is_observation:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted if nobs >= period else np.nan
+    return out
+
+
+@_jit
+def rsi_wilder(close: np.ndarray, period: int) -> np.ndarray:
+    n = close.shape[0]
+    gains = np.empty(n)
+    losses = np.empty(n)
+    if n > 0:
+        gains[0] = np.nan
+        losses[0] = np.nan
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta != delta:
+            gains[i] = np.nan
+            losses[i] = np.nan
+        else:
+            gains[i] = delta if delta > 0.0 else 0.0
+            losses[i] = -delta if delta < 0.0 else 0.0
+    avg_gain = wilder_ewm(gains, period)
+    avg_loss = wilder_ewm(losses, period)
+    out = np.empty(n)
+    for i in range(n):
+        gain = avg_gain[i]
+        loss = avg_loss[i]
+        zero_gain = gain <= 1e-12
+        zero_loss = loss <= 1e-12
+        if zero_gain and zero_loss:
+            out[i] = 50.0
+        elif zero_loss:
+            out[i] = 100.0
+        elif zero_gain:
+            out[i] = 0.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + gain / loss)
+    return out
+
+
+@_jit
+def atr_wilder(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    n = close.shape[0]
+    true_range = np.empty(n)
+    for i in range(n):
+        value = high[i] - low[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            # NaN-skipping max, like np.fmax.reduce.
+            for candidate in (abs(high[i] - prev_close), abs(low[i] - prev_close)):
+                if value != value or candidate > value:
+                    value = candidate
+        true_range[i] = value
+    return wilder_ewm(true_range, period)
@@ -7,7 +7,65 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
-_ATTEMPT_RE = re.compile(r"attempt\s+(\d+)", re.IGNORECASE)
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+# A reconnect is only scheduled when the notice carries its attempt counter.
+_RECONNECT_ATTEMPT_RE = re.compile(r"reconnecting in.*?attempt(?:\s+(\d+))?", re.IGNORECASE)
+
+# Stats counter -> case-insensitive literals that mark the event on a line.
+_EVENT_LITERALS: dict[str, tuple[str, ...]] = {
+    "disconnect_events": ("detected disconnect", "[network] disconnected"),
+    "reconnect_scheduled": ("reconnecting in",),
+    "connect_started": ("connecting to ctrader",),
+    "connected": ("connected!",),
+    "app_auth_sent": ("sending application authentication",),
+    "app_auth_success": ("application authentication succeeded", "application authorized"),
+    "account_auth_success": ("account authentication succeeded", "account authorized"),
+    "funds_timeout": ("[timeout] account funds request timed out",),
+    "request_deferred": ("request timed out or failed",),
+    "dns_lookup_failed": ("dns lookup failed",),
+    "app_auth_timeout": ("app authentication timed out",),
+    "runtime_stalled": ("runtime_stalled",),
+    "runtime_resume": ("runtime_resume",),
+    "lockout": ("lockout",),
+}
+# (counter, literal) pairs for the per-line containment checks. Each literal is
+# tested on its own, so overlapping tokens ("connected!" inside "disconnected!")
+# are all counted.
+_EVENT_CHECKS: tuple[tuple[str, str], ...] = tuple(
+    (key, literal) for key, literals in _EVENT_LITERALS.items() for literal in literals
+)
+
+
+def _build_event_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for key, literals in _EVENT_LITERALS.items():
+        for literal in literals:
+            automaton.add_word(literal, key)
+    automaton.make_automaton()
+    return automaton
+
+
+# Literals are lower-case, so the automaton scans the lowered line; it reports
+# overlapping matches natively.
+_EVENT_AUTOMATON = _build_event_automaton()
+
+
+def _substring_events(line: str) -> set[str]:
+    lower = line.lower()
+    return {key for key, literal in _EVENT_CHECKS if literal in lower}
+
+
+def _automaton_events(line: str) -> set[str]:
+    return {key for _, key in _EVENT_AUTOMATON.iter(line.lower())}
+
+
+_match_events = _substring_events if _EVENT_AUTOMATON is None else _automaton_events
 
 
 @dataclass
@@ -37,45 +95,28 @@ class ReconnectLogStats:
 
 
 def analyze_reconnect_log(lines: Iterable[str]) -> ReconnectLogStats:
-    normalized_lines = [str(raw or "") for raw in lines]
-    stats = ReconnectLogStats(lines=len(normalized_lines))
-    for line in normalized_lines:
+    counters = dict.fromkeys(_EVENT_LITERALS, 0)
+    line_count = 0
+    max_attempt = 0
+    for line in lines:
+        line_count += 1
         if not line:
             continue
-        lower = line.lower()
-
-        if "detected disconnect" in lower or "[network] disconnected" in lower:
-            stats.disconnect_events += 1
-        if "reconnecting in" in lower and "attempt" in lower:
-            stats.reconnect_scheduled += 1
-            m = _ATTEMPT_RE.search(line)
-            if m:
-                stats.max_attempt = max(stats.max_attempt, int(m.group(1)))
-        if "connecting to ctrader" in lower:
-            stats.connect_started += 1
-        if "connected!" in lower:
-            stats.connected += 1
-        if "sending application authentication" in lower:
-            stats.app_auth_sent += 1
-        if "application authentication succeeded" in lower or "application authorized" in lower:
-            stats.app_auth_success += 1
-        if "account authentication succeeded" in lower or "account authorized" in lower:
-            stats.account_auth_success += 1
-        if "[timeout] account funds request timed out" in lower:
-            stats.funds_timeout += 1
-        if "request timed out or failed" in lower and "deferred" in lower:
-            stats.request_deferred += 1
-        if "dns lookup failed" in lower:
-            stats.dns_lookup_failed += 1
-        if "app authentication timed out" in lower:
-            stats.app_auth_timeout += 1
-        if "runtime_stalled" in lower:
-            stats.runtime_stalled += 1
-        if "runtime_resume" in lower:
-            stats.runtime_resume += 1
-        if "authorization lockout" in lower or "lockout" in lower:
-            stats.lockout += 1
-    return stats
+        matched = _match_events(line)
+        if not matched:
+            continue
+        # Compound events need a second token; only lines that already matched pay for it.
+        if "reconnect_scheduled" in matched:
+            m = _RECONNECT_ATTEMPT_RE.search(line)
+            if m is None:
+                matched.discard("reconnect_scheduled")
+            elif m.group(1):
+                max_attempt = max(max_attempt, int(m.group(1)))
+        if "request_deferred" in matched and "deferred" not in line.lower():
+            matched.discard("request_deferred")
+        for key in matched:
+            counters[key] += 1
+    return ReconnectLogStats(lines=line_count, max_attempt=max_attempt, **counters)
 
 
 def render_summary(stats: ReconnectLogStats) -> str:
@@ -103,10 +144,6 @@ def render_summary(stats: ReconnectLogStats) -> str:
     )
 
 
-def _read_lines(path: Path) -> list[str]:
-    return path.read_text(encoding="utf-8", errors="replace").splitlines()
-
-
 def _find_matching_logs(base_dir: Path, basename: str) -> list[Path]:
     if not basename:
         return []
@@ -121,10 +158,19 @@ def _find_matching_logs(base_dir: Path, basename: str) -> list[Path]:
         "node_modules",
     }
     matches: list[Path] = []
-    for root, dirs, files in os.walk(base_dir):
-        dirs[:] = [d for d in dirs if d not in ignore_dirs]
-        if basename in files:
-            matches.append(Path(root) / basename)
+    # scandir reuses the directory entry type, so no entry is stat'ed while walking.
+    stack = [str(base_dir)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ignore_dirs:
+                            stack.append(entry.path)
+                    elif entry.name == basename and entry.is_file():
+                        matches.append(Path(entry.path))
+        except OSError:
+            continue
     return matches
 
 
@@ -174,8 +220,8 @@ def main() -> int:
         return 2
     if info:
         print(info)
-    lines = _read_lines(resolved)
-    stats = analyze_reconnect_log(lines)
+    with resolved.open("r", encoding="utf-8", errors="replace") as log:
+        stats = analyze_reconnect_log(log)
     print(f"log_file: {resolved}")
     print(render_summary(stats))
     return 0
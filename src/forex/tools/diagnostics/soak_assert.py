@@ -75,10 +75,6 @@ def evaluate_soak(stats: ReconnectLogStats, thresholds: SoakThresholds) -> list[
     return failures
 
 
-def _read_lines(path: Path) -> list[str]:
-    return path.read_text(encoding="utf-8", errors="replace").splitlines()
-
-
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Evaluate reconnect soak log against pass/fail thresholds."
@@ -111,8 +107,8 @@ def main() -> int:
     if info:
         print(info)
 
-    lines = _read_lines(resolved)
-    stats = analyze_reconnect_log(lines)
+    with resolved.open("r", encoding="utf-8", errors="replace") as log:
+        stats = analyze_reconnect_log(log)
     thresholds = SoakThresholds(
         min_app_auth_success=max(0, int(args.min_app_auth_success)),
         min_account_auth_success=max(0, int(args.min_account_auth_success)),
@@ -64,7 +64,7 @@ def load_baseline_bundle(
             pass
     return BaselineBundle(
         features=features_frame,
-        closes=closes.to_numpy(dtype=np.float32),
+        closes=closes.to_numpy(dtype=np.float64),
         timestamps=list(timestamps),
         config=config,
     )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import argparse
 import signal
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -16,7 +16,7 @@ from forex.ml.rl.envs.trading_env import (
     apply_risk_engine,
     build_window_observation,
     compute_drawdown,
-    compute_one_bar_return,
+    compute_one_bar_returns,
     decode_policy_action,
     simulate_step_transition,
 )
@@ -31,6 +31,9 @@ from forex.ml.rl.features.feature_builder import (
 )
 from forex.utils.metrics import compute_sharpe_ratio_from_equity
 
+# should_stop is polled on the first bar and then once per 1024 bars.
+_STOP_POLL_MASK = 1023
+
 
 @dataclass
 class PlaybackBundle:
@@ -89,24 +92,119 @@ class PlaybackResult:
     gate_reasons: list[str]
 
 
+def _direct_policy_predict(model) -> Callable[[np.ndarray], np.ndarray] | None:
+    """Deterministic batch forward through an SB3 policy, skipping PPO.predict's wrappers.
+
+    Mirrors BasePolicy.predict for an already batched float32 observation matrix: no
+    per-call shape validation or train-mode toggling. Returns None for models without an
+    SB3 policy; playback then calls ``model.predict`` one observation at a time.
+    """
+    policy = getattr(model, "policy", None)
+    if not (hasattr(policy, "_predict") and hasattr(policy, "set_training_mode")):
+        return None
+    import torch
+
+    policy.set_training_mode(False)
+    action_space = policy.action_space
+    action_shape = tuple(action_space.shape or ())
+    # Box spaces expose bounds; discrete actions pass through untouched.
+    is_box = getattr(action_space, "low", None) is not None
+    squash_output = bool(getattr(policy, "squash_output", False))
+
+    def predict(obs: np.ndarray) -> np.ndarray:
+        # inference_mode also skips view and version-counter tracking, unlike no_grad.
+        with torch.inference_mode():
+            obs_tensor = torch.as_tensor(obs, device=policy.device)
+            actions = policy._predict(obs_tensor, deterministic=True)
+        actions = actions.cpu().numpy().reshape((-1, *action_shape))
+        if is_box:
+            if squash_output:
+                actions = policy.unscale_action(actions)
+            else:
+                actions = np.clip(actions, action_space.low, action_space.high)
+        return actions
+
+    return predict
+
+
+class _BatchedPolicy:
+    """Deterministic policy actions for consecutive bars, predicted a batch at a time.
+
+    Observations for neighbouring bars differ only in the trailing position column, so a
+    batch assumes the position is held and is dropped from the first bar where it was not.
+    The batch length follows how long positions were actually held, so frequent position
+    changes degrade to roughly one predict call per bar instead of wasting whole batches.
+    """
+
+    def __init__(
+        self,
+        bundle: PlaybackBundle,
+        max_batch: int,
+        forward: Callable[[np.ndarray], np.ndarray],
+    ) -> None:
+        self._bundle = bundle
+        self._max_batch = max(1, int(max_batch))
+        self._batch_len = self._max_batch
+        self._start = 0
+        self._position = 0.0
+        self._actions: np.ndarray | None = None
+        self._forward = forward
+        window_size = max(1, int(getattr(bundle.config, "window_size", 1)))
+        # One observation matrix for every batch; predicted actions never alias it.
+        self._obs = np.empty(
+            (self._max_batch, bundle.features.shape[1] * window_size + 1), dtype=np.float32
+        )
+        self._window_size = window_size
+
+    @classmethod
+    def create(cls, bundle: PlaybackBundle, max_batch: int) -> _BatchedPolicy | None:
+        """Return a batcher, or None when the model has no SB3 policy to batch through."""
+        forward = _direct_policy_predict(bundle.model)
+        if forward is None:
+            return None
+        return cls(bundle, max_batch, forward)
+
+    def predict(self, idx: int, position: float, stop: int):
+        actions = self._actions
+        if actions is not None:
+            offset = idx - self._start
+            if position == self._position and 0 <= offset < len(actions):
+                return actions[offset]
+            self._batch_len = min(self._max_batch, max(1, 2 * offset))
+        config = self._bundle.config
+        rows = min(stop, idx + self._batch_len) - idx
+        obs = self._obs[:rows]
+        for offset in range(rows):
+            build_window_observation(
+                self._bundle.features,
+                idx + offset,
+                position=position,
+                max_position=config.max_position,
+                window_size=self._window_size,
+                out=obs[offset],
+            )
+        self._actions = self._forward(obs)
+        self._start = idx
+        self._position = position
+        return self._actions[0]
+
+
+def _longest_run(mask: np.ndarray) -> int:
+    # Rising/falling edges of the padded mask pair up into [start, end) runs.
+    edges = np.flatnonzero(np.diff(mask.astype(np.int8), prepend=0, append=0))
+    if edges.size == 0:
+        return 0
+    return int((edges[1::2] - edges[::2]).max())
+
+
 def _streak_stats(values: list[float]) -> tuple[int, int]:
-    max_win = 0
-    max_loss = 0
-    current_win = 0
-    current_loss = 0
-    for value in values:
-        if value > 0:
-            current_win += 1
-            current_loss = 0
-        elif value < 0:
-            current_loss += 1
-            current_win = 0
-        else:
-            current_win = 0
-            current_loss = 0
-        max_win = max(max_win, current_win)
-        max_loss = max(max_loss, current_loss)
-    return max_win, max_loss
+    pnls = np.asarray(values, dtype=np.float64)
+    return _longest_run(pnls > 0), _longest_run(pnls < 0)
+
+
+def _same_sign(a: float, b: float) -> bool:
+    # np.sign(a) == np.sign(b) without the numpy scalar round trip (NaN never matches).
+    return (a > 0.0 and b > 0.0) or (a < 0.0 and b < 0.0) or (a == 0.0 and b == 0.0)
 
 
 def _split_transition_cost(
@@ -118,13 +216,11 @@ def _split_transition_cost(
     new_abs = abs(float(new_position))
     if old_abs <= 1e-12 and new_abs <= 1e-12:
         return 0.0, 0.0
-    old_sign = float(np.sign(old_position))
-    new_sign = float(np.sign(new_position))
     if old_abs <= 1e-12:
         return 0.0, new_abs * cost_rate
     if new_abs <= 1e-12:
         return old_abs * cost_rate, 0.0
-    if old_sign == new_sign:
+    if _same_sign(float(old_position), float(new_position)):
         if new_abs >= old_abs:
             return 0.0, (new_abs - old_abs) * cost_rate
         return (old_abs - new_abs) * cost_rate, 0.0
@@ -144,7 +240,7 @@ def _classify_position_change(
         return "open"
     if old_abs > eps and new_abs <= eps:
         return "close"
-    if np.sign(old_position) != np.sign(new_position):
+    if not _same_sign(float(old_position), float(new_position)):
         return "reversal"
     return "resize"
 
@@ -253,7 +349,7 @@ def _apply_action_gate(
         return 0.0
     if abs(float(current_position)) <= eps:
         return 0.0
-    if np.sign(raw_target) == np.sign(current_position) and abs(float(raw_target)) > eps:
+    if _same_sign(float(raw_target), float(current_position)) and abs(float(raw_target)) > eps:
         return float(current_position)
     return 0.0
 
@@ -299,6 +395,50 @@ def _apply_policy_envelope(
     )
 
 
+def resolve_policy_exit_thresholds(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+) -> tuple[float | None, float | None]:
+    """Validate the policy-envelope CLI options shared by playback and walk-forward runs.
+
+    Returns the long/short exit thresholds (defaulting to the entry thresholds), or
+    ``(None, None)`` when no envelope option was given. Invalid combinations exit through
+    ``parser.error``.
+    """
+    policy_enabled = (
+        args.long_threshold is not None
+        or args.short_threshold is not None
+        or bool(list(args.action_gate))
+        or bool(list(args.threshold_bump))
+    )
+    if not policy_enabled:
+        return None, None
+    if args.long_threshold is None or args.short_threshold is None:
+        parser.error(
+            "--long-threshold and --short-threshold are required "
+            "when policy envelope options are used"
+        )
+    if float(args.short_threshold) >= float(args.long_threshold):
+        parser.error("--short-threshold must be < --long-threshold")
+    long_exit_threshold = (
+        float(args.long_threshold)
+        if args.long_exit_threshold is None
+        else float(args.long_exit_threshold)
+    )
+    short_exit_threshold = (
+        float(args.short_threshold)
+        if args.short_exit_threshold is None
+        else float(args.short_exit_threshold)
+    )
+    if long_exit_threshold > float(args.long_threshold):
+        parser.error("--long-exit-threshold must be <= --long-threshold")
+    if short_exit_threshold < float(args.short_threshold):
+        parser.error("--short-exit-threshold must be >= --short-threshold")
+    if short_exit_threshold >= long_exit_threshold:
+        parser.error("--short-exit-threshold must be < --long-exit-threshold")
+    return long_exit_threshold, short_exit_threshold
+
+
 def load_playback_bundle(
     *,
     data_path: str,
@@ -382,8 +522,9 @@ def load_playback_bundle(
         )
 
     return PlaybackBundle(
-        features=features_frame.to_numpy(dtype=np.float32),
-        closes=closes.to_numpy(dtype=np.float32),
+        # Row-major so each bar's feature row is one contiguous read.
+        features=np.ascontiguousarray(features_frame.to_numpy(dtype=np.float32)),
+        closes=closes.to_numpy(dtype=np.float64),
         timestamps=list(timestamps),
         config=config,
         model=model,
@@ -398,28 +539,68 @@ def load_playback_bundle(
     )
 
 
+def replay_target_positions(
+    bundle: PlaybackBundle,
+    targets: np.ndarray | Sequence[float],
+    start_index: int,
+    *,
+    cost_rates: np.ndarray | Sequence[float] | None = None,
+) -> np.ndarray:
+    """Equity curves for known per-bar target positions, one row per path.
+
+    Once targets are fixed the playback accounting has no feedback left: each bar's growth
+    depends only on the previous and new target and the bar return, so equity is a
+    cumulative product. ``targets`` is ``(steps,)`` or ``(paths, steps)``; ``cost_rates``
+    optionally gives each path its own transaction+slippage rate for cost sweeps. Rows
+    match run_playback's step-by-step equity exactly for the same targets and costs.
+    """
+    paths = np.atleast_2d(np.asarray(targets, dtype=np.float64))
+    steps = paths.shape[1]
+    if cost_rates is None:
+        cost_rate = np.full(
+            (len(paths), 1),
+            (float(bundle.config.transaction_cost_bps) + float(bundle.config.slippage_bps))
+            / 10000.0,
+        )
+    else:
+        cost_rate = np.asarray(cost_rates, dtype=np.float64).reshape(-1, 1)
+    holding_cost_rate = float(bundle.config.holding_cost_bps) / 10000.0
+    bar_returns = np.zeros(steps)
+    window = compute_one_bar_returns(bundle.closes[start_index : start_index + steps + 1])
+    bar_returns[: min(steps, len(window))] = window[:steps]
+    # Each bar earns on the position held coming into it; the first bar starts flat.
+    held = np.zeros_like(paths)
+    held[:, 1:] = paths[:, :-1]
+    net_returns = (
+        held * bar_returns
+        - np.abs(paths - held) * cost_rate
+        - np.abs(held) * holding_cost_rate
+    )
+    # cumprod multiplies in bar order, so equity matches the step-by-step product exactly.
+    return np.cumprod(np.maximum(1e-12, 1.0 + net_returns), axis=1)
+
+
+def simulate_fixed_positions(
+    bundle: PlaybackBundle,
+    positions: Sequence[float],
+    start_index: int,
+    steps: int,
+) -> np.ndarray:
+    """Final equity of holding each fixed position over the same window, in one pass."""
+    targets = np.asarray(positions, dtype=np.float64).reshape(-1, 1)
+    if steps <= 0:
+        return np.ones(len(targets))
+    paths = np.repeat(targets, steps, axis=1)
+    return replay_target_positions(bundle, paths, start_index)[:, -1]
+
+
 def simulate_fixed_position(
     bundle: PlaybackBundle,
     position: float,
     start_index: int,
     steps: int,
 ) -> tuple[float, float]:
-    equity = 1.0
-    peak_equity = 1.0
-    current_position = 0.0
-    cost_rate = (
-        float(bundle.config.transaction_cost_bps) + float(bundle.config.slippage_bps)
-    ) / 10000.0
-    holding_cost_rate = float(bundle.config.holding_cost_bps) / 10000.0
-    for idx in range(start_index, start_index + steps):
-        cost = abs(float(position) - float(current_position)) * cost_rate
-        holding_cost = abs(float(current_position)) * holding_cost_rate
-        realized_return = compute_one_bar_return(bundle.closes, idx)
-        net_return = (float(current_position) * realized_return) - cost - holding_cost
-        growth_factor = max(1e-12, 1.0 + net_return)
-        equity *= growth_factor
-        peak_equity = max(peak_equity, equity)
-        current_position = position
+    equity = float(simulate_fixed_positions(bundle, [position], start_index, steps)[0])
     return equity, equity - 1.0
 
 
@@ -434,6 +615,8 @@ def run_playback(
     equity_log_path: str = "",
     equity_log_every: int = 200,
     should_stop: Callable[[], bool] | None = None,
+    inference_batch_size: int = 0,
+    raw_actions_out: list[float] | None = None,
 ) -> PlaybackResult:
     state = SimState()
     start_idx = max(0, int(start_index))
@@ -454,20 +637,22 @@ def run_playback(
         log_path = Path(equity_log_path)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         equity_log_file = log_path.open("w", encoding="utf-8")
-        equity_log_file.write("step,equity\n")
+    # Sampled points are kept in memory and written in one go when playback ends.
+    log_steps = np.empty(step_limit // log_every_n if equity_log_file else 0, dtype=np.int64)
+    log_equity = np.empty(len(log_steps), dtype=np.float64)
+    log_count = 0
 
     peak_equity = state.equity
     peak_step = 0
-    equity_series = [state.equity]
+    equity_series = np.empty(step_limit + 1, dtype=np.float64)
+    equity_series[0] = state.equity
     max_drawdown = 0.0
     drawdown_peak_step = 0
     drawdown_trough_step = 0
     drawdown_peak_equity = state.equity
     drawdown_trough_equity = state.equity
-    action_sum = 0.0
-    action_long = 0
-    action_short = 0
-    action_flat = 0
+    # Executed targets per bar; the action distribution is reduced from it after the loop.
+    target_positions = np.empty(step_limit, dtype=np.float64)
     opens = 0
     closes = 0
     reversals = 0
@@ -476,7 +661,6 @@ def run_playback(
     trade_pnls: list[float] = []
     trade_costs: list[float] = []
     holding_steps: list[int] = []
-    action_abs_sum = 0.0
     current_trade_growth: float | None = None
     current_trade_cost: float = 0.0
     current_trade_start_step: int | None = None
@@ -484,44 +668,74 @@ def run_playback(
     cost_rate = (
         float(bundle.config.transaction_cost_bps) + float(bundle.config.slippage_bps)
     ) / 10000.0
+    holding_cost_rate = float(bundle.config.holding_cost_bps) / 10000.0
+    stop_idx = start_idx + step_limit
+    # Only the played window; walk-forward evaluation replays short segments of one bundle.
+    bar_returns = compute_one_bar_returns(bundle.closes[start_idx : stop_idx + 1]).tolist()
+    window_size = max(1, int(getattr(bundle.config, "window_size", 1)))
+    obs_buffer = np.empty(bundle.features.shape[1] * window_size + 1, dtype=np.float32)
+    action_scale = max(float(bundle.action_scale), 0.0)
+    policy_enabled = _policy_enabled(bundle)
+    if policy_enabled:
+        # Loop-invariant envelope inputs as plain Python floats and bools.
+        long_threshold = float(bundle.long_threshold)
+        short_threshold = float(bundle.short_threshold)
+        long_exit_threshold = float(bundle.long_exit_threshold)
+        short_exit_threshold = float(bundle.short_exit_threshold)
+        action_gate_mode = str(bundle.action_gate_mode)
+        threshold_bumps = (
+            np.asarray(bundle.threshold_bumps, dtype=np.float64).tolist()
+            if bundle.threshold_bumps is not None
+            else []
+        )
+        gate_mask = (
+            np.asarray(bundle.action_gate_mask, dtype=bool).tolist()
+            if bundle.action_gate_mask is not None
+            else []
+        )
+    # Stochastic actions are sampled per call, so only deterministic playback is batched.
+    batched_policy = (
+        _BatchedPolicy.create(bundle, inference_batch_size)
+        if inference_batch_size > 1 and not stochastic
+        else None
+    )
 
     try:
-        for idx in range(start_idx, start_idx + step_limit):
-            if should_stop and should_stop():
+        for idx in range(start_idx, stop_idx):
+            poll_stop = should_stop is not None and (idx - start_idx) & _STOP_POLL_MASK == 0
+            if poll_stop and should_stop():
                 break
 
             last_idx = idx
             step_num = idx - start_idx + 1
-            obs = build_window_observation(
-                bundle.features,
-                idx,
-                position=state.position,
-                max_position=bundle.config.max_position,
-                window_size=getattr(bundle.config, "window_size", 1),
-            )
-            action, _ = bundle.model.predict(obs, deterministic=not stochastic)
-            target_raw = decode_policy_action(action, config=bundle.config)
-            target_raw *= max(float(bundle.action_scale), 0.0)
-            if _policy_enabled(bundle):
-                threshold_bump = (
-                    float(bundle.threshold_bumps[idx])
-                    if bundle.threshold_bumps is not None and len(bundle.threshold_bumps) > idx
-                    else 0.0
-                )
-                gate_enabled = (
-                    bool(bundle.action_gate_mask[idx])
-                    if bundle.action_gate_mask is not None and len(bundle.action_gate_mask) > idx
-                    else True
+            if batched_policy is not None:
+                action = batched_policy.predict(idx, state.position, stop_idx)
+            else:
+                obs = build_window_observation(
+                    bundle.features,
+                    idx,
+                    position=state.position,
+                    max_position=bundle.config.max_position,
+                    window_size=window_size,
+                    out=obs_buffer,
                 )
+                action, _ = bundle.model.predict(obs, deterministic=not stochastic)
+            target_raw = decode_policy_action(action, config=bundle.config)
+            target_raw *= action_scale
+            if raw_actions_out is not None:
+                raw_actions_out.append(target_raw)
+            if policy_enabled:
+                threshold_bump = threshold_bumps[idx] if len(threshold_bumps) > idx else 0.0
+                gate_enabled = gate_mask[idx] if len(gate_mask) > idx else True
                 target_raw = _apply_policy_envelope(
                     target_raw,
                     current_position=state.position,
                     gate_enabled=gate_enabled,
-                    action_gate_mode=str(bundle.action_gate_mode),
-                    long_threshold=float(bundle.long_threshold) + threshold_bump,
-                    short_threshold=float(bundle.short_threshold) - threshold_bump,
-                    long_exit_threshold=float(bundle.long_exit_threshold),
-                    short_exit_threshold=float(bundle.short_exit_threshold),
+                    action_gate_mode=action_gate_mode,
+                    long_threshold=long_threshold + threshold_bump,
+                    short_threshold=short_threshold - threshold_bump,
+                    long_exit_threshold=long_exit_threshold,
+                    short_exit_threshold=short_exit_threshold,
                 )
             target_position, risk_info = apply_risk_engine(
                 target_raw,
@@ -533,14 +747,7 @@ def run_playback(
                 peak_equity=peak_equity,
             )
 
-            action_sum += target_position
-            action_abs_sum += abs(target_position)
-            if target_position > 0.05:
-                action_long += 1
-            elif target_position < -0.05:
-                action_short += 1
-            else:
-                action_flat += 1
+            target_positions[step_num - 1] = target_position
 
             delta = target_position - state.position
             if abs(delta) > 1e-6:
@@ -554,77 +761,73 @@ def run_playback(
                 elif change_kind == "resize":
                     resizes += 1
 
-            transition = simulate_step_transition(
-                current_position=state.position,
-                target_position=target_position,
-                closes=bundle.closes,
-                idx=idx,
-                equity=state.equity,
-                peak_equity=peak_equity,
-                config=bundle.config,
-            )
+            # Same cost terms as simulate_step_transition; its reward is only needed for logs.
+            step_cost = abs(delta) * cost_rate
+            holding_cost = abs(state.position) * holding_cost_rate
             exit_cost, entry_cost = _split_transition_cost(
                 state.position,
                 target_position,
                 cost_rate,
             )
-            realized_price_return = compute_one_bar_return(bundle.closes, idx)
-            realized_step_pnl = float(state.position) * float(realized_price_return)
-            realized_net_return = (
-                realized_step_pnl
-                - float(transition["cost"])
-                - float(transition["holding_cost"])
-            )
+            realized_step_pnl = state.position * bar_returns[step_num - 1]
+            realized_net_return = realized_step_pnl - step_cost - holding_cost
             growth_factor = max(1e-12, 1.0 + realized_net_return)
             if abs(state.position) > 1e-6:
                 if current_trade_growth is None:
                     current_trade_growth = 1.0
                     current_trade_cost = 0.0
-                trade_bar_net = (
-                    realized_step_pnl
-                    - exit_cost
-                    - float(transition["holding_cost"])
-                )
-                current_trade_growth *= max(1e-12, 1.0 + float(trade_bar_net))
-                current_trade_cost += float(exit_cost + transition["holding_cost"])
+                trade_bar_net = realized_step_pnl - exit_cost - holding_cost
+                current_trade_growth *= max(1e-12, 1.0 + trade_bar_net)
+                current_trade_cost += exit_cost + holding_cost
             if abs(delta) > 1e-6:
-                execution_idx = idx + 1
-                current_time = (
-                    bundle.timestamps[execution_idx]
-                    if execution_idx < len(bundle.timestamps)
-                    else "-"
-                )
                 if change_kind == "resize" and current_trade_growth is not None:
                     current_trade_growth *= max(1e-12, 1.0 - entry_cost)
-                    current_trade_cost += float(entry_cost)
+                    current_trade_cost += entry_cost
                 if (
                     change_kind in {"close", "reversal"}
                     and abs(state.position) > 1e-6
                     and current_trade_growth is not None
                 ):
                     trade_pnl = current_trade_growth - 1.0
-                    trade_pnls.append(float(trade_pnl))
-                    trade_costs.append(float(current_trade_cost))
+                    trade_pnls.append(trade_pnl)
+                    trade_costs.append(current_trade_cost)
                     if current_trade_start_step is not None:
                         holding_steps.append(step_num - current_trade_start_step)
                     if not quiet:
+                        # The trade executes on the next bar.
+                        execution_idx = idx + 1
+                        current_time = (
+                            bundle.timestamps[execution_idx]
+                            if execution_idx < len(bundle.timestamps)
+                            else "-"
+                        )
                         print(
                             f"Trade @ {current_time} "
                             f"pos={state.position:.3f} -> {target_position:.3f} "
                             f"net_return={trade_pnl:.6g} cost={current_trade_cost:.6g} "
-                            f"holding={transition['holding_cost']:.6g}"
+                            f"holding={holding_cost:.6g}"
                         )
                     current_trade_growth = None
                     current_trade_cost = 0.0
                     current_trade_start_step = None
                 if change_kind in {"open", "reversal"} and abs(target_position) > 1e-6:
                     current_trade_growth = max(1e-12, 1.0 - entry_cost)
-                    current_trade_cost = float(entry_cost)
+                    current_trade_cost = entry_cost
                     current_trade_start_step = step_num
 
-            reward = transition["reward"]
+            log_step = not quiet and log_every and step_num % log_every == 0
+            if log_step:
+                reward = simulate_step_transition(
+                    current_position=state.position,
+                    target_position=target_position,
+                    closes=bundle.closes,
+                    idx=idx,
+                    equity=state.equity,
+                    peak_equity=peak_equity,
+                    config=bundle.config,
+                )["reward"]
             state.equity *= growth_factor
-            equity_series.append(state.equity)
+            equity_series[step_num] = state.equity
             state.position = target_position
             if state.equity >= peak_equity:
                 peak_step = step_num
@@ -639,10 +842,10 @@ def run_playback(
                 drawdown_trough_equity = state.equity
 
             if equity_log_file and step_num % log_every_n == 0:
-                equity_log_file.write(f"{step_num},{state.equity:.6f}\n")
-                if step_num % (log_every_n * 5) == 0:
-                    equity_log_file.flush()
-            if not quiet and log_every and step_num % log_every == 0:
+                log_steps[log_count] = step_num
+                log_equity[log_count] = state.equity
+                log_count += 1
+            if log_step:
                 ts = bundle.timestamps[idx + 1] if idx + 1 < len(bundle.timestamps) else "-"
                 print(
                     f"[{ts}] step={step_num} equity={state.equity:.6f} "
@@ -651,8 +854,12 @@ def run_playback(
                 )
     finally:
         if equity_log_file:
-            equity_log_file.flush()
-            equity_log_file.close()
+            with equity_log_file:
+                # Interleave steps and equities so one %-format call renders every row.
+                cells = np.empty(2 * log_count, dtype=object)
+                cells[0::2] = log_steps[:log_count].tolist()
+                cells[1::2] = log_equity[:log_count].tolist()
+                equity_log_file.write("step,equity\n" + ("%d,%.6f\n" * log_count) % tuple(cells))
 
     processed_steps = max(0, last_idx - start_idx + 1)
     if current_trade_growth is not None:
@@ -663,10 +870,14 @@ def run_playback(
             holding_steps.append(processed_steps - current_trade_start_step + 1)
 
     total_return = state.equity - 1.0
-    sharpe = compute_sharpe_ratio_from_equity(equity_series)
-    action_avg = action_sum / processed_steps if processed_steps > 0 else 0.0
-    action_abs_avg = action_abs_sum / processed_steps if processed_steps > 0 else 0.0
-    total_actions = action_long + action_short + action_flat
+    sharpe = compute_sharpe_ratio_from_equity(equity_series[: processed_steps + 1])
+    executed = target_positions[:processed_steps]
+    action_avg = float(executed.mean()) if processed_steps > 0 else 0.0
+    action_abs_avg = float(np.abs(executed).mean()) if processed_steps > 0 else 0.0
+    action_long = int(np.count_nonzero(executed > 0.05))
+    action_short = int(np.count_nonzero(executed < -0.05))
+    action_flat = processed_steps - action_long - action_short
+    total_actions = processed_steps
     long_ratio = 0.0
     short_ratio = 0.0
     flat_ratio = 1.0
@@ -818,6 +1029,12 @@ def build_argument_parser() -> argparse.ArgumentParser:
         help="Use stochastic actions (deterministic=False) for diagnostics.",
     )
     parser.add_argument("--log-every", type=int, default=200, help="Log every N steps.")
+    parser.add_argument(
+        "--inference-batch-size",
+        type=int,
+        default=256,
+        help="Max bars per batched deterministic policy call (0 or 1 = one call per bar).",
+    )
     parser.add_argument(
         "--start-index",
         type=int,
@@ -915,39 +1132,7 @@ def build_argument_parser() -> argparse.ArgumentParser:
 def main() -> None:
     parser = build_argument_parser()
     args = parser.parse_args()
-    policy_enabled = (
-        args.long_threshold is not None
-        or args.short_threshold is not None
-        or bool(list(args.action_gate))
-        or bool(list(args.threshold_bump))
-    )
-    if policy_enabled:
-        if args.long_threshold is None or args.short_threshold is None:
-            parser.error(
-                "--long-threshold and --short-threshold are required "
-                "when policy envelope options are used"
-            )
-        if float(args.short_threshold) >= float(args.long_threshold):
-            parser.error("--short-threshold must be < --long-threshold")
-        long_exit_threshold = (
-            float(args.long_threshold)
-            if args.long_exit_threshold is None
-            else float(args.long_exit_threshold)
-        )
-        short_exit_threshold = (
-            float(args.short_threshold)
-            if args.short_exit_threshold is None
-            else float(args.short_exit_threshold)
-        )
-        if long_exit_threshold > float(args.long_threshold):
-            parser.error("--long-exit-threshold must be <= --long-threshold")
-        if short_exit_threshold < float(args.short_threshold):
-            parser.error("--short-exit-threshold must be >= --short-threshold")
-        if short_exit_threshold >= long_exit_threshold:
-            parser.error("--short-exit-threshold must be < --long-exit-threshold")
-    else:
-        long_exit_threshold = None
-        short_exit_threshold = None
+    long_exit_threshold, short_exit_threshold = resolve_policy_exit_thresholds(parser, args)
 
     bundle = load_playback_bundle(
         data_path=args.data,
@@ -987,6 +1172,7 @@ def main() -> None:
             equity_log_path=args.equity_log,
             equity_log_every=args.equity_log_every,
             should_stop=lambda: stop_requested,
+            inference_batch_size=args.inference_batch_size,
         )
     except ValueError as exc:
         print(str(exc))
@@ -999,14 +1185,14 @@ def main() -> None:
     if args.baseline != "none":
         modes = {"flat": 0.0, "long": 1.0, "short": -1.0}
         selected = modes if args.baseline == "all" else {args.baseline: modes[args.baseline]}
-        for name, position in selected.items():
-            equity, ret = simulate_fixed_position(
-                bundle,
-                position,
-                result.start_index,
-                result.processed_steps,
-            )
-            print(f"Baseline {name}: equity={equity:.6f} return={ret:.6f}")
+        equities = simulate_fixed_positions(
+            bundle,
+            list(selected.values()),
+            result.start_index,
+            result.processed_steps,
+        )
+        for name, equity in zip(selected, equities, strict=True):
+            print(f"Baseline {name}: equity={equity:.6f} return={equity - 1.0:.6f}")
 
 
 if __name__ == "__main__":
@@ -17,11 +17,11 @@ from forex.ml.rl.envs.trading_env import (
     simulate_step_transition,
 )
 from forex.ml.rl.features.feature_builder import (
-    apply_scaler,
     build_feature_frame,
     filter_feature_rows_by_session,
     fit_scaler,
     load_csv,
+    scale_features,
     select_feature_columns,
 )
 from forex.tools.rl.run_live_sim import PlaybackResult, print_playback_result
@@ -225,8 +225,8 @@ def _load_dataset(
         loaded.random_start = False
         config = loaded
     return (
-        features_frame.to_numpy(dtype=np.float32),
-        closes.to_numpy(dtype=np.float32),
+        np.ascontiguousarray(features_frame.to_numpy(dtype=np.float32)),
+        closes.to_numpy(dtype=np.float64),
         action_gate_mask.astype(bool, copy=False),
         threshold_bumps.astype(np.float32, copy=False),
         list(timestamps),
@@ -403,8 +403,8 @@ def _run_segment(
     train_frame = pd.DataFrame(features[:train_end])
     test_frame = pd.DataFrame(features[test_start:test_end])
     scaler = fit_scaler(train_frame)
-    train_x = apply_scaler(train_frame, scaler).to_numpy(dtype=np.float32)
-    test_x = apply_scaler(test_frame, scaler).to_numpy(dtype=np.float32)
+    train_x = scale_features(train_frame, scaler)
+    test_x = scale_features(test_frame, scaler)
     weights = _fit_linear_model(train_x, labels[:train_end], ridge_alpha)
     if weights is None:
         return None
@@ -135,7 +135,7 @@ def main() -> None:
         list(payload.get("action_gates", [])),
     )
     labels, _future_returns = _build_targets(
-        closes.to_numpy(dtype=np.float32),
+        closes.to_numpy(dtype=np.float64),
         int(payload.get("horizon", 20)),
         float(payload.get("target_threshold", 0.0)),
         target_mode=str(payload.get("target_mode", "forward_return")),
@@ -18,42 +18,43 @@ from stable_baselines3 import PPO
 from stable_baselines3.common.callbacks import BaseCallback, CallbackList, EvalCallback
 from stable_baselines3.common.evaluation import evaluate_policy
 from stable_baselines3.common.monitor import Monitor
-from stable_baselines3.common.vec_env import DummyVecEnv, sync_envs_normalization
+from stable_baselines3.common.vec_env import (
+    DummyVecEnv,
+    SubprocVecEnv,
+    VecEnv,
+    sync_envs_normalization,
+)
 
 from forex.config.paths import DEFAULT_MODEL_PATH
 from forex.ml.rl.envs.trading_config_io import save_trading_config
 from forex.ml.rl.envs.trading_env import (
     TradingConfig,
     TradingEnv,
-    apply_risk_engine,
     build_window_observation,
-    decode_policy_action,
-    simulate_step_transition,
     uses_native_discrete_actions,
 )
 from forex.ml.rl.features.feature_builder import (
     apply_feature_profile,
-    apply_scaler,
     build_feature_frame,
     filter_feature_rows_by_session,
     fit_scaler,
     load_csv,
     required_raw_columns_for_profile,
     save_scaler,
+    scale_features,
     select_feature_columns,
 )
 from forex.ml.rl.models import WindowCnnExtractor
 from forex.tools.rl.run_live_sim import (
     PlaybackBundle,
     PlaybackResult,
-    _apply_policy_envelope,
     _build_gate_mask,
     _build_threshold_bump_array,
     _parse_gate_specs,
     _parse_threshold_bump_specs,
-    _policy_enabled,
     run_playback,
 )
+from forex.utils.shared_arrays import share_array
 
 
 def _save_training_args_snapshot(
@@ -125,10 +126,45 @@ def _handle_termination_signal(signum, _frame) -> None:
     raise KeyboardInterrupt
 
 
-def _build_env(features, closes, config: TradingConfig, timestamps=None) -> DummyVecEnv:
-    return DummyVecEnv(
-        [lambda: Monitor(TradingEnv(features, closes, config, timestamps=timestamps))]
-    )
+class _SharedArrayEnvFactory:
+    """Env factory for spawned workers: pickles shared-memory handles, not the arrays."""
+
+    def __init__(self, features, closes, config: TradingConfig, timestamps=None) -> None:
+        self._features = share_array(np.asarray(features))
+        self._closes = share_array(np.asarray(closes))
+        self._config = config
+        self._timestamps = timestamps
+        self._segments: list = []
+
+    def __call__(self) -> Monitor:
+        features, features_segment = self._features.attach()
+        closes, closes_segment = self._closes.attach()
+        # The views are only valid while their segments stay mapped.
+        self._segments = [features_segment, closes_segment]
+        return Monitor(TradingEnv(features, closes, self._config, timestamps=self._timestamps))
+
+
+def _build_env(
+    features,
+    closes,
+    config: TradingConfig,
+    timestamps=None,
+    n_envs: int = 1,
+) -> VecEnv:
+    def _make_env() -> Monitor:
+        return Monitor(TradingEnv(features, closes, config, timestamps=timestamps))
+
+    if n_envs <= 1:
+        return DummyVecEnv([_make_env])
+    if sys.platform.startswith("linux"):
+        # Forked workers share the parent's feature arrays copy-on-write. macOS also offers
+        # fork, but forking after torch or Accelerate has initialised is unsafe there.
+        return SubprocVecEnv([_make_env] * int(n_envs), start_method="fork")
+    factory = _SharedArrayEnvFactory(features, closes, config, timestamps)
+    return SubprocVecEnv([factory] * int(n_envs))
+
+
+_TRIAL_ENV_CACHE_SIZE = 4
 
 
 def _build_curriculum_positions(max_position: float, position_step: float) -> tuple[float, ...]:
@@ -1000,9 +1036,16 @@ class PlateauEvalCallback(EvalCallback):
         return True
 
 
+def _eval_freq_in_calls(eval_freq: int, n_envs: int) -> int:
+    # EvalCallback counts vector steps, each of which advances every env by one timestep.
+    if eval_freq <= 0:
+        return eval_freq
+    return max(1, eval_freq // max(1, n_envs))
+
+
 def _train_model(
     *,
-    env: DummyVecEnv,
+    env: VecEnv,
     learning_rate: float,
     n_steps: int,
     batch_size: int,
@@ -1034,7 +1077,8 @@ def _train_model(
         verbose=verbose,
         policy_kwargs=policy_kwargs,
         learning_rate=learning_rate,
-        n_steps=n_steps,
+        # n_steps is the total rollout length; it is split across the parallel envs.
+        n_steps=max(1, n_steps // int(getattr(env, "num_envs", 1))),
         batch_size=batch_size,
         gamma=gamma,
         ent_coef=ent_coef,
@@ -1055,6 +1099,34 @@ def _clone_config(config: TradingConfig, **overrides) -> TradingConfig:
     return TradingConfig(**payload)
 
 
+def _config_cache_key(config: TradingConfig) -> tuple:
+    return tuple(config.__dict__.items())
+
+
+def _write_sorted_trials_csv(trials_path: Path) -> Path:
+    """Copy the streamed trials CSV next to itself, best value first and unscored trials last."""
+    with trials_path.open("r", encoding="utf-8", newline="") as fh:
+        reader = csv.DictReader(fh)
+        fieldnames = list(reader.fieldnames or [])
+        rows = list(reader)
+
+    def _sort_key(row: dict[str, str]) -> tuple[bool, float, int]:
+        try:
+            value = float(row.get("value") or "nan")
+        except ValueError:
+            value = float("nan")
+        missing = math.isnan(value)
+        return missing, float("inf") if missing else -value, int(row.get("trial") or 0)
+
+    rows.sort(key=_sort_key)
+    sorted_path = trials_path.with_name(f"{trials_path.stem}.sorted{trials_path.suffix}")
+    with sorted_path.open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    return sorted_path
+
+
 def _extract_data_context(csv_path: str | Path) -> dict[str, int | str]:
     path = Path(csv_path).expanduser()
     meta_path = path.with_suffix(path.suffix + ".meta.json")
@@ -1260,6 +1332,9 @@ def _evaluate_playback_candidates(
     }
 
 
+_PROFILE_INFERENCE_BATCH = 256
+
+
 def _profile_policy_activity(
     model: PPO,
     features: np.ndarray,
@@ -1278,97 +1353,33 @@ def _profile_policy_activity(
         config=config,
         replay_policy=replay_policy,
     )
-    step_limit = len(bundle.features) - 1
-    if max_steps > 0:
-        step_limit = min(step_limit, int(max_steps))
+    # The playback pass records the scaled raw actions it acts on, so the policy runs once.
     raw_actions: list[float] = []
-    raw_entry_hits = 0
-    raw_long_entry_hits = 0
-    raw_short_entry_hits = 0
-    state = {"position": 0.0, "equity": 1.0, "peak_equity": 1.0}
-    for idx in range(max(0, int(step_limit))):
-        obs = build_window_observation(
-            bundle.features,
-            idx,
-            position=float(state["position"]),
-            max_position=bundle.config.max_position,
-            window_size=getattr(bundle.config, "window_size", 1),
-        )
-        action, _ = bundle.model.predict(obs, deterministic=True)
-        raw_action = decode_policy_action(action, config=bundle.config)
-        raw_action *= max(float(bundle.action_scale), 0.0)
-        raw_actions.append(raw_action)
-        threshold_bump = (
-            float(bundle.threshold_bumps[idx])
-            if (
-                bundle.threshold_bumps is not None
-                and len(bundle.threshold_bumps) > idx
-            )
-            else 0.0
-        )
-        long_threshold = (
-            float(bundle.long_threshold) + threshold_bump
-            if bundle.long_threshold is not None
-            else None
-        )
-        short_threshold = (
-            float(bundle.short_threshold) - threshold_bump
-            if bundle.short_threshold is not None
-            else None
-        )
-        if long_threshold is not None and raw_action >= long_threshold:
-            raw_entry_hits += 1
-            raw_long_entry_hits += 1
-        elif short_threshold is not None and raw_action <= short_threshold:
-            raw_entry_hits += 1
-            raw_short_entry_hits += 1
-
-        gate_enabled = (
-            bool(bundle.action_gate_mask[idx])
-            if bundle.action_gate_mask is not None and len(bundle.action_gate_mask) > idx
-            else True
-        )
-        target_raw = raw_action
-        if _policy_enabled(bundle):
-            target_raw = _apply_policy_envelope(
-                raw_action,
-                current_position=float(state["position"]),
-                gate_enabled=gate_enabled,
-                action_gate_mode=str(bundle.action_gate_mode),
-                long_threshold=float(bundle.long_threshold) + threshold_bump,
-                short_threshold=float(bundle.short_threshold) - threshold_bump,
-                long_exit_threshold=float(bundle.long_exit_threshold),
-                short_exit_threshold=float(bundle.short_exit_threshold),
-            )
-        target_position, _ = apply_risk_engine(
-            target_raw,
-            current_position=float(state["position"]),
-            config=bundle.config,
-            closes=bundle.closes,
-            idx=idx,
-            equity=float(state["equity"]),
-            peak_equity=float(state["peak_equity"]),
-        )
-        transition = simulate_step_transition(
-            current_position=float(state["position"]),
-            target_position=target_position,
-            closes=bundle.closes,
-            idx=idx,
-            equity=float(state["equity"]),
-            peak_equity=float(state["peak_equity"]),
-            config=bundle.config,
-        )
-        state["position"] = float(target_position)
-        state["equity"] = float(transition["equity"])
-        state["peak_equity"] = float(transition["peak_equity"])
-
-    raw_action_array = np.asarray(raw_actions, dtype=np.float64)
     result = run_playback(
         bundle,
         start_index=0,
         max_steps=max_steps,
         quiet=True,
+        inference_batch_size=_PROFILE_INFERENCE_BATCH,
+        raw_actions_out=raw_actions,
     )
+    raw_action_array = np.asarray(raw_actions, dtype=np.float64)
+    step_count = len(raw_action_array)
+    threshold_bumps = np.zeros(step_count, dtype=np.float64)
+    if bundle.threshold_bumps is not None:
+        bump_count = min(step_count, len(bundle.threshold_bumps))
+        threshold_bumps[:bump_count] = np.asarray(bundle.threshold_bumps[:bump_count])
+    long_hits = np.zeros(step_count, dtype=bool)
+    short_hits = np.zeros(step_count, dtype=bool)
+    if bundle.long_threshold is not None:
+        long_hits = raw_action_array >= float(bundle.long_threshold) + threshold_bumps
+    if bundle.short_threshold is not None:
+        short_hits = ~long_hits & (
+            raw_action_array <= float(bundle.short_threshold) - threshold_bumps
+        )
+    raw_long_entry_hits = int(np.count_nonzero(long_hits))
+    raw_short_entry_hits = int(np.count_nonzero(short_hits))
+    raw_entry_hits = raw_long_entry_hits + raw_short_entry_hits
     metrics = {
         "trades": float(result.trades),
         "trade_rate_1k": float(result.trade_rate_1k),
@@ -1465,6 +1476,15 @@ def main() -> None:
     parser.add_argument("--learning-rate", type=float, default=1e-4, help="PPO learning rate.")
     parser.add_argument("--gamma", type=float, default=0.995, help="PPO discount factor.")
     parser.add_argument("--n-steps", type=int, default=4096, help="PPO rollout steps per update.")
+    parser.add_argument(
+        "--n-envs",
+        type=int,
+        default=1,
+        help=(
+            "Training environments stepped in parallel worker processes; "
+            "--n-steps is split across them (default: 1, in-process)."
+        ),
+    )
     parser.add_argument("--batch-size", type=int, default=256, help="PPO minibatch size.")
     parser.add_argument("--ent-coef", type=float, default=5e-4, help="Entropy coefficient.")
     parser.add_argument("--gae-lambda", type=float, default=0.98, help="PPO GAE lambda.")
@@ -2300,6 +2320,8 @@ def main() -> None:
         raise ValueError("--batch-size must be >= 1.")
     if args.batch_size > args.n_steps:
         raise ValueError("--batch-size cannot exceed --n-steps.")
+    if args.n_envs < 1:
+        raise ValueError("--n-envs must be >= 1.")
     if args.ent_coef < 0.0:
         raise ValueError("--ent-coef must be >= 0.")
     if not (0.0 <= args.gae_lambda <= 1.0):
@@ -2491,8 +2513,8 @@ def main() -> None:
     eval_replay_policy_frame = replay_policy_frame.iloc[split_idx:].reset_index(drop=True)
     train_frame = features_frame.iloc[:split_idx]
     eval_frame = features_frame.iloc[split_idx:]
-    train_closes = closes.iloc[:split_idx].to_numpy(dtype=np.float32)
-    eval_closes = closes.iloc[split_idx:].to_numpy(dtype=np.float32)
+    train_closes = closes.iloc[:split_idx].to_numpy(dtype=np.float64)
+    eval_closes = closes.iloc[split_idx:].to_numpy(dtype=np.float64)
     train_timestamps = timestamps[:split_idx]
     eval_timestamps = timestamps[split_idx:]
     replay_policy_eval = _resolve_replay_policy(
@@ -2508,8 +2530,8 @@ def main() -> None:
     )
 
     scaler = fit_scaler(train_frame)
-    train_features = apply_scaler(train_frame, scaler).to_numpy(dtype=np.float32)
-    eval_features = apply_scaler(eval_frame, scaler).to_numpy(dtype=np.float32)
+    train_features = scale_features(train_frame, scaler)
+    eval_features = scale_features(eval_frame, scaler)
     feature_dim = train_features.shape[1]
 
     scaler_path = args.feature_scaler_out.strip()
@@ -2708,13 +2730,20 @@ def main() -> None:
         total_steps_target=int(args.total_steps),
     )
 
-    env = _build_env(train_features, train_closes, train_config, train_timestamps)
+    env = _build_env(
+        train_features,
+        train_closes,
+        train_config,
+        train_timestamps,
+        n_envs=args.n_envs,
+    )
     eval_env = _build_env(eval_features, eval_closes, eval_config, eval_timestamps)
     curriculum_env = _build_env(
         train_features,
         train_closes,
         curriculum_train_config,
         train_timestamps,
+        n_envs=args.n_envs,
     )
     curriculum_eval_env = _build_env(
         eval_features,
@@ -2767,8 +2796,10 @@ def main() -> None:
     if metrics_log_path:
         log_path = Path(metrics_log_path)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        metrics_fh = log_path.open("w", encoding="utf-8")
-        metrics_fh.write("step,metric,value\n")
+        # Binary with a 64 KiB buffer: rows are %-formatted straight to bytes. Flushes stay
+        # periodic because the training UI tails this file while the run is in progress.
+        metrics_fh = log_path.open("wb", buffering=1 << 16)
+        metrics_fh.write(b"step,metric,value\n")
 
     def _write_metric(step: int, metric: str, value: float) -> None:
         nonlocal metrics_counter
@@ -2777,7 +2808,7 @@ def main() -> None:
         metrics_counter += 1
         if metrics_counter % metrics_log_every != 0:
             return
-        metrics_fh.write(f"{step},{metric},{value:.10g}\n")
+        metrics_fh.write(b"%d,%s,%.10g\n" % (step, metric.encode("utf-8"), value))
         if metric.startswith("warm_start/") or metrics_counter % (metrics_log_every * 10) == 0:
             metrics_fh.flush()
 
@@ -2835,7 +2866,7 @@ def main() -> None:
     ) -> EvalCallback:
         nonlocal best_model_tmp_dir, playback_candidate_tmp_dir
         kwargs = {
-            "eval_freq": args.eval_freq,
+            "eval_freq": _eval_freq_in_calls(args.eval_freq, args.n_envs),
             "n_eval_episodes": args.eval_episodes,
             "deterministic": True,
         }
@@ -2974,7 +3005,7 @@ def main() -> None:
         model_ref: PPO,
         *,
         total_steps: int,
-        final_env_ref: DummyVecEnv,
+        final_env_ref: VecEnv,
         final_eval_env_ref: DummyVecEnv,
         final_eval_config_ref: TradingConfig,
     ) -> None:
@@ -3052,6 +3083,7 @@ def main() -> None:
             optuna_fh = log_path.open("w", encoding="utf-8")
             optuna_fh.write("trial,value,best_value,duration_sec\n")
         trials_csv_path = args.optuna_trials_csv.strip()
+        trials_path: Path | None = None
         trials_csv_fh = None
         trials_csv_writer = None
         trial_param_keys = [
@@ -3100,79 +3132,39 @@ def main() -> None:
                 ],
             )
             trials_csv_writer.writeheader()
-        trials_rows: list[dict] = []
-
-        def _profile_policy(
-            model: PPO,
-            features: np.ndarray,
-            closes: np.ndarray,
-            config: TradingConfig,
-            *,
-            max_steps: int = 0,
-        ) -> dict[str, float]:
-            position = 0.0
-            equity = 1.0
-            peak_equity = 1.0
-            trades = 0
-            action_long = 0
-            action_short = 0
-            action_flat = 0
-            max_drawdown = 0.0
-            total_steps = max(0, len(features) - 1)
-            if max_steps > 0:
-                total_steps = min(total_steps, int(max_steps))
-            for idx in range(total_steps):
-                obs = build_window_observation(
-                    features,
-                    idx,
-                    position=position,
-                    max_position=float(config.max_position),
-                    window_size=int(getattr(config, "window_size", 1)),
-                )
-                action, _ = model.predict(obs, deterministic=True)
-                target, _ = apply_risk_engine(
-                    decode_policy_action(action, config=config),
-                    current_position=position,
-                    config=config,
-                    closes=closes,
-                    idx=idx,
-                    equity=equity,
-                    peak_equity=peak_equity,
-                )
-                if abs(target - position) > 1e-12:
-                    trades += 1
-                if target > 0.05:
-                    action_long += 1
-                elif target < -0.05:
-                    action_short += 1
-                else:
-                    action_flat += 1
-                transition = simulate_step_transition(
-                    current_position=position,
-                    target_position=target,
-                    closes=closes,
-                    idx=idx,
-                    equity=equity,
-                    peak_equity=peak_equity,
-                    config=config,
+        # Trials and replay candidates whose env configs match reuse the same envs, which
+        # matters most when each training env is a pool of worker processes.
+        trial_env_cache: dict[tuple, tuple[VecEnv, DummyVecEnv]] = {}
+
+        def _cached_trial_envs(
+            train_cfg: TradingConfig,
+            eval_cfg: TradingConfig,
+        ) -> tuple[VecEnv, DummyVecEnv]:
+            key = (_config_cache_key(train_cfg), _config_cache_key(eval_cfg))
+            envs = trial_env_cache.pop(key, None)
+            if envs is None:
+                envs = (
+                    _build_env(
+                        train_features,
+                        train_closes,
+                        train_cfg,
+                        train_timestamps,
+                        n_envs=args.n_envs,
+                    ),
+                    _build_env(eval_features, eval_closes, eval_cfg, eval_timestamps),
                 )
-                equity = transition["equity"]
-                peak_equity = transition["peak_equity"]
-                max_drawdown = max(max_drawdown, float(transition["drawdown"]))
-                position = target
-            total_actions = max(1, action_long + action_short + action_flat)
-            long_ratio = float(action_long / total_actions)
-            short_ratio = float(action_short / total_actions)
-            trade_rate_1k = float(trades * 1000.0 / max(1, total_steps))
-            return {
-                "trades": float(trades),
-                "flat_ratio": float(action_flat / total_actions),
-                "long_ratio": long_ratio,
-                "short_ratio": short_ratio,
-                "ls_imbalance": float(abs(long_ratio - short_ratio)),
-                "trade_rate_1k": trade_rate_1k,
-                "max_drawdown": float(max_drawdown),
-            }
+                if len(trial_env_cache) >= _TRIAL_ENV_CACHE_SIZE:
+                    for stale_env in trial_env_cache.pop(next(iter(trial_env_cache))):
+                        stale_env.close()
+            # Re-inserted last, so the first key is always the least recently used.
+            trial_env_cache[key] = envs
+            return envs
+
+        def _close_trial_envs() -> None:
+            for cached_envs in trial_env_cache.values():
+                for cached_env in cached_envs:
+                    cached_env.close()
+            trial_env_cache.clear()
 
         def objective(trial: optuna.Trial) -> float:
             n_steps = trial.suggest_categorical("n_steps", [512, 1024, 2048])
@@ -3281,18 +3273,7 @@ def main() -> None:
                 max_position=max_position,
                 reward_clip=reward_clip,
             )
-            trial_env = _build_env(
-                train_features,
-                train_closes,
-                trial_train_config,
-                train_timestamps,
-            )
-            trial_eval_env = _build_env(
-                eval_features,
-                eval_closes,
-                trial_eval_config,
-                eval_timestamps,
-            )
+            trial_env, trial_eval_env = _cached_trial_envs(trial_train_config, trial_eval_config)
 
             model = _train_model(
                 env=trial_env,
@@ -3335,8 +3316,6 @@ def main() -> None:
                 ),
                 replay_policy=replay_policy_eval,
             )
-            trial_env.close()
-            trial_eval_env.close()
             objective_score = float(mean_reward)
             objective_score -= 0.25 * max(
                 0.0,
@@ -3377,12 +3356,14 @@ def main() -> None:
                     "best_value": f"{best_value:.10g}",
                     "duration_sec": f"{duration:.6f}",
                     "state": trial.state.name,
-                    "_value_num": trial_value,
                 }
                 for key in trial_param_keys:
                     value = trial.params.get(key)
                     row[key] = "" if value is None else f"{float(value):.10g}"
-                trials_rows.append(row)
+                # Rows are written in trial order as trials finish; the ranked copy is
+                # produced once the study is over.
+                trials_csv_writer.writerow(row)
+                trials_csv_fh.flush()
 
         def _params_to_configs(params: dict) -> tuple[TradingConfig, TradingConfig]:
             train_cfg = _clone_config(
@@ -3453,8 +3434,7 @@ def main() -> None:
             params: dict, *, total_steps: int, seed: int, verbose: int
         ) -> tuple[float, dict[str, float], dict[str, float]]:
             cand_train_cfg, cand_eval_cfg = _params_to_configs(params)
-            cand_env = _build_env(train_features, train_closes, cand_train_cfg, train_timestamps)
-            cand_eval_env = _build_env(eval_features, eval_closes, cand_eval_cfg, eval_timestamps)
+            cand_env, cand_eval_env = _cached_trial_envs(cand_train_cfg, cand_eval_cfg)
             model = _train_model(
                 env=cand_env,
                 learning_rate=float(params["learning_rate"]),
@@ -3507,8 +3487,6 @@ def main() -> None:
                     stride=replay_walk_forward_stride,
                     replay_policy=replay_policy_eval,
                 )
-            cand_env.close()
-            cand_eval_env.close()
             return float(mean_reward), profile, walk_forward_profile
 
         study = optuna.create_study(direction="maximize")
@@ -3516,24 +3494,9 @@ def main() -> None:
         best_params = study.best_trial.params
         print(f"Optuna best value: {study.best_value:.6f}")
         print(f"Optuna best params: {best_params}")
-        if trials_csv_writer:
-            sorted_rows = sorted(
-                trials_rows,
-                key=lambda row: (
-                    math.isnan(float(row.get("_value_num", float("nan")))),
-                    -float(row.get("_value_num", float("-inf")))
-                    if not math.isnan(float(row.get("_value_num", float("nan"))))
-                    else float("inf"),
-                    int(row.get("trial", 0)),
-                ),
-            )
-            for row in sorted_rows:
-                row.pop("_value_num", None)
-                trials_csv_writer.writerow(row)
-            if trials_csv_fh:
-                trials_csv_fh.flush()
         if trials_csv_fh:
             trials_csv_fh.close()
+            _write_sorted_trials_csv(trials_path)
         selected_trials: list = []
         final_eval_config_used = eval_config
         if args.optuna_auto_select:
@@ -3954,6 +3917,7 @@ def main() -> None:
                             f"worst_max_dd={best_replay['wf_worst_max_drawdown']:.6g}",
                         )
                     print(f"Replay best params: {best_replay['params']}")
+        _close_trial_envs()
         if optuna_fh:
             optuna_fh.close()
         if args.optuna_out:
@@ -3963,7 +3927,13 @@ def main() -> None:
         if not args.optuna_train_best:
             return
         best_train_config, best_eval_config = _params_to_configs(best_params)
-        best_env = _build_env(train_features, train_closes, best_train_config, train_timestamps)
+        best_env = _build_env(
+            train_features,
+            train_closes,
+            best_train_config,
+            train_timestamps,
+            n_envs=args.n_envs,
+        )
         best_eval_env = _build_env(eval_features, eval_closes, best_eval_config, eval_timestamps)
         final_train_config = best_train_config
         final_eval_config_used = best_eval_config
@@ -4016,7 +3986,13 @@ def main() -> None:
             raise FileNotFoundError(f"Resume requested but model not found: {model_path}")
         final_train_config = train_config
         final_eval_config_used = eval_config
-        model = PPO.load(str(model_path), env=env, device=args.device)
+        # The checkpoint stores its per-env rollout length; re-split --n-steps over this run's envs.
+        model = PPO.load(
+            str(model_path),
+            env=env,
+            device=args.device,
+            custom_objects={"n_steps": max(1, args.n_steps // int(args.n_envs))},
+        )
         print(f"Resolved device: {model.device}")
         model.verbose = args.verbose
         model.set_random_seed(args.seed)
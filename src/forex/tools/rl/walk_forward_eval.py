@@ -7,7 +7,12 @@ from pathlib import Path
 
 import numpy as np
 
-from forex.tools.rl.run_live_sim import PlaybackResult, load_playback_bundle, run_playback
+from forex.tools.rl.run_live_sim import (
+    PlaybackResult,
+    load_playback_bundle,
+    resolve_policy_exit_thresholds,
+    run_playback,
+)
 
 
 def _result_to_dict(result: PlaybackResult) -> dict[str, object]:
@@ -256,39 +261,7 @@ def main() -> None:
         parser.error("--segments must be > 0")
     if args.stride <= 0:
         parser.error("--stride must be > 0")
-    policy_enabled = (
-        args.long_threshold is not None
-        or args.short_threshold is not None
-        or bool(list(args.action_gate))
-        or bool(list(args.threshold_bump))
-    )
-    if policy_enabled:
-        if args.long_threshold is None or args.short_threshold is None:
-            parser.error(
-                "--long-threshold and --short-threshold are required "
-                "when policy envelope options are used"
-            )
-        if float(args.short_threshold) >= float(args.long_threshold):
-            parser.error("--short-threshold must be < --long-threshold")
-        long_exit_threshold = (
-            float(args.long_threshold)
-            if args.long_exit_threshold is None
-            else float(args.long_exit_threshold)
-        )
-        short_exit_threshold = (
-            float(args.short_threshold)
-            if args.short_exit_threshold is None
-            else float(args.short_exit_threshold)
-        )
-        if long_exit_threshold > float(args.long_threshold):
-            parser.error("--long-exit-threshold must be <= --long-threshold")
-        if short_exit_threshold < float(args.short_threshold):
-            parser.error("--short-exit-threshold must be >= --short-threshold")
-        if short_exit_threshold >= long_exit_threshold:
-            parser.error("--short-exit-threshold must be < --long-exit-threshold")
-    else:
-        long_exit_threshold = None
-        short_exit_threshold = None
+    long_exit_threshold, short_exit_threshold = resolve_policy_exit_thresholds(parser, args)
 
     primary_bundle = load_playback_bundle(
         data_path=args.data,
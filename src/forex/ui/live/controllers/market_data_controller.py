@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import time
 
+from forex.domain.market_data import LiveTrendbar, Trendbar
+
 
 class LiveMarketDataController:
     def __init__(self, window) -> None:
@@ -100,7 +102,7 @@ class LiveMarketDataController:
         if w._history_service is None:
             w._history_service = w._use_cases.create_trendbar_history(w._service)
 
-        def handle_history(rows: list[dict]) -> None:
+        def handle_history(rows: list[Trendbar]) -> None:
             w._emit_history_received(rows)
 
         w._history_service.clear_log_history()
@@ -131,7 +133,7 @@ class LiveMarketDataController:
             timeframe=w._timeframe,
         )
 
-    def handle_history_received(self, rows: list[dict]) -> None:
+    def handle_history_received(self, rows: list[Trendbar]) -> None:
         w = self._window
         if not rows:
             w.logRequested.emit("⚠️ No candle data received")
@@ -143,19 +145,19 @@ class LiveMarketDataController:
         preview_current_candle = None
         if w._candles and int(w._candles[-1][0]) == int(current_bucket_seconds):
             preview_current_candle = w._candles[-1]
-        rows_sorted = sorted(rows, key=lambda r: r.get("utc_timestamp_minutes", 0))
+        rows_sorted = sorted(rows, key=lambda r: r.utc_timestamp_minutes)
         candles: list[tuple[float, float, float, float, float]] = []
         for row in rows_sorted:
-            ts_minutes = float(row.get("utc_timestamp_minutes", 0))
+            ts_minutes = float(row.utc_timestamp_minutes)
             ts = ts_minutes * 60
             # Keep history authoritative for closed buckets only.
             # Current bucket is controlled by quote preview to avoid tug-of-war.
             if ts >= float(current_bucket_seconds):
                 continue
-            open_price = w._normalize_price(row.get("open", 0), digits=digits)
-            high_price = w._normalize_price(row.get("high", 0), digits=digits)
-            low_price = w._normalize_price(row.get("low", 0), digits=digits)
-            close_price = w._normalize_price(row.get("close", 0), digits=digits)
+            open_price = w._normalize_price(row.open, digits=digits)
+            high_price = w._normalize_price(row.high, digits=digits)
+            low_price = w._normalize_price(row.low, digits=digits)
+            close_price = w._normalize_price(row.close, digits=digits)
             if None in (open_price, high_price, low_price, close_price):
                 continue
             open_price = round(float(open_price), digits)
@@ -244,7 +246,7 @@ class LiveMarketDataController:
         if w._trendbar_service is None:
             w._trendbar_service = w._use_cases.create_trendbar(w._service)
 
-        def handle_trendbar(data: dict) -> None:
+        def handle_trendbar(data: LiveTrendbar) -> None:
             w._emit_trendbar_received(data)
 
         w._trendbar_service.clear_log_history()
@@ -286,13 +288,13 @@ class LiveMarketDataController:
         reactor.callFromThread(w._trendbar_service.unsubscribe)
         w._trendbar_active = False
 
-    def handle_trendbar_received(self, data: dict) -> None:
+    def handle_trendbar_received(self, data: LiveTrendbar) -> None:
         w = self._window
         if not data:
             return
         if not getattr(w, "_logged_first_trendbar", False):
             w._logged_first_trendbar = True
-        symbol_id = data.get("symbol_id")
+        symbol_id = data.symbol_id
         if symbol_id is not None:
             try:
                 if int(symbol_id) != int(w._symbol_id):
@@ -304,7 +306,7 @@ class LiveMarketDataController:
             digits = w._quote_row_digits.get(int(symbol_id), w._price_digits)
         else:
             digits = w._price_digits
-        ts_minutes = float(data.get("utc_timestamp_minutes", 0))
+        ts_minutes = float(data.utc_timestamp_minutes)
         step_minutes = self.timeframe_minutes()
         if step_minutes > 0:
             ts_min_int = int(ts_minutes)
@@ -338,10 +340,10 @@ class LiveMarketDataController:
             # current bucket candle. Keep feed alive marker only.
             w._auto_last_trendbar_ts = time.time()
             return
-        open_price = w._normalize_price(data.get("open", 0), digits=digits)
-        high_price = w._normalize_price(data.get("high", 0), digits=digits)
-        low_price = w._normalize_price(data.get("low", 0), digits=digits)
-        close_price = w._normalize_price(data.get("close", 0), digits=digits)
+        open_price = w._normalize_price(data.open, digits=digits)
+        high_price = w._normalize_price(data.high, digits=digits)
+        low_price = w._normalize_price(data.low, digits=digits)
+        close_price = w._normalize_price(data.close, digits=digits)
         if None in (open_price, high_price, low_price, close_price):
             return
         open_price = round(float(open_price), digits)
@@ -43,6 +43,7 @@ from forex.application.state import AppState
 from forex.config.constants import ConnectionStatus
 from forex.config.paths import MODEL_DIR, SYMBOL_LIST_FILE, TOKEN_FILE
 from forex.config.settings import OAuthTokens
+from forex.domain.market_data import LiveTrendbar, Trendbar
 from forex.ui.live.controllers.account_controller import LiveAccountController
 from forex.ui.live.controllers.market_data_controller import LiveMarketDataController
 from forex.ui.live.controllers.positions_controller import LivePositionsController
@@ -86,7 +87,7 @@ class LiveMainWindow(QMainWindow):
     accountSummaryUpdated = Signal(object)
     historyReceived = Signal(list)
     tradeHistoryReceived = Signal(list)
-    trendbarReceived = Signal(dict)
+    trendbarReceived = Signal(object)
     quoteUpdated = Signal(int, object, object, object)
     _CARD_LINE_TITLE_COLOR = "#3a4452"
     _CARD_LINE_TITLE_FONT_SIZE_PX = 10
@@ -973,10 +974,10 @@ class LiveMainWindow(QMainWindow):
     def _emit_account_summary_updated(self, snapshot) -> None:
         self._call_on_ui_thread(lambda: self.accountSummaryUpdated.emit(snapshot))
 
-    def _emit_history_received(self, rows: list[dict]) -> None:
+    def _emit_history_received(self, rows: list[Trendbar]) -> None:
         self._call_on_ui_thread(lambda: self.historyReceived.emit(rows))
 
-    def _emit_trendbar_received(self, payload: dict) -> None:
+    def _emit_trendbar_received(self, payload: LiveTrendbar) -> None:
         self._call_on_ui_thread(lambda: self.trendbarReceived.emit(payload))
 
     def _emit_quote_updated(self, symbol_id: int, bid, ask, spot_ts) -> None:
@@ -1179,7 +1180,7 @@ class LiveMainWindow(QMainWindow):
         self._positions_controller.apply_account_summary_update(summary)
         self._refresh_risk_sizing_preview()
 
-    def _handle_history_received(self, rows: list[dict]) -> None:
+    def _handle_history_received(self, rows: list[Trendbar]) -> None:
         self._ui_diag_history_total += 1
         self._session_orchestrator.mark_data_activity()
         self._market_data_controller.handle_history_received(rows)
@@ -1190,7 +1191,7 @@ class LiveMainWindow(QMainWindow):
     def _stop_live_trendbar(self) -> None:
         self._market_data_controller.stop_live_trendbar()
 
-    def _handle_trendbar_received(self, data: dict) -> None:
+    def _handle_trendbar_received(self, data: LiveTrendbar) -> None:
         self._ui_diag_trendbar_total += 1
         self._session_orchestrator.mark_data_activity()
         self._market_data_controller.handle_trendbar_received(data)
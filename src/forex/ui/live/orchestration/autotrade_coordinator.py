@@ -160,7 +160,7 @@ class LiveAutoTradeCoordinator:
             raw_action,
             current_position=float(w._auto_position),
             config=config,
-            closes=np.asarray(feature_set.closes, dtype=np.float32),
+            closes=np.asarray(feature_set.closes, dtype=np.float64),
             idx=obs_idx,
             equity=equity,
             peak_equity=peak_equity,
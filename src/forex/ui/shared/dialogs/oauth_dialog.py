@@ -295,6 +295,8 @@ class OAuthDialog(BaseAuthDialog):
             if self._use_cases is None:
                 self._log_error(format_connection_message("missing_use_cases"))
                 return
+            # A previous attempt may still hold the callback port the new service binds.
+            self._close_login_service()
             self._login_service = self._use_cases.create_oauth_login(
                 token_file=self._token_file,
                 redirect_uri=redirect_uri,
@@ -319,6 +321,15 @@ class OAuthDialog(BaseAuthDialog):
         self._refresh_controls()
         self._login_service.connect()
 
+    def _close_login_service(self) -> None:
+        if self._login_service is not None:
+            self._login_service.close()
+            self._login_service = None
+
+    def done(self, result: int) -> None:
+        self._close_login_service()
+        super().done(result)
+
     @Slot()
     def _exchange_auth_code(self) -> None:
         """Exchange an authorization code for tokens."""
@@ -534,6 +545,7 @@ class OAuthDialog(BaseAuthDialog):
     @Slot(object)
     def _handle_login_success(self, tokens: OAuthTokens) -> None:
         self._log_success("OAuth token acquired successfully")
+        self._close_login_service()
         self._form.load_tokens(tokens)
         self._state.login_in_progress = False
         self._refresh_controls()
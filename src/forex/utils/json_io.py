@@ -0,0 +1,42 @@
+"""JSON file helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _to_builtin(value: Any) -> Any:
+    # numpy arrays and scalars; orjson serializes them natively.
+    tolist = getattr(value, "tolist", None)
+    if tolist is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return tolist()
+
+
+def write_json(path: str | Path, payload: Any) -> None:
+    """Write ``payload`` as two-space indented JSON; numpy arrays are accepted as-is."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        Path(path).write_bytes(orjson.dumps(payload, default=_to_builtin, option=option))
+        return
+    text = json.dumps(payload, ensure_ascii=True, indent=2, default=_to_builtin)
+    Path(path).write_text(text, encoding="utf-8")
+
+
+def read_json(path: str | Path) -> Any:
+    """Read a JSON document from ``path``, including the stdlib's ``NaN``/``Infinity`` literals."""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by json.dumps carry NaN for constant features, which orjson rejects.
+            pass
+    return json.loads(data)
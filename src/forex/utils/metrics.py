@@ -140,12 +140,24 @@ def compute_sharpe_ratio_from_equity(equity_series: list[float] | np.ndarray) ->
     prev = values[:-1]
     curr = values[1:]
     valid = prev > 0.0
-    if not np.any(valid):
+    if valid.all():
+        returns = curr - prev
+        np.divide(returns, prev, out=returns)
+    elif valid.any():
+        prev = prev[valid]
+        returns = curr[valid] - prev
+        np.divide(returns, prev, out=returns)
+    else:
         return 0.0
-    returns = (curr[valid] - prev[valid]) / prev[valid]
-    if returns.size < 2:
+    count = returns.size
+    if count < 2:
         return 0.0
-    std = float(np.std(returns))
+    # Same reductions as np.mean / np.std (ddof=0), with the mean computed once and the
+    # deviations squared in place rather than in fresh temporaries.
+    mean = returns.sum() / count
+    np.subtract(returns, mean, out=returns)
+    np.multiply(returns, returns, out=returns)
+    std = float(np.sqrt(returns.sum() / count))
     if std <= 1e-12:
         return 0.0
-    return float(np.mean(returns) / std)
+    return float(mean / std)
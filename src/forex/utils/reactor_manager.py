@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import threading
+from collections.abc import Callable
+from typing import Any
 
 
 class ReactorManager:
@@ -43,5 +45,49 @@ class ReactorManager:
             self._thread.start()
             self._running = True
 
+    def call_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> ReactorCall:
+        """Schedule ``callback`` on the reactor thread after ``delay`` seconds."""
+        self.ensure_running()
+        call = ReactorCall(delay, callback, args)
+        from twisted.internet import reactor
+
+        reactor.callFromThread(call._arm)
+        return call
+
+
+class ReactorCall:
+    """Handle returned by ``ReactorManager.call_later``; may be cancelled from any thread."""
+
+    def __init__(self, delay: float, callback: Callable[..., Any], args: tuple) -> None:
+        self._delay = delay
+        self._callback = callback
+        self._args = args
+        self._cancelled = False
+        self._delayed_call = None
+
+    def cancel(self) -> None:
+        self._cancelled = True
+        if self._delayed_call is None:
+            return
+        from twisted.internet import reactor
+
+        reactor.callFromThread(self._disarm)
+
+    def _arm(self) -> None:
+        if self._cancelled:
+            return
+        from twisted.internet import reactor
+
+        self._delayed_call = reactor.callLater(self._delay, self._fire)
+
+    def _disarm(self) -> None:
+        delayed_call = self._delayed_call
+        if delayed_call is not None and delayed_call.active():
+            delayed_call.cancel()
+
+    def _fire(self) -> None:
+        if not self._cancelled:
+            self._callback(*self._args)
+
 
 reactor_manager = ReactorManager()
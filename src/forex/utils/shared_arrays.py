@@ -0,0 +1,48 @@
+"""Numpy arrays in POSIX shared memory, handed to worker processes by name instead of by value."""
+
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+# id(array) -> (array, segment); holding the array keeps its id from being reused.
+_SHARED: dict[int, tuple[np.ndarray, SharedMemory]] = {}
+
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    def attach(self) -> tuple[np.ndarray, SharedMemory]:
+        """Map the segment; keep the returned SharedMemory alive as long as the array is used."""
+        segment = SharedMemory(name=self.name)
+        array = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=segment.buf)
+        return array, segment
+
+
+def share_array(array: np.ndarray) -> SharedArrayHandle:
+    """Copy ``array`` into shared memory once; later calls for the same object reuse it."""
+    entry = _SHARED.get(id(array))
+    if entry is None:
+        segment = SharedMemory(create=True, size=max(1, array.nbytes))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+        if not _SHARED:
+            atexit.register(release_shared_arrays)
+        entry = _SHARED[id(array)] = (array, segment)
+    return SharedArrayHandle(entry[1].name, tuple(array.shape), array.dtype.str)
+
+
+def release_shared_arrays() -> None:
+    """Close and unlink every segment created by this process."""
+    while _SHARED:
+        _, (_, segment) = _SHARED.popitem()
+        segment.close()
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from forex.infrastructure.broker.errors import BrokerError, ErrorCode, error_message
+
+
+def test_error_message_matches_broker_error_text() -> None:
+    for detail in (None, "", "symbol=1"):
+        expected = str(BrokerError(code=ErrorCode.TIMEOUT, message="Timed out", detail=detail))
+        assert error_message(ErrorCode.TIMEOUT, "Timed out", detail) == expected
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from forex.ml.rl.features import kernels
 from forex.ml.rl.features.feature_builder import (
     ALPHA8_FEATURE_COLUMNS,
     ALPHA12_FEATURE_COLUMNS,
@@ -15,14 +18,21 @@ from forex.ml.rl.features.feature_builder import (
     CORE20_ALPHA8_FEATURE_COLUMNS,
     CORE20_FEATURE_COLUMNS,
     RESIDUAL_CONTEXT_COLUMNS,
+    _atr,
     _parse_datetimes,
+    _rsi,
     apply_feature_profile,
+    apply_scaler,
     build_feature_frame,
     build_features,
     filter_feature_rows_by_session,
     fit_scaler,
     infer_feature_profile_from_names,
+    load_csv,
+    load_scaler,
     required_raw_columns_for_profile,
+    save_scaler,
+    scale_features,
     select_feature_columns,
 )
 
@@ -601,6 +611,9 @@ def test_build_features_preserves_alpha8_scaler_profile() -> None:
     bundle = build_features(df, scaler=scaler)
     assert list(bundle.names) == scaler.names
     assert bundle.features.shape[1] == len(ALPHA8_FEATURE_COLUMNS)
+    assert bundle.features.dtype == np.float32
+    # Prices feed return and equity accounting, so they keep full precision.
+    assert bundle.closes.dtype == np.float64
 
 
 def test_parse_datetimes_prefers_utc_timestamp_minutes() -> None:
@@ -641,3 +654,151 @@ def test_apply_feature_profile_rejects_missing_required_columns() -> None:
     )
     with pytest.raises(ValueError, match="missing raw feature columns"):
         apply_feature_profile(partial, "alpha4")
+
+
+def test_rsi_uses_wilder_smoothing_after_rolling_warmup() -> None:
+    rng = np.random.default_rng(7)
+    close = pd.Series(100.0 + np.cumsum(rng.normal(0.0, 0.5, size=80)))
+    period = 14
+    rsi = _rsi(close, period=period).to_numpy()
+
+    delta = close.diff().to_numpy()
+    avg_gain = avg_loss = 0.0
+    expected = np.full(len(close), np.nan)
+    for i in range(1, len(close)):
+        gain = max(delta[i], 0.0)
+        loss = max(-delta[i], 0.0)
+        if i == 1:
+            avg_gain, avg_loss = gain, loss
+        else:
+            avg_gain += (gain - avg_gain) / period
+            avg_loss += (loss - avg_loss) / period
+        if i >= period:
+            expected[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    assert np.isnan(rsi[:period]).all()
+    assert np.allclose(rsi[period:], expected[period:])
+
+
+def test_atr_is_wilder_smoothed_true_range() -> None:
+    high = pd.Series([10.0, 11.0, 12.5, 12.0, 13.0, 12.2])
+    low = pd.Series([9.0, 10.2, 11.0, 10.5, 12.1, 11.0])
+    close = pd.Series([9.5, 10.8, 12.0, 11.0, 12.9, 11.5])
+    true_range = np.array([1.0, 1.5, 1.7, 1.5, 2.0, 1.9])
+
+    assert np.allclose(_atr(high, low, close, period=1).to_numpy(), true_range)
+
+    atr = _atr(high, low, close, period=3).to_numpy()
+    expected = [true_range[0]]
+    for value in true_range[1:]:
+        expected.append(expected[-1] + (value - expected[-1]) / 3.0)
+    assert np.isnan(atr[:2]).all()
+    assert np.allclose(atr[2:], expected[2:])
+
+
+def test_scale_features_standardizes_into_float32_array() -> None:
+    frame = pd.DataFrame({"b": [1.0, 3.0, np.inf], "a": [2.0, 2.0, 2.0]})
+    scaler = fit_scaler(frame.iloc[:2])
+
+    values = scale_features(frame, scaler)
+
+    assert values.dtype == np.float32
+    assert values.flags.c_contiguous
+    assert np.allclose(values, [[-0.70710677, 0.0], [0.70710677, 0.0], [0.0, 0.0]])
+    assert np.isfinite(frame.to_numpy()).sum() == 5
+    scaled = apply_scaler(frame, scaler)
+    assert list(scaled.columns) == ["b", "a"]
+    assert np.array_equal(scaled.to_numpy(), values)
+
+
+def test_load_csv_keeps_raw_columns_sorted_by_utc_minutes(tmp_path: Path) -> None:
+    path = tmp_path / "history.csv"
+    path.write_text(
+        "utc_timestamp_minutes,timestamp,open,high,low,close,volume,spread\n"
+        "2,2024-01-01 00:02,1,2,1,2,10,0.1\n"
+        "1,2024-01-01 00:01,1,1,1,1,5,0.1\n",
+        encoding="utf-8",
+    )
+
+    df = load_csv(str(path))
+
+    assert "spread" not in df.columns
+    assert len(df.columns) == 7
+    assert df["utc_timestamp_minutes"].tolist() == [1, 2]
+    assert df.index.tolist() == [0, 1]
+    assert df["high"].dtype == np.float64
+    assert df["timestamp"].tolist() == ["2024-01-01 00:01", "2024-01-01 00:02"]
+
+
+def test_save_scaler_roundtrips_float32_statistics(tmp_path: Path) -> None:
+    scaler = fit_scaler(pd.DataFrame({"x": [0.1, 0.7, 1.3], "y": [2.0, 2.0, 2.0]}))
+    path = tmp_path / "model.scaler.json"
+
+    save_scaler(scaler, path)
+    loaded = load_scaler(path)
+
+    assert loaded.names == ["x", "y"]
+    assert np.array_equal(loaded.means, scaler.means)
+    assert np.array_equal(loaded.stds, scaler.stds, equal_nan=True)
+
+
+def test_load_scaler_reads_stdlib_nan_literals(tmp_path: Path) -> None:
+    # Scalers written by json.dumps store a constant feature's std as a bare NaN.
+    path = tmp_path / "model.scaler.json"
+    path.write_text(
+        '{\n  "names": ["x", "y"],\n  "means": [0.7, 2.0],\n  "stds": [0.5, NaN]\n}',
+        encoding="utf-8",
+    )
+
+    loaded = load_scaler(path)
+
+    assert loaded.names == ["x", "y"]
+    assert loaded.stds[0] == np.float32(0.5)
+    assert np.isnan(loaded.stds[1])
+
+
+@pytest.mark.parametrize("period", [1, 3, 14])
+def test_kernels_match_pandas_indicators(monkeypatch, period: int) -> None:
+    monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", False)
+    rng = np.random.default_rng(7)
+    close = 100.0 + np.cumsum(rng.normal(size=200))
+    close[[40, 41, 120]] = np.nan
+    close[150:170] = np.round(close[150])
+    high = close + rng.random(200)
+    low = close - rng.random(200)
+
+    rsi = _rsi(pd.Series(close), period).to_numpy()
+    atr = _atr(pd.Series(high), pd.Series(low), pd.Series(close), period).to_numpy()
+
+    assert np.allclose(kernels.rsi_wilder(close, period), rsi, equal_nan=True)
+    assert np.allclose(kernels.atr_wilder(high, low, close, period), atr, equal_nan=True)
+
+
+@pytest.mark.parametrize("suffix", [".npz", ".json"])
+def test_save_scaler_dispatches_on_suffix(tmp_path: Path, suffix: str) -> None:
+    scaler = fit_scaler(pd.DataFrame({"x": [0.1, 0.7, 1.3], "y": [2.0, 2.0, 2.0]}))
+    path = tmp_path / f"model.scaler{suffix}"
+
+    save_scaler(scaler, path)
+    loaded = load_scaler(path)
+
+    assert path.exists()
+    assert path.read_bytes().startswith(b"PK") == (suffix == ".npz")
+    assert loaded.names == ["x", "y"]
+    assert loaded.means.dtype == np.float32
+    assert np.array_equal(loaded.means, scaler.means)
+    assert np.array_equal(loaded.stds, scaler.stds, equal_nan=True)
+
+
+def test_fit_scaler_matches_pandas_statistics_with_gaps_and_constant_columns() -> None:
+    rng = np.random.default_rng(7)
+    frame = pd.DataFrame(rng.normal(loc=50.0, scale=3.0, size=(200, 3)), columns=["a", "b", "c"])
+    frame.loc[::9, "b"] = np.nan
+    frame["c"] = 4.0
+
+    scaler = fit_scaler(frame)
+
+    np.testing.assert_array_equal(scaler.means, frame.mean().to_numpy(dtype=np.float32))
+    expected_stds = frame.std().replace(0, np.nan).to_numpy(dtype=np.float32)
+    np.testing.assert_array_equal(scaler.stds, expected_stds)
+    assert np.isnan(scaler.stds[2])
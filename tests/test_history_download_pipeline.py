@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+from forex.application.broker.history_download_pipeline import (
+    HistoryDownloadPipeline,
+    _RawHistoryCsvSink,
+)
+from forex.domain.market_data import Trendbar
+
+
+def test_raw_history_sink_keeps_raw_history_columns(tmp_path: Path) -> None:
+    rows = [
+        Trendbar(28_000_000, "2023-03-28 10:40", 1.08007, 1.08015, 1.08, 1.08003, 120, 5),
+        Trendbar(28_000_005, "2023-03-28 10:45", 1.08003, 1.0801, 1.07999, 1.08008, 95, 5),
+    ]
+    sink = _RawHistoryCsvSink(tmp_path, 1, "M5", output_path=None)
+    sink.write(rows)
+    path = Path(sink.finish())
+    assert path.name == "1_M5_2023-03-28_1040-2023-03-28_1045.csv"
+    with path.open(newline="") as handle:
+        written = list(csv.DictReader(handle))
+    assert list(written[0].keys()) == [
+        "utc_timestamp_minutes",
+        "timestamp",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "period",
+    ]
+    assert written[1]["close"] == "1.08008"
+
+
+class _StreamingHistoryService:
+    def __init__(self, chunks: list[list[Trendbar]]) -> None:
+        self._chunks = chunks
+        self._callbacks: dict = {}
+        self.cancelled = False
+
+    def clear_log_history(self) -> None:
+        return None
+
+    def set_callbacks(self, **callbacks) -> None:
+        self._callbacks = callbacks
+
+    def fetch(self, **_kwargs) -> None:
+        for chunk in self._chunks:
+            if self.cancelled:
+                return
+            self._callbacks["on_history_chunk"](chunk)
+        self._callbacks["on_history_received"](None)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class _UseCases:
+    def __init__(self, service: _StreamingHistoryService) -> None:
+        self._service = service
+
+    def create_trendbar_history(self, _app_auth_service):
+        return self._service
+
+
+def test_fetch_to_raw_streams_chunks_into_single_csv(tmp_path: Path) -> None:
+    service = _StreamingHistoryService(
+        [
+            [Trendbar(28_000_000, "2023-03-28 10:40", 1.08, 1.08, 1.08, 1.08, 1, 5)],
+            [Trendbar(28_000_005, "2023-03-28 10:45", 1.09, 1.09, 1.09, 1.09, 2, 5)],
+        ]
+    )
+    pipeline = HistoryDownloadPipeline(_UseCases(service), app_auth_service=None, raw_dir=tmp_path)
+    saved: list[str] = []
+
+    pipeline.fetch_to_raw(1, 1, timeframe="M5", on_saved=saved.append)
+
+    assert [Path(path).name for path in saved] == ["1_M5_2023-03-28_1040-2023-03-28_1045.csv"]
+    with Path(saved[0]).open(newline="") as handle:
+        assert [row["volume"] for row in csv.DictReader(handle)] == ["1", "2"]
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_fetch_to_raw_names_file_from_earliest_and_latest_bar(tmp_path: Path) -> None:
+    service = _StreamingHistoryService(
+        [
+            [Trendbar(28_000_005, "2023-03-28 10:45", 1.09, 1.09, 1.09, 1.09, 2, 5)],
+            [Trendbar(28_000_000, "2023-03-28 10:40", 1.08, 1.08, 1.08, 1.08, 1, 5)],
+        ]
+    )
+    pipeline = HistoryDownloadPipeline(_UseCases(service), app_auth_service=None, raw_dir=tmp_path)
+    saved: list[str] = []
+
+    pipeline.fetch_to_raw(1, 1, timeframe="M5", on_saved=saved.append)
+
+    assert [Path(path).name for path in saved] == ["1_M5_2023-03-28_1040-2023-03-28_1045.csv"]
+
+
+def test_fetch_to_raw_reports_chunk_write_errors_and_stops_the_download(tmp_path: Path) -> None:
+    service = _StreamingHistoryService(
+        [
+            [Trendbar(28_000_000, "2023-03-28 10:40", 1.08, 1.08, 1.08, 1.08, 1, 5)],
+            [Trendbar(28_000_005, "2023-03-28 10:45", 1.09, 1.09, 1.09, 1.09, 2, 5)],
+        ]
+    )
+    # A file where the output directory should be makes the first chunk write fail.
+    blocked_dir = tmp_path / "raw"
+    blocked_dir.write_text("", encoding="utf-8")
+    pipeline = HistoryDownloadPipeline(
+        _UseCases(service), app_auth_service=None, raw_dir=blocked_dir
+    )
+    saved: list[str] = []
+    errors: list[str] = []
+
+    pipeline.fetch_to_raw(1, 1, timeframe="M5", on_saved=saved.append, on_error=errors.append)
+
+    assert service.cancelled
+    assert len(errors) == 1
+    assert saved == []
+    assert not list(tmp_path.glob("**/*.part"))
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from forex.utils import json_io
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_accepts_numpy_arrays(tmp_path, monkeypatch, use_orjson: bool) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+    path = tmp_path / "payload.json"
+    means = np.array([0.5, -1.25], dtype=np.float32)
+
+    json_io.write_json(path, {"names": ["a", "b"], "means": means, "window": np.int64(3)})
+
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith('{\n  "names"')
+    assert json.loads(text) == {"names": ["a", "b"], "means": [0.5, -1.25], "window": 3}
+    assert json_io.read_json(path) == json.loads(text)
+
+
+def test_write_json_rejects_unknown_objects(tmp_path) -> None:
+    with pytest.raises(TypeError):
+        json_io.write_json(tmp_path / "bad.json", {"value": object()})
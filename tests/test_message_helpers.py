@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from forex.infrastructure.broker.ctrader.services.message_helpers import (
+    is_already_subscribed,
     is_non_subscribed_trendbar_unsubscribe,
 )
 
@@ -17,3 +18,10 @@ def test_is_non_subscribed_trendbar_unsubscribe_rejects_other_errors() -> None:
         "INVALID_REQUEST",
         "Some other invalid request",
     )
+
+
+def test_is_already_subscribed_matches_error_code_name_and_value() -> None:
+    assert is_already_subscribed("ALREADY_SUBSCRIBED", "")
+    assert is_already_subscribed(113, "")
+    assert is_already_subscribed("INVALID_REQUEST", "ALREADY_SUBSCRIBED to spots")
+    assert not is_already_subscribed("INVALID_REQUEST", "Some other invalid request")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from forex.utils.metrics import compute_sharpe_ratio_from_equity
@@ -19,3 +20,14 @@ def test_compute_sharpe_ratio_from_equity_returns_zero_for_flat_returns() -> Non
     sharpe = compute_sharpe_ratio_from_equity(equity_series)
 
     assert sharpe == 0.0
+
+
+def test_compute_sharpe_ratio_from_equity_skips_non_positive_bases_and_keeps_input() -> None:
+    equity_series = np.array([1.0, 1.1, 0.0, 1.0, 1.05, 1.2])
+    original = equity_series.copy()
+    returns = np.array([0.1, -1.0, 0.05, 0.15 / 1.05])
+
+    sharpe = compute_sharpe_ratio_from_equity(equity_series)
+
+    assert sharpe == pytest.approx(float(np.mean(returns) / np.std(returns)))
+    np.testing.assert_array_equal(equity_series, original)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.server import HTTPServer
+from types import SimpleNamespace
+from urllib import request
+
+from forex.config.settings import AppCredentials
+from forex.infrastructure.broker.ctrader.services import oauth_login_service
+from forex.infrastructure.broker.ctrader.services.oauth_login_service import OAuthLoginService
+from forex.infrastructure.broker.oauth.callback_server import CallbackServer, OAuthCallbackHandler
+
+
+def _server() -> HTTPServer:
+    server = HTTPServer(("127.0.0.1", 0), OAuthCallbackHandler)
+    server.code = None
+    server.request_path = None
+    server.timeout = 1
+    return server
+
+
+def test_wait_for_callback_returns_code_without_polling_delay() -> None:
+    server = _server()
+    port = server.server_address[1]
+    callback = CallbackServer(f"http://127.0.0.1:{port}/callback")
+    thread = threading.Thread(
+        target=lambda: request.urlopen(f"http://127.0.0.1:{port}/callback?code=abc").read()
+    )
+    try:
+        started = time.monotonic()
+        thread.start()
+        code = callback._wait_for_callback(server, timeout_seconds=5)
+    finally:
+        thread.join()
+        server.server_close()
+
+    assert code == "abc"
+    assert time.monotonic() - started < 1.0
+
+
+def test_wait_for_callback_returns_none_on_timeout() -> None:
+    server = _server()
+    callback = CallbackServer(f"http://127.0.0.1:{server.server_address[1]}/callback")
+    try:
+        assert callback._wait_for_callback(server, timeout_seconds=0.05) is None
+    finally:
+        server.server_close()
+
+
+def test_get_server_reuses_bound_socket_until_closed() -> None:
+    probe = _server()
+    port = probe.server_address[1]
+    probe.server_close()
+    callback = CallbackServer(f"http://127.0.0.1:{port}/callback")
+    try:
+        first = callback._get_server()
+        first.code = "stale"
+        first.request_path = "/callback"
+
+        second = callback._get_server()
+
+        assert second is first
+        assert second.code is None
+        assert second.request_path is None
+
+        callback.close()
+        assert callback._get_server() is not first
+    finally:
+        callback.close()
+
+
+def test_login_flow_releases_callback_port_after_exchange(monkeypatch) -> None:
+    probe = _server()
+    port = probe.server_address[1]
+    probe.server_close()
+    credentials = AppCredentials(host="demo", client_id="id", client_secret="secret")
+    service = OAuthLoginService(credentials, f"http://127.0.0.1:{port}/callback", "token.json")
+    callback = service._callback_server
+    monkeypatch.setattr(
+        oauth_login_service, "load_config", lambda: SimpleNamespace(oauth_login_timeout=1)
+    )
+
+    def _wait_for_code(_auth_url, **_kwargs):
+        callback._get_server()
+        return "abc"
+
+    monkeypatch.setattr(callback, "wait_for_code", _wait_for_code)
+    monkeypatch.setattr(service, "exchange_code", lambda code: object())
+    try:
+        service._run_flow()
+
+        assert callback._server is None
+    finally:
+        callback.close()
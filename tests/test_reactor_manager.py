@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from forex.utils.reactor_manager import ReactorCall
+
+
+def test_reactor_call_fires_with_args_until_cancelled() -> None:
+    calls: list[int] = []
+    call = ReactorCall(1.0, calls.append, (7,))
+
+    call._fire()
+    call.cancel()
+    call._fire()
+    call._arm()
+
+    assert calls == [7]
+    assert call._delayed_call is None
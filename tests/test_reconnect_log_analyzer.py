@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+import pytest
+
 from forex.tools.diagnostics.reconnect_log_analyzer import (
     analyze_reconnect_log,
     render_summary,
@@ -77,6 +79,20 @@ def test_resolve_log_file_finds_single_match_in_tree(tmp_path: Path) -> None:
     assert "using discovered file" in info
 
 
+def test_resolve_log_file_skips_ignored_directories(tmp_path: Path) -> None:
+    for ignored in (".venv", "node_modules"):
+        hidden = tmp_path / ignored / "deep"
+        hidden.mkdir(parents=True)
+        (hidden / "live_soak.log").write_text("x\n", encoding="utf-8")
+    target = tmp_path / "runtime" / "nested" / "live_soak.log"
+    target.parent.mkdir(parents=True)
+    target.write_text("x\n", encoding="utf-8")
+
+    resolved, _ = resolve_log_file(Path("live_soak.log"), cwd=tmp_path)
+
+    assert resolved == target
+
+
 def test_resolve_log_file_uses_latest_when_multiple_matches(tmp_path: Path) -> None:
     a = tmp_path / "a"
     b = tmp_path / "b"
@@ -96,3 +112,77 @@ def test_resolve_log_file_uses_latest_when_multiple_matches(tmp_path: Path) -> N
     assert resolved == newer
     assert info is not None
     assert "using latest" in info
+
+
+def test_analyze_reconnect_log_counts_each_event_once_per_line() -> None:
+    stats = analyze_reconnect_log(
+        [
+            "[NETWORK] Disconnected! Connected! lockout, authorization lockout",
+            "Request timed out or failed without retry",
+            "reconnecting in 3s",
+        ]
+    )
+
+    assert stats.disconnect_events == 1
+    assert stats.connected == 1
+    assert stats.lockout == 1
+    assert stats.request_deferred == 0
+    assert stats.reconnect_scheduled == 0
+
+
+def test_analyze_reconnect_log_streams_open_file(tmp_path: Path) -> None:
+    log = tmp_path / "live.log"
+    log.write_text(
+        "Connecting to cTrader...\n\nreconnecting in 3.0s (attempt 4)\nConnected!",
+        encoding="utf-8",
+    )
+
+    with log.open("r", encoding="utf-8", errors="replace") as handle:
+        stats = analyze_reconnect_log(handle)
+
+    assert stats.lines == 4
+    assert stats.connect_started == 1
+    assert stats.reconnect_scheduled == 1
+    assert stats.max_attempt == 4
+    assert stats.connected == 1
+
+
+def test_automaton_events_match_substring_events() -> None:
+    pytest.importorskip("ahocorasick")
+    from forex.tools.diagnostics import reconnect_log_analyzer as analyzer
+
+    for line in (
+        "[NETWORK] Disconnected! then Connected!",
+        "Application Authorized! Account authorized!",
+        "runtime_stalled | idle=20s",
+        "nothing to see here",
+    ):
+        assert analyzer._automaton_events(line) == analyzer._substring_events(line)
+
+
+def test_analyze_reconnect_log_takes_attempt_following_reconnect_notice() -> None:
+    stats = analyze_reconnect_log(
+        [
+            "Connection interrupted, reconnecting in 3.0s (attempt 7)",
+            "Connection interrupted, reconnecting in 5.0s (Attempt 12) after attempt 2",
+            "reconnecting in 5.0s (attempt pending)",
+            "attempt 99 failed; reconnecting in 1.0s",
+        ]
+    )
+
+    assert stats.reconnect_scheduled == 3
+    assert stats.max_attempt == 12
+
+
+def test_analyze_reconnect_log_counts_overlapping_event_literals() -> None:
+    stats = analyze_reconnect_log(
+        [
+            "[NETWORK] Disconnected!",
+            "[TIMEOUT] Account funds request timed out or failed (Deferred)",
+        ]
+    )
+
+    assert stats.disconnect_events == 1
+    assert stats.connected == 1
+    assert stats.funds_timeout == 1
+    assert stats.request_deferred == 1
@@ -10,9 +10,16 @@ from forex.tools.rl.run_live_sim import (
     _apply_policy_envelope,
     _build_threshold_bump_array,
     _classify_position_change,
+    _direct_policy_predict,
     _parse_threshold_bump_specs,
     _split_transition_cost,
+    _streak_stats,
+    build_argument_parser,
+    replay_target_positions,
+    resolve_policy_exit_thresholds,
     run_playback,
+    simulate_fixed_position,
+    simulate_fixed_positions,
 )
 
 
@@ -38,6 +45,51 @@ class _DiscreteStubModel:
         return action, None
 
 
+def _obs_policy_actions(batch: np.ndarray) -> np.ndarray:
+    # Go long on a positive feature, but only flip a short once the feature is strong.
+    feature = batch[:, 0]
+    position = batch[:, -1]
+    actions = np.where(feature > np.where(position < 0, 0.5, 0.0), 1.0, -1.0)
+    return actions.astype(np.float32)[:, None]
+
+
+class _ObsPolicy:
+    """Minimal SB3-style policy: batched ``_predict`` over torch observations."""
+
+    class _ActionSpace:
+        shape = (1,)
+        low = np.array([-1.0], dtype=np.float32)
+        high = np.array([1.0], dtype=np.float32)
+
+    action_space = _ActionSpace()
+    device = "cpu"
+    squash_output = False
+
+    def __init__(self, model: _ObsPolicyModel) -> None:
+        self._model = model
+
+    def set_training_mode(self, mode: bool) -> None:
+        pass
+
+    def _predict(self, obs, deterministic: bool = False):
+        import torch
+
+        self._model.calls += 1
+        return torch.as_tensor(_obs_policy_actions(obs.numpy()))
+
+
+class _ObsPolicyModel:
+    """Deterministic policy over observations; ``predict`` takes one, ``policy`` batches."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.policy = _ObsPolicy(self)
+
+    def predict(self, obs, deterministic: bool = True):
+        self.calls += 1
+        return _obs_policy_actions(np.atleast_2d(obs))[0], None
+
+
 def test_split_transition_cost_handles_reversal_and_resize() -> None:
     exit_cost, entry_cost = _split_transition_cost(1.0, -1.0, 0.001)
     assert exit_cost == 0.001
@@ -242,3 +294,205 @@ def test_parse_threshold_bump_specs_and_build_array_for_playback_policy() -> Non
         {"feature": "volatility_regime_z", "min": 0.85, "max": None, "bump": 0.04},
     ]
     assert bumps.tolist() == pytest.approx([0.0, 0.04, 0.04])
+
+
+def test_run_playback_batched_inference_matches_per_bar_predictions() -> None:
+    pytest.importorskip("torch")
+    rng = np.random.default_rng(3)
+    rows = 120
+    features = rng.normal(size=(rows, 2)).astype(np.float32)
+    closes = (100.0 + np.cumsum(rng.normal(size=rows))).astype(np.float32)
+
+    def _bundle(model: _ObsPolicyModel) -> PlaybackBundle:
+        return PlaybackBundle(
+            features=features,
+            closes=closes,
+            timestamps=list(range(rows)),
+            config=TradingConfig(
+                transaction_cost_bps=1.0,
+                slippage_bps=0.5,
+                window_size=3,
+                max_position=1.0,
+            ),
+            model=model,
+        )
+
+    per_bar_model = _ObsPolicyModel()
+    batched_model = _ObsPolicyModel()
+    per_bar = run_playback(_bundle(per_bar_model), quiet=True)
+    batched = run_playback(_bundle(batched_model), quiet=True, inference_batch_size=16)
+
+    assert batched == per_bar
+    assert per_bar_model.calls == per_bar.processed_steps
+    assert batched_model.calls < per_bar_model.calls
+
+
+def test_run_playback_keeps_single_observation_models_per_bar() -> None:
+    actions = [0.5, -0.5, 0.0, 1.0]
+
+    def _bundle() -> PlaybackBundle:
+        return PlaybackBundle(
+            features=np.zeros((5, 1), dtype=np.float32),
+            closes=np.array([100.0, 101.0, 99.0, 100.0, 102.0], dtype=np.float32),
+            timestamps=list(range(5)),
+            config=TradingConfig(transaction_cost_bps=1.0, slippage_bps=0.0),
+            model=_StubModel(actions),
+        )
+
+    per_bar = run_playback(_bundle(), quiet=True)
+    requested_batch = run_playback(_bundle(), quiet=True, inference_batch_size=16)
+
+    assert requested_batch == per_bar
+
+
+def test_simulate_fixed_positions_compounds_each_baseline_in_one_pass() -> None:
+    bundle = PlaybackBundle(
+        features=np.zeros((4, 1), dtype=np.float32),
+        closes=np.array([100.0, 110.0, 99.0, 99.0], dtype=np.float32),
+        timestamps=[0, 1, 2, 3],
+        config=TradingConfig(transaction_cost_bps=10.0, slippage_bps=0.0),
+        model=_StubModel([0.0]),
+    )
+
+    flat, long, short = simulate_fixed_positions(bundle, [0.0, 1.0, -1.0], 0, 3)
+
+    # Bar 0 only pays the 10 bps entry; bars 1-2 earn -10% then 0%.
+    assert flat == 1.0
+    assert long == pytest.approx(0.999 * 0.9)
+    assert short == pytest.approx(0.999 * 1.1)
+    assert simulate_fixed_position(bundle, 1.0, 0, 3) == (long, long - 1.0)
+    assert simulate_fixed_positions(bundle, [1.0], 0, 0).tolist() == [1.0]
+
+
+def test_direct_policy_predict_clips_batched_box_actions() -> None:
+    torch = pytest.importorskip("torch")
+
+    class _Space:
+        shape = (1,)
+        low = np.array([-1.0], dtype=np.float32)
+        high = np.array([1.0], dtype=np.float32)
+
+    class _Policy:
+        action_space = _Space()
+        device = torch.device("cpu")
+        squash_output = False
+
+        def __init__(self) -> None:
+            self.training: bool | None = None
+
+        def set_training_mode(self, mode: bool) -> None:
+            self.training = mode
+
+        def _predict(self, obs, deterministic: bool = False):
+            assert deterministic
+            return obs[:, :1] * 2.0
+
+    class _Model:
+        policy = _Policy()
+
+    forward = _direct_policy_predict(_Model())
+
+    actions = forward(np.array([[0.25, 0.0], [0.9, 1.0]], dtype=np.float32))
+
+    assert _Model.policy.training is False
+    assert actions.tolist() == [[0.5], [1.0]]
+    assert _direct_policy_predict(_StubModel([0.0])) is None
+
+
+def test_streak_stats_counts_longest_win_and_loss_runs() -> None:
+    assert _streak_stats([]) == (0, 0)
+    assert _streak_stats([0.0, 0.0]) == (0, 0)
+    assert _streak_stats([0.1, 0.2, -0.1, 0.3, 0.1, 0.2, 0.0, -0.2, -0.1]) == (3, 2)
+    assert _streak_stats([-0.1, -0.2, -0.3, 0.0, 0.5]) == (1, 3)
+
+
+def test_run_playback_writes_sampled_equity_log(tmp_path) -> None:
+    bundle = PlaybackBundle(
+        features=np.zeros((6, 1), dtype=np.float32),
+        closes=np.array([100.0, 101.0, 102.0, 103.0, 104.0, 105.0], dtype=np.float32),
+        timestamps=list(range(6)),
+        config=TradingConfig(transaction_cost_bps=0.0, slippage_bps=0.0),
+        model=_StubModel([1.0]),
+    )
+    log_path = tmp_path / "logs" / "equity.csv"
+
+    result = run_playback(
+        bundle, quiet=True, equity_log_path=str(log_path), equity_log_every=2
+    )
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "step,equity"
+    assert [line.split(",")[0] for line in lines[1:]] == ["2", "4"]
+    assert all(len(line.split(",")[1].split(".")[1]) == 6 for line in lines[1:])
+    assert result.processed_steps == 5
+
+
+def test_run_playback_polls_should_stop_once_per_block_of_bars() -> None:
+    rows = 2100
+    bundle = PlaybackBundle(
+        features=np.zeros((rows, 1), dtype=np.float32),
+        closes=np.linspace(100.0, 110.0, num=rows, dtype=np.float32),
+        timestamps=list(range(rows)),
+        config=TradingConfig(),
+        model=_StubModel([1.0]),
+    )
+    polls = []
+
+    def _should_stop() -> bool:
+        polls.append(True)
+        return len(polls) == 2
+
+    result = run_playback(bundle, quiet=True, should_stop=_should_stop)
+
+    assert len(polls) == 2
+    assert result.processed_steps == 1024
+
+
+def test_resolve_policy_exit_thresholds_defaults_and_validates() -> None:
+    parser = build_argument_parser()
+
+    args = parser.parse_args(["--data", "x.csv"])
+    assert resolve_policy_exit_thresholds(parser, args) == (None, None)
+
+    args = parser.parse_args(
+        ["--data", "x.csv", "--long-threshold", "0.2", "--short-threshold", "-0.3"]
+    )
+    assert resolve_policy_exit_thresholds(parser, args) == (0.2, -0.3)
+
+    args = parser.parse_args(["--data", "x.csv", "--long-threshold", "0.2"])
+    with pytest.raises(SystemExit):
+        resolve_policy_exit_thresholds(parser, args)
+
+
+def test_replay_target_positions_matches_playback_and_sweeps_costs() -> None:
+    actions = [1.0, 1.0, -1.0, 0.0, -1.0, 1.0, 0.0]
+    bundle = PlaybackBundle(
+        features=np.zeros((8, 1), dtype=np.float32),
+        closes=np.array([100.0, 101.0, 99.5, 98.0, 98.5, 97.0, 99.0, 99.5], dtype=np.float32),
+        timestamps=list(range(8)),
+        config=TradingConfig(transaction_cost_bps=2.0, slippage_bps=1.0, holding_cost_bps=0.5),
+        model=_StubModel(actions),
+    )
+
+    result = run_playback(bundle, quiet=True)
+    curves = replay_target_positions(bundle, [actions, actions], 0, cost_rates=[0.0003, 0.0])
+
+    assert curves.shape == (2, len(actions))
+    assert curves[0, -1] - 1.0 == result.total_return
+    assert curves[1, -1] > curves[0, -1]
+
+
+def test_run_playback_records_scaled_raw_actions() -> None:
+    bundle = PlaybackBundle(
+        features=np.zeros((5, 1), dtype=np.float32),
+        closes=np.array([100.0, 101.0, 102.0, 103.0, 104.0], dtype=np.float32),
+        timestamps=list(range(5)),
+        config=TradingConfig(),
+        model=_StubModel([0.5, -1.0, 0.0, 1.0]),
+        action_scale=0.5,
+    )
+    raw_actions: list[float] = []
+
+    run_playback(bundle, quiet=True, raw_actions_out=raw_actions)
+
+    assert raw_actions == [0.25, -0.5, 0.0, 0.5]
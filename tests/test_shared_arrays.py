@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+
+from forex.utils.shared_arrays import release_shared_arrays, share_array
+
+
+def test_share_array_round_trips_through_a_small_pickled_handle() -> None:
+    features = np.arange(12_000, dtype=np.float32).reshape(4_000, 3)
+    try:
+        handle = share_array(features)
+        assert share_array(features) == handle
+
+        payload = pickle.dumps(handle)
+        assert len(payload) < 1_000
+
+        view, segment = pickle.loads(payload).attach()
+        try:
+            assert view.dtype == np.float32
+            np.testing.assert_array_equal(view, features)
+        finally:
+            del view
+            segment.close()
+    finally:
+        release_shared_arrays()
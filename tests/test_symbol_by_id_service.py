@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from ctrader_open_api.messages.OpenApiModelMessages_pb2 import ProtoOASymbol
+
+from forex.infrastructure.broker.ctrader.services.symbol_by_id_service import SymbolByIdService
+
+
+class _DummyAppAuthService:
+    def add_message_handler(self, _handler) -> None:
+        return None
+
+    def remove_message_handler(self, _handler) -> None:
+        return None
+
+
+def _symbol(symbol_id: int, min_volume: int) -> ProtoOASymbol:
+    symbol = ProtoOASymbol()
+    symbol.symbolId = symbol_id
+    symbol.minVolume = min_volume
+    symbol.lotSize = 10_000_000
+    symbol.digits = 5
+    return symbol
+
+
+def test_parse_symbols_reuses_cached_payload_for_unchanged_symbol() -> None:
+    service = SymbolByIdService(_DummyAppAuthService())
+    first = service._parse_symbols([_symbol(1, 1000)])
+    second = service._parse_symbols([_symbol(1, 1000)])
+    assert first[0] is second[0]
+    assert first[0]["symbol_id"] == 1
+    assert first[0]["min_volume"] == 1000
+    assert first[0]["digits"] == 5
+    assert "volume_step" not in first[0]
+
+
+def test_parse_symbols_rebuilds_payload_when_symbol_changes() -> None:
+    service = SymbolByIdService(_DummyAppAuthService())
+    first = service._parse_symbols([_symbol(1, 1000)])
+    second = service._parse_symbols([_symbol(1, 2000)])
+    assert first[0] is not second[0]
+    assert second[0]["min_volume"] == 2000
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from ctrader_open_api.messages.OpenApiModelMessages_pb2 import ProtoOALightSymbol
+
+from forex.infrastructure.broker.ctrader.services.symbol_list_service import SymbolListService
+
+
+def _light_symbol(symbol_id: int, name: str) -> ProtoOALightSymbol:
+    symbol = ProtoOALightSymbol()
+    symbol.symbolId = symbol_id
+    if name:
+        symbol.symbolName = name
+    return symbol
+
+
+def test_parse_symbols_maps_ids_and_names() -> None:
+    symbols = SymbolListService._parse_symbols(
+        [_light_symbol(1, "EURUSD"), _light_symbol(2, "")]
+    )
+    assert symbols == [
+        {"symbol_id": 1, "symbol_name": "EURUSD"},
+        {"symbol_id": 2, "symbol_name": ""},
+    ]
@@ -62,3 +62,20 @@ def test_trading_config_io_extra_fields_preserved_and_ignored_by_loader(tmp_path
     assert '"timeframe": "M15"' in payload
     loaded = load_trading_config(path)
     assert loaded == config
+
+
+def test_load_trading_config_coerces_values_to_field_types(tmp_path) -> None:
+    path = tmp_path / "ppo.env.json"
+    path.write_text(
+        '{"window_size": "16", "random_start": 0, "reward_scale": "1.5",'
+        ' "reward_mode": "log_return", "discrete_positions": "-1, 0, 1", "unknown": 3}',
+        encoding="utf-8",
+    )
+
+    loaded = load_trading_config(path)
+
+    assert loaded.window_size == 16
+    assert loaded.random_start is False
+    assert loaded.reward_scale == 1.5
+    assert loaded.reward_mode == "log_return"
+    assert loaded.discrete_positions == (-1.0, 0.0, 1.0)
@@ -6,7 +6,11 @@ import pytest
 from forex.ml.rl.envs.trading_env import (
     TradingConfig,
     TradingEnv,
+    apply_risk_engine,
+    build_window_observation,
     compute_drawdown_governor_scale,
+    compute_one_bar_return,
+    compute_one_bar_returns,
     simulate_step_transition,
 )
 
@@ -801,3 +805,50 @@ def test_large_window_and_horizon_config_keep_expected_obs_shape_and_horizon_cap
     expected_horizon_return = (closes[96] - closes[0]) / closes[0]
     assert info["price_return"] == pytest.approx(expected_one_bar_return)
     assert info["reward_return"] == pytest.approx(expected_horizon_return)
+
+
+def test_compute_one_bar_returns_matches_scalar_helper() -> None:
+    closes = np.array([1.0, 1.1, 0.0, 1.2, np.nan, 1.3, 1.25], dtype=np.float32)
+
+    returns = compute_one_bar_returns(closes)
+
+    expected = [compute_one_bar_return(closes, idx) for idx in range(len(closes))]
+    assert np.array_equal(returns, expected, equal_nan=True)
+    assert returns[-1] == 0.0
+    assert compute_one_bar_returns(np.array([], dtype=np.float32)).shape == (0,)
+
+
+def test_build_window_observation_writes_into_reused_buffer() -> None:
+    features = np.arange(12, dtype=np.float64).reshape(4, 3)
+    out = np.full(7, np.nan, dtype=np.float32)
+
+    obs = build_window_observation(
+        features, 0, position=0.5, max_position=2.0, window_size=2, out=out
+    )
+
+    assert obs is out
+    assert obs.tolist() == [0.0, 1.0, 2.0, 0.0, 1.0, 2.0, 0.25]
+    fresh = build_window_observation(features, 3, position=-1.0, max_position=0.0, window_size=2)
+    assert fresh.dtype == np.float32
+    assert fresh.tolist() == [6.0, 7.0, 8.0, 9.0, 10.0, 11.0, -1.0]
+
+
+def test_apply_risk_engine_snaps_to_nearest_discrete_position_with_first_tie() -> None:
+    config = TradingConfig(
+        discretize_actions=True,
+        discrete_positions=(1.0, 0.0, -1.0, 0.5),
+        min_position_change=0.0,
+        position_step=0.0,
+    )
+    closes = np.linspace(1.0, 1.1, num=10, dtype=np.float64)
+    for raw, expected in ((0.8, 1.0), (0.3, 0.5), (0.75, 1.0), (-0.5, 0.0), (-0.9, -1.0)):
+        target, _ = apply_risk_engine(
+            raw,
+            current_position=0.0,
+            config=config,
+            closes=closes,
+            idx=5,
+            equity=1.0,
+            peak_equity=1.0,
+        )
+        assert target == expected
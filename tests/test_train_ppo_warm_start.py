@@ -15,15 +15,35 @@ from forex.tools.rl.train_ppo import (
 )
 
 
-class _StubModel:
-    def __init__(self, actions: list[float]) -> None:
-        self._actions = actions
-        self._idx = 0
+class _FeatureActionPolicy:
+    """Minimal SB3-style policy acting on the first feature of each observation."""
 
-    def predict(self, _obs, deterministic: bool = True):
-        action = self._actions[min(self._idx, len(self._actions) - 1)]
-        self._idx += 1
-        return np.array([action], dtype=np.float32), None
+    class _ActionSpace:
+        shape = (1,)
+        low = np.array([-1.0], dtype=np.float32)
+        high = np.array([1.0], dtype=np.float32)
+
+    action_space = _ActionSpace()
+    device = torch.device("cpu")
+    squash_output = False
+
+    def set_training_mode(self, mode: bool) -> None:
+        pass
+
+    def _predict(self, obs, deterministic: bool = False):
+        return obs[:, :1]
+
+
+class _FeatureActionModel:
+    """Acts on the first feature of each observation; ``policy`` batches observations."""
+
+    def __init__(self) -> None:
+        self.policy = _FeatureActionPolicy()
+
+    def predict(self, obs, deterministic: bool = True):
+        batch = np.atleast_2d(obs)
+        actions = batch[:, :1].astype(np.float32)
+        return (actions if np.ndim(obs) == 2 else actions[0]), None
 
 
 def test_build_warm_start_dataset_balances_directional_and_caps_flat() -> None:
@@ -335,8 +355,52 @@ def test_train_model_passes_policy_log_std_init(monkeypatch: pytest.MonkeyPatch)
     assert captured["policy_kwargs"]["log_std_init"] == pytest.approx(-2.0)
 
 
+def test_train_model_splits_rollout_steps_across_parallel_envs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    captured: dict[str, object] = {}
+
+    class _StubPPO:
+        def __init__(self, policy, env, **kwargs) -> None:
+            captured.update(kwargs)
+            self.device = "cpu"
+
+    monkeypatch.setattr(train_ppo, "PPO", _StubPPO)
+
+    train_ppo._train_model(
+        env=types.SimpleNamespace(num_envs=4),
+        learning_rate=3e-5,
+        n_steps=128,
+        batch_size=64,
+        gamma=0.99,
+        ent_coef=1e-4,
+        gae_lambda=0.95,
+        clip_range=0.2,
+        target_kl=None,
+        vf_coef=0.5,
+        n_epochs=4,
+        total_steps=1000,
+        window_size=1,
+        feature_dim=8,
+        device="cpu",
+        policy_log_std_init=-2.0,
+        verbose=0,
+    )
+
+    assert captured["n_steps"] == 32
+
+
+def test_eval_freq_is_counted_in_vector_steps_across_parallel_envs() -> None:
+    assert train_ppo._eval_freq_in_calls(10_000, 1) == 10_000
+    assert train_ppo._eval_freq_in_calls(10_000, 4) == 2_500
+    assert train_ppo._eval_freq_in_calls(3, 4) == 1
+    assert train_ppo._eval_freq_in_calls(0, 4) == 0
+
+
 def test_profile_policy_activity_reports_raw_deterministic_action_stats() -> None:
+    # The first feature column carries the action the stub policy takes on each bar.
     features = np.zeros((5, 2), dtype=np.float32)
+    features[:4, 0] = [0.0, 0.30, -0.40, 0.10]
     closes = np.asarray([100.0, 101.0, 102.0, 101.0, 100.0], dtype=np.float32)
     config = TradingConfig(
         transaction_cost_bps=0.0,
@@ -350,7 +414,7 @@ def test_profile_policy_activity_reports_raw_deterministic_action_stats() -> Non
     )
 
     profile = _profile_policy_activity(
-        _StubModel([0.0, 0.30, -0.40, 0.10]),
+        _FeatureActionModel(),
         features,
         closes,
         timestamps=[0, 1, 2, 3, 4],
@@ -449,3 +513,23 @@ def test_imitation_rollout_callback_stops_after_max_steps(monkeypatch: pytest.Mo
     callback._on_rollout_end()
 
     assert calls == 0
+
+
+def test_write_sorted_trials_csv_ranks_best_first_and_unscored_last(tmp_path) -> None:
+    trials_path = tmp_path / "trials.csv"
+    trials_path.write_text(
+        "trial,value,state\n0,0.5,COMPLETE\n1,nan,FAIL\n2,1.25,COMPLETE\n3,0.5,COMPLETE\n",
+        encoding="utf-8",
+    )
+
+    sorted_path = train_ppo._write_sorted_trials_csv(trials_path)
+
+    assert sorted_path == tmp_path / "trials.sorted.csv"
+    assert sorted_path.read_text(encoding="utf-8").splitlines() == [
+        "trial,value,state",
+        "2,1.25,COMPLETE",
+        "0,0.5,COMPLETE",
+        "3,0.5,COMPLETE",
+        "1,nan,FAIL",
+    ]
+    assert trials_path.read_text(encoding="utf-8").splitlines()[1] == "0,0.5,COMPLETE"
@@ -1,15 +1,49 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from ctrader_open_api import Protobuf
+from ctrader_open_api.messages.OpenApiCommonMessages_pb2 import ProtoMessage
+from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOAGetTrendbarsRes
+from ctrader_open_api.messages.OpenApiModelMessages_pb2 import ProtoOATrendbar
+from twisted.internet.defer import Deferred
+
+from forex.infrastructure.broker.ctrader.services import trendbar_history_service
 from forex.infrastructure.broker.ctrader.services.trendbar_history_service import (
     TrendbarHistoryService,
+    _format_utc_minutes,
 )
 
 
 class _DummyClient:
-    def send(self, _message):
+    def __init__(self) -> None:
+        self.sent: list[tuple[int, int]] = []
+        self.messages: list = []
+        self.responses: list[tuple[str | None, Deferred]] = []
+
+    def send(self, message, clientMsgId=None, **_kwargs):
+        self.sent.append((message.fromTimestamp, message.toTimestamp))
+        self.messages.append(message)
+        response = Deferred()
+        self.responses.append((clientMsgId, response))
+        return response
+
+
+class _DummyCall:
+    def cancel(self) -> None:
         return None
 
 
+class _DummyReactorManager:
+    def __init__(self) -> None:
+        self.scheduled: list[float] = []
+
+    def call_later(self, delay, _callback, *_args):
+        self.scheduled.append(delay)
+        return _DummyCall()
+
+
 class _DummyAppAuthService:
     def __init__(self) -> None:
         self._client = _DummyClient()
@@ -40,7 +74,8 @@ def test_default_window_respects_m5_timeframe() -> None:
     assert service._pending_request.count == 50
 
 
-def test_explicit_time_range_keeps_window_mode() -> None:
+def test_explicit_time_range_keeps_window_mode(monkeypatch) -> None:
+    monkeypatch.setattr(trendbar_history_service, "reactor_manager", _DummyReactorManager())
     service = TrendbarHistoryService(_DummyAppAuthService())
     service.fetch(
         account_id=1,
@@ -58,3 +93,216 @@ def test_minimum_useful_bar_count_has_live_feature_floor() -> None:
     service = TrendbarHistoryService(_DummyAppAuthService())
     service._last_request_count = 220
     assert service._minimum_useful_bar_count() == 64
+
+
+def _trendbar(index: int) -> ProtoOATrendbar:
+    bar = ProtoOATrendbar()
+    bar.low = 108_000 + index
+    bar.deltaOpen = 7
+    bar.deltaHigh = 15
+    bar.deltaClose = 3
+    bar.utcTimestampInMinutes = 28_000_000 + index * 5
+    bar.volume = 100 + index
+    bar.period = 5
+    return bar
+
+
+def test_bars_to_rows_matches_per_bar_conversion() -> None:
+    service = TrendbarHistoryService(_DummyAppAuthService())
+    bars = [_trendbar(index) for index in range(service._VECTORIZE_MIN_BARS + 1)]
+    expected = [service._to_row(bar) for bar in bars]
+    assert service._bars_to_rows(bars) == expected
+    assert service._bars_to_rows(bars[:2]) == expected[:2]
+
+
+def test_format_utc_minutes_matches_strftime() -> None:
+    for ts_minutes in (0, 1_439, 28_000_003, 29_500_000):
+        expected = datetime.fromtimestamp(ts_minutes * 60, tz=timezone.utc).strftime(
+            "%Y-%m-%d %H:%M"
+        )
+        assert _format_utc_minutes(ts_minutes) == expected
+
+
+def test_build_ranges_splits_window_into_count_sized_chunks() -> None:
+    service = TrendbarHistoryService(_DummyAppAuthService())
+    service._set_period(service._resolve_period("M5"))
+    service._build_ranges(10, 0, 7_000_000)
+    assert list(service._request_ranges) == [
+        (0, 0, 3_000_000),
+        (1, 3_000_000, 6_000_000),
+        (2, 6_000_000, 7_000_000),
+    ]
+
+
+def _trendbars_reply(client_msg_id: str | None, bars) -> ProtoMessage:
+    response = ProtoOAGetTrendbarsRes(
+        ctidTraderAccountId=1, period=5, symbolId=1, timestamp=0, trendbar=bars
+    )
+    return ProtoMessage(
+        payloadType=response.payloadType,
+        payload=response.SerializeToString(),
+        clientMsgId=client_msg_id,
+    )
+
+
+def _range_service(monkeypatch, ranges: int):
+    monkeypatch.setattr(trendbar_history_service, "reactor_manager", _DummyReactorManager())
+    app_auth = _DummyAppAuthService()
+    service = TrendbarHistoryService(app_auth)
+    service._min_request_interval = 0.0
+    service._retried_wide = True
+    service._retried_m1 = True
+    chunks: list[list] = []
+    service.set_callbacks(on_history_chunk=chunks.append)
+    start = 28_000_000 * 60_000
+    service.fetch(
+        account_id=1,
+        symbol_id=1,
+        count=10,
+        timeframe="M5",
+        from_ts=start,
+        to_ts=start + ranges * 3_000_000,
+    )
+    # fetch resets the retry flags; keep the tests on the plain completion path.
+    service._retried_wide = True
+    service._retried_m1 = True
+    return service, app_auth._client, chunks
+
+
+def _range_bars(range_index: int, count: int = 3) -> list[ProtoOATrendbar]:
+    return [_trendbar(range_index * 10 + offset) for offset in range(count)]
+
+
+def test_range_backfill_keeps_requests_in_flight(monkeypatch) -> None:
+    service, client, _chunks = _range_service(monkeypatch, ranges=6)
+    assert len(client.sent) == service._MAX_INFLIGHT_RANGES
+    assert len(service._request_ranges) == 2
+    # Every outstanding request is its own message with its own id.
+    assert len({id(message) for message in client.messages}) == len(client.messages)
+    assert len({msg_id for msg_id, _ in client.responses}) == len(client.responses)
+
+    msg_id, response = client.responses[1]
+    response.callback(_trendbars_reply(msg_id, _range_bars(1)))
+
+    assert service._completed_ranges == 1
+    assert len(client.sent) == service._MAX_INFLIGHT_RANGES + 1
+    assert sorted(rng[1:] for rng in service._inflight_ranges.values()) == sorted(
+        [client.sent[0], *client.sent[2:]]
+    )
+
+
+def test_range_backfill_emits_ranges_in_order_when_replies_are_not(monkeypatch) -> None:
+    service, client, chunks = _range_service(monkeypatch, ranges=3)
+    received: list = []
+    service._callbacks.on_history_received = received.append
+
+    for range_index in (2, 0, 1):
+        msg_id, response = client.responses[range_index]
+        bars = _range_bars(range_index) if range_index != 0 else []
+        response.callback(_trendbars_reply(msg_id, bars))
+        if range_index == 2:
+            assert chunks == []
+
+    assert [[row.utc_timestamp_minutes for row in chunk] for chunk in chunks] == [
+        [bar.utcTimestampInMinutes for bar in _range_bars(1)],
+        [bar.utcTimestampInMinutes for bar in _range_bars(2)],
+    ]
+    assert received == [None]
+    assert not service._in_progress
+
+
+def test_range_backfill_pages_a_range_while_others_are_outstanding(monkeypatch) -> None:
+    service, client, chunks = _range_service(monkeypatch, ranges=3)
+    range_start = service._range_starts[2]
+    paged_id, response = client.responses[2]
+    extract = Protobuf.extract
+
+    def _extract_with_more(message):
+        payload = extract(message)
+        return SimpleNamespace(trendbar=payload.trendbar, hasMore=message.clientMsgId == paged_id)
+
+    # The bundled protobuf predates hasMore, so the paged reply is flagged here.
+    monkeypatch.setattr(Protobuf, "extract", _extract_with_more)
+    newest = [_trendbar(25), _trendbar(26)]
+    response.callback(_trendbars_reply(paged_id, newest))
+
+    assert client.sent[-1] == (range_start, newest[0].utcTimestampInMinutes * 60_000)
+    msg_id, response = client.responses[-1]
+    response.callback(_trendbars_reply(msg_id, [_trendbar(24)]))
+    for range_index in (0, 1):
+        msg_id, response = client.responses[range_index]
+        response.callback(_trendbars_reply(msg_id, _range_bars(range_index)))
+
+    assert [row.utc_timestamp_minutes for row in chunks[-1]] == [
+        _trendbar(offset).utcTimestampInMinutes for offset in (24, 25, 26)
+    ]
+
+
+def test_range_backfill_resends_a_range_whose_reply_timed_out(monkeypatch) -> None:
+    service, client, _chunks = _range_service(monkeypatch, ranges=2)
+    msg_id, response = client.responses[0]
+
+    response.callback(None)
+
+    assert client.sent[-1] == client.sent[0]
+    assert len(service._inflight_ranges) == 2
+    # A late reply to the abandoned request is no longer matched to any range.
+    service._on_range_response(_trendbars_reply(msg_id, _range_bars(0)), msg_id)
+    assert service._completed_ranges == 0
+
+
+def test_range_backfill_ignores_replies_seen_by_the_message_handler(monkeypatch) -> None:
+    service, client, _chunks = _range_service(monkeypatch, ranges=2)
+    msg_id, _response = client.responses[0]
+    reply = Protobuf.extract(_trendbars_reply(msg_id, _range_bars(0)))
+
+    assert service._handle_message(client, reply)
+    assert service._completed_ranges == 0
+
+
+def test_range_backfill_stops_emitting_once_the_chunk_consumer_cancels(monkeypatch) -> None:
+    service, client, chunks = _range_service(monkeypatch, ranges=2)
+    received: list = []
+    service._callbacks.on_history_received = received.append
+
+    def _fail_and_cancel(rows) -> None:
+        chunks.append(rows)
+        service.cancel()
+
+    service._callbacks.on_history_chunk = _fail_and_cancel
+    for range_index in (1, 0):
+        msg_id, response = client.responses[range_index]
+        response.callback(_trendbars_reply(msg_id, _range_bars(range_index)))
+
+    assert len(chunks) == 1
+    assert received == []
+    assert not service._in_progress
+
+
+def test_range_request_ids_are_unique_across_services(monkeypatch) -> None:
+    _first, first_client, _chunks = _range_service(monkeypatch, ranges=2)
+    _second, second_client, _chunks = _range_service(monkeypatch, ranges=2)
+
+    ids = [msg_id for msg_id, _ in first_client.responses + second_client.responses]
+    assert len(set(ids)) == len(ids)
+
+
+def test_range_backfill_gives_up_after_repeated_timeouts(monkeypatch) -> None:
+    service, client, _chunks = _range_service(monkeypatch, ranges=2)
+    errors: list[str] = []
+    service._callbacks.on_error = errors.append
+    _msg_id, response = client.responses[0]
+
+    for _ in range(service._MAX_RANGE_RETRIES):
+        response.callback(None)
+        assert service._in_progress
+        _msg_id, response = client.responses[-1]
+        assert client.sent[-1] == client.sent[0]
+    response.callback(None)
+
+    assert not service._in_progress
+    assert len(errors) == 1
+    assert f"after {service._MAX_RANGE_RETRIES} retries" in errors[0]
+    sent = len(client.sent)
+    service._on_range_response(None, client.responses[1][0])
+    assert len(client.sent) == sent
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from ctrader_open_api.messages.OpenApiModelMessages_pb2 import (
+    ProtoOAPayloadType,
+    ProtoOATrendbar,
+    ProtoOATrendbarPeriod,
+)
+
+from forex.domain.market_data import LiveTrendbar
+from forex.infrastructure.broker.ctrader.services import trendbar_service
+from forex.infrastructure.broker.ctrader.services.trendbar_service import TrendbarService
+
+
+class _DummyAppAuthService:
+    def add_message_handler(self, _handler) -> None:
+        return None
+
+    def remove_message_handler(self, _handler) -> None:
+        return None
+
+
+def test_format_bucket_text_matches_strftime_across_buckets() -> None:
+    service = TrendbarService(_DummyAppAuthService())
+    for ts_minutes in (0, 28_000_003, 28_000_003, 28_000_004, 1_439):
+        expected = datetime.fromtimestamp(ts_minutes * 60, tz=timezone.utc).strftime("%H:%M")
+        assert service._format_bucket_text(ts_minutes) == expected
+
+
+def _spot(price: int, spot_ts_ms: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        ctidTraderAccountId=1,
+        symbolId=7,
+        bid=price,
+        ask=price,
+        hasBid=True,
+        hasAsk=True,
+        spotTimestamp=spot_ts_ms,
+        trendbar=[],
+    )
+
+
+def test_spot_updates_publish_fresh_snapshots() -> None:
+    service = TrendbarService(_DummyAppAuthService())
+    service._account_id = 1
+    service._symbol_id = 7
+    published: list[LiveTrendbar] = []
+    service.set_callbacks(on_trendbar=published.append)
+
+    bucket_ms = 28_000_000 * 60_000
+    service._on_spot_event(_spot(110, bucket_ms))
+    service._on_spot_event(_spot(130, bucket_ms + 1_000))
+    service._on_spot_event(_spot(100, bucket_ms + 2_000))
+
+    assert [bar.close for bar in published] == [110.0, 130.0, 100.0]
+    assert published[0].high == 110.0
+    assert (published[-1].high, published[-1].low) == (130.0, 100.0)
+    assert published[-1].utc_timestamp_minutes == 28_000_000
+    assert published[-1] is service._last_bar
+
+
+def test_resolve_period_defaults_unknown_timeframes_to_m1() -> None:
+    assert TrendbarService._resolve_period("h4") == ("H4", ProtoOATrendbarPeriod.H4, 240)
+    assert TrendbarService._resolve_period("X7") == ("M1", ProtoOATrendbarPeriod.M1, 1)
+
+
+def test_normalize_timestamp_seconds_handles_each_unit() -> None:
+    seconds = 1_700_000_000
+    for scale in (1, 10**3, 10**6, 10**9):
+        assert TrendbarService._normalize_timestamp_seconds(seconds * scale) == seconds
+
+
+def test_spot_events_for_other_symbols_are_ignored() -> None:
+    service = TrendbarService(_DummyAppAuthService())
+    service._account_id = 1
+    service._symbol_id = 8
+    published: list[LiveTrendbar] = []
+    service.set_callbacks(on_trendbar=published.append)
+
+    service._on_spot_event(_spot(110, 28_000_000 * 60_000))
+
+    assert published == []
+    assert service._last_bar is None
+
+
+def test_extract_price_uses_available_sides() -> None:
+    both = SimpleNamespace(bid=100, ask=103, hasBid=True, hasAsk=True)
+    bid_only = SimpleNamespace(bid=100, ask=103, hasBid=True, hasAsk=False)
+    ask_only = SimpleNamespace(bid=0, ask=103)
+    assert TrendbarService._extract_price(both) == 101.5
+    assert TrendbarService._extract_price(bid_only) == 100.0
+    assert TrendbarService._extract_price(ask_only) == 103.0
+    assert TrendbarService._extract_price(SimpleNamespace()) is None
+
+
+def test_seed_from_trendbar_decodes_prices() -> None:
+    service = TrendbarService(_DummyAppAuthService())
+    bar = ProtoOATrendbar()
+    bar.low = 108_000
+    bar.deltaOpen = 7
+    bar.deltaHigh = 15
+    bar.deltaClose = 3
+    bar.utcTimestampInMinutes = 28_000_000
+    bar.period = ProtoOATrendbarPeriod.M1
+
+    service._seed_from_trendbar(bar, 7)
+
+    seeded = service._last_bar
+    assert (seeded.open, seeded.high, seeded.low, seeded.close) == (
+        108_007 / 100000.0,
+        108_015 / 100000.0,
+        108_000 / 100000.0,
+        108_003 / 100000.0,
+    )
+    assert seeded.utc_timestamp_minutes == 28_000_000
+
+
+class _DummyReactorManager:
+    def __init__(self) -> None:
+        self.scheduled: list[tuple] = []
+
+    def call_later(self, delay, callback, *args):
+        self.scheduled.append((delay, callback, args))
+        return SimpleNamespace(cancel=lambda: None)
+
+
+def test_close_only_updates_are_coalesced_until_flush(monkeypatch) -> None:
+    reactor = _DummyReactorManager()
+    monkeypatch.setattr(trendbar_service, "reactor_manager", reactor)
+    service = TrendbarService(_DummyAppAuthService())
+    service._account_id = 1
+    service._symbol_id = 7
+    service._in_progress = True
+    published: list[LiveTrendbar] = []
+    service.set_callbacks(on_trendbar=published.append)
+
+    bucket_ms = 28_000_000 * 60_000
+    for offset, price in enumerate((110, 130, 120, 125)):
+        service._on_spot_event(_spot(price, bucket_ms + offset * 1_000))
+
+    assert [bar.close for bar in published] == [110.0, 130.0]
+    assert len(reactor.scheduled) == 1
+    _delay, flush, args = reactor.scheduled[0]
+    flush(*args)
+    assert published[-1].close == 125.0
+
+    service._last_emit_ts = 0.0
+    service._on_spot_event(_spot(121, bucket_ms + 5_000))
+    assert published[-1].close == 121.0
+
+
+def test_log_history_replays_only_into_a_log_sink() -> None:
+    service = TrendbarService(_DummyAppAuthService())
+    service._log("first")
+    service.set_callbacks(on_trendbar=lambda _bar: None)
+    replayed: list[str] = []
+    service.set_callbacks(on_log=replayed.append)
+    assert replayed == ["first"]
+
+
+def test_handle_message_routes_spot_events_while_subscribed() -> None:
+    service = TrendbarService(_DummyAppAuthService())
+    service._account_id = 1
+    service._symbol_id = 7
+    published: list[LiveTrendbar] = []
+    service.set_callbacks(on_trendbar=published.append)
+    spot = _spot(110, 28_000_000 * 60_000)
+    spot.payloadType = ProtoOAPayloadType.PROTO_OA_SPOT_EVENT
+
+    assert service._handle_message(None, spot) is False
+    service._in_progress = True
+    assert service._handle_message(None, spot) is True
+    assert service._handle_message(None, SimpleNamespace(payloadType=-1)) is False
+    assert [bar.close for bar in published] == [110.0]
+
+
+def test_seed_from_unchanged_trendbar_keeps_snapshot() -> None:
+    service = TrendbarService(_DummyAppAuthService())
+    bar = ProtoOATrendbar()
+    bar.low = 108_000
+    bar.deltaHigh = 15
+    bar.utcTimestampInMinutes = 28_000_000
+
+    service._seed_from_trendbar(bar, 7)
+    first = service._last_bar
+    service._seed_from_trendbar(bar, 7)
+    assert service._last_bar is first
+
+    bar.deltaClose = 4
+    service._seed_from_trendbar(bar, 7)
+    assert service._last_bar is not first
+    assert service._last_bar.close == 108_004 / 100000.0